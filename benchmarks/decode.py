@@ -0,0 +1,64 @@
+"""
+Сравнение декодирования ответов: `response.json()` + `model_validate` против `model_validate_json`.
+
+Запуск: `python -m benchmarks.decode`
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from helpdesk_client.v3.schemas.response import (
+    CategoryPaginationResponseSchema,
+    MainRequestSchema,
+    MainResolutionSchema,
+    RequestPaginationResponseSchema,
+)
+from pydantic import BaseModel
+
+from benchmarks import payloads
+
+CASES: list[tuple[str, type[BaseModel], dict[str, Any]]] = [
+    ("MainRequestSchema", MainRequestSchema, {"request": payloads.request(1)}),
+    (
+        "RequestPaginationResponseSchema[100]",
+        RequestPaginationResponseSchema,
+        payloads.request_page(row_count=100),
+    ),
+    (
+        "CategoryPaginationResponseSchema[100]",
+        CategoryPaginationResponseSchema,
+        payloads.category_page(row_count=100),
+    ),
+    (
+        "MainResolutionSchema",
+        MainResolutionSchema,
+        {"resolution": payloads.resolution()},
+    ),
+]
+
+
+def _best(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def _loads_and_validate(schema: type[BaseModel], content: bytes) -> BaseModel:
+    return schema.model_validate(json.loads(content))
+
+
+def main() -> None:
+    print(
+        f"{'schema':<40}{'json+validate, µs':>20}{'validate_json, µs':>20}{'speedup':>10}",
+    )
+    for name, schema, payload in CASES:
+        content = payloads.dumps(payload)
+        number = max(10, 20_000 // len(content) * 10)
+        old = _best(partial(_loads_and_validate, schema, content), number)
+        new = _best(partial(schema.model_validate_json, content), number)
+        print(f"{name:<40}{old * 1e6:>20.1f}{new * 1e6:>20.1f}{old / new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Генераторы реалистичных ответов ServiceDesk Plus v3 для бенчмарков"""
+
+from typing import Any
+
+import orjson
+
+_EPOCH_MS = 1_700_000_000_000
+
+_DESCRIPTION = (
+    "<div><p>Добрый день! Не работает печать на принтере в кабинете 305.</p>"
+    "<table><tr><td>Инв. номер</td><td>PR-0042</td></tr>"
+    "<tr><td>Модель</td><td>HP LaserJet</td></tr></table>"
+    "<p>Ошибка:&nbsp;<b>paper jam</b>, перезагрузка не помогает.</p></div>"
+) * 8
+
+
+def datetime_(offset: int) -> dict[str, Any]:
+    return {
+        "display_value": "14/11/2023 10:13 PM",
+        "value": str(_EPOCH_MS + offset * 60_000),
+    }
+
+
+def requester(ident: int) -> dict[str, Any]:
+    return {
+        "id": ident,
+        "name": f"Иванов Иван {ident}",
+        "email_id": f"user{ident}@example.com",
+        "phone": "+7 900 000-00-00",
+    }
+
+
+def attachment(ident: int) -> dict[str, Any]:
+    return {
+        "id": ident,
+        "name": f"log-{ident}.zip",
+        "content_url": f"/api/v3/requests/{ident}/attachments/{ident}/download",
+        "attached_by": requester(ident),
+        "content_type": "application/zip",
+        "attached_on": datetime_(ident),
+        "size": {"display_value": "1.2 MB", "value": 1_258_291},
+    }
+
+
+def request(ident: int) -> dict[str, Any]:
+    return {
+        "id": ident,
+        "subject": f"Не работает принтер #{ident}",
+        "description": _DESCRIPTION,
+        "created_time": datetime_(ident),
+        "due_by_time": datetime_(ident + 480),
+        "completed_time": None,
+        "last_updated_time": datetime_(ident + 5),
+        "group": {"name": "Первая линия"},
+        "status": {"name": "Открыта"},
+        "requester": requester(ident),
+        "technician": requester(ident + 1),
+        "attachments": [attachment(ident)],
+        "urgency": {"id": 1, "name": "Высокая"},
+    }
+
+
+def request_page(row_count: int = 100, page: int = 1) -> dict[str, Any]:
+    first = (page - 1) * row_count
+    return {
+        "requests": [request(ident) for ident in range(first, first + row_count)],
+        "list_info": {
+            "page": page,
+            "row_count": row_count,
+            "has_more_rows": True,
+            "get_total_count": False,
+        },
+    }
+
+
+def category_page(row_count: int = 100, start_index: int = 1) -> dict[str, Any]:
+    return {
+        "categories": [
+            {
+                "id": ident,
+                "name": f"Категория {ident}",
+                "description": "Описание категории",
+                "deleted": False,
+            }
+            for ident in range(start_index, start_index + row_count)
+        ],
+        "list_info": {
+            "row_count": row_count,
+            "start_index": start_index,
+            "has_more_rows": False,
+        },
+    }
+
+
+def note(ident: int) -> dict[str, Any]:
+    return {
+        "id": ident,
+        "description": _DESCRIPTION,
+        "added_by": requester(ident),
+        "added_time": datetime_(ident),
+        "show_to_requester": True,
+    }
+
+
+def resolution(ident: int = 1) -> dict[str, Any]:
+    return {
+        "content": _DESCRIPTION + '<img src="/api/v3/requests/1/inline/1.png">',
+        "resolution_attachments": [attachment(ident)],
+        "submitted_by": requester(ident),
+        "submitted_on": datetime_(ident),
+    }
+
+
+def resolution_html(rows: int) -> str:
+    """Решение с таблицей, вставленной из Excel: стили на каждой ячейке, сущности и изображение"""
+
+    cell = (
+        '<td style="border: 1px solid #000; padding: 2px 4px; font-family: Calibri;">'
+        "{}</td>"
+    )
+    row = "<tr>" + cell * 4 + "</tr>"
+    body = "".join(
+        row.format(
+            index,
+            f"PR-{index:04d}",
+            "Замена&nbsp;картриджа",
+            "&laquo;Выполнено&raquo;",
+        )
+        for index in range(rows)
+    )
+    return (
+        "<div><p>Работы выполнены, отчет в таблице:</p>"
+        f'<table style="border-collapse: collapse;"><tbody>{body}</tbody></table>'
+        '<img src="/api/v3/requests/1/inline/1.png"></div>'
+    )
+
+
+def dumps(payload: dict[str, Any]) -> bytes:
+    return orjson.dumps(payload)
@@ -0,0 +1,59 @@
+"""
+Сравнение валидированного пути (`model_validate_json`) и сырого (`orjson.loads`) для списков.
+
+Запуск: `python -m benchmarks.raw`
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import orjson
+from helpdesk_client.v3.schemas.response import (
+    CategoryPaginationResponseSchema,
+    RequestListSchema,
+    RequestPaginationResponseSchema,
+)
+from pydantic import BaseModel
+
+from benchmarks import payloads
+
+CASES: list[tuple[str, type[BaseModel], dict[str, Any]]] = [
+    (
+        "get_requests[100]",
+        RequestListSchema,
+        {"requests": payloads.request_page(row_count=100)["requests"]},
+    ),
+    (
+        "get_requests_page_paginated[100]",
+        RequestPaginationResponseSchema,
+        payloads.request_page(row_count=100),
+    ),
+    (
+        "get_categories[100]",
+        CategoryPaginationResponseSchema,
+        payloads.category_page(row_count=100),
+    ),
+]
+
+
+def _best(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{'method':<40}{'validated, µs':>16}{'raw, µs':>12}{'speedup':>10}")
+    for name, schema, payload in CASES:
+        content = payloads.dumps(payload)
+        number = max(10, 20_000 // len(content) * 10)
+        validated = _best(partial(schema.model_validate_json, content), number)
+        raw = _best(partial(orjson.loads, content), number)
+        print(
+            f"{name:<40}{validated * 1e6:>16.1f}{raw * 1e6:>12.1f}"
+            f"{validated / raw:>9.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""In-process заглушка эндпоинтов ServiceDesk Plus v3 для `httpx.MockTransport`"""
+
+import re
+from typing import Any
+
+import httpx
+
+from benchmarks import payloads
+
+ATTACHMENT_SIZE = payloads.attachment(1)["size"]["value"]
+PAGE_SIZE = 100
+
+_SUCCESS = {"response_status": {"status_code": 2000, "status": "success"}}
+
+
+def _body(payload: dict[str, Any]) -> bytes:
+    return payloads.dumps({**_SUCCESS, **payload})
+
+
+class ServiceDeskStub:
+    """
+    Отвечает заранее сериализованными телами, чтобы время заглушки не попадало в замеры клиента.
+
+    Тела загружаемых файлов вычитываются полностью, как это делал бы сервер.
+    """
+
+    def __init__(self) -> None:
+        self.bodies: dict[str, bytes] = {
+            "request": _body({"request": payloads.request(1)}),
+            "request_page": _body(payloads.request_page(row_count=PAGE_SIZE)),
+            "note": _body({"note": payloads.note(1)}),
+            "attachment": _body({"attachment": payloads.attachment(1)}),
+            "download": bytes(ATTACHMENT_SIZE),
+        }
+        self._routes: list[tuple[str, re.Pattern[str], str]] = [
+            ("GET", re.compile(r"/api/v3/requests/\d+$"), "request"),
+            ("GET", re.compile(r"/api/v3/requests$"), "request_page"),
+            ("POST", re.compile(r"/api/v3/requests$"), "request"),
+            ("POST", re.compile(r"/api/v3/requests/\d+/notes$"), "note"),
+            ("PUT", re.compile(r"/api/v3/requests/\d+/upload$"), "attachment"),
+            (
+                "PUT",
+                re.compile(r"/api/v3/requests/\d+/notes/\d+/upload$"),
+                "attachment",
+            ),
+            (
+                "GET",
+                re.compile(r"/api/v3/requests/\d+/attachments/\d+/download$"),
+                "download",
+            ),
+        ]
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        for method, path, body in self._routes:
+            if request.method == method and path.match(request.url.path):
+                return httpx.Response(200, content=self.bodies[body])
+
+        return httpx.Response(404)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
@@ -0,0 +1,49 @@
+"""
+Стоимость валидации `MainResolutionSchema` с ленивым `ResolutionSchema.content`
+и с удалением HTML-тегов при первом обращении к нему.
+
+Запуск: `python -m benchmarks.strip_html`
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from helpdesk_client.v3.schemas.response import MainResolutionSchema
+
+from benchmarks import payloads
+
+ROWS = (10, 1_000, 5_000)
+
+
+def _best(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def _validate_with_content(content: bytes) -> str:
+    return MainResolutionSchema.model_validate_json(content).resolution.content
+
+
+def _validate() -> None:
+    print(f"{'html, KB':<12}{'validate, ms':>14}{'validate + content, ms':>24}")
+    for rows in ROWS:
+        resolution = payloads.resolution()
+        resolution["content"] = payloads.resolution_html(rows)
+        content = payloads.dumps({"resolution": resolution})
+        number = max(3, 2_000_000 // len(content))
+        validate = _best(
+            partial(MainResolutionSchema.model_validate_json, content),
+            number,
+        )
+        with_content = _best(partial(_validate_with_content, content), number)
+        print(
+            f"{len(content) // 1024:<12}{validate * 1e3:>14.2f}{with_content * 1e3:>24.2f}",
+        )
+
+
+def main() -> None:
+    _validate()
+
+
+if __name__ == "__main__":
+    main()
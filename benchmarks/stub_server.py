@@ -0,0 +1,122 @@
+"""Локальный HTTP/1.1-сервер с ответами ServiceDesk Plus v3 для бенчмарков"""
+
+import multiprocessing
+import re
+import socket
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from multiprocessing.sharedctypes import Synchronized
+
+from benchmarks import payloads
+
+_REQUEST_PATH = re.compile(r"/api/v3/requests/(\d+)$")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        handshake_delay: float,
+        connections: "Synchronized[int]",
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.handshake_delay = handshake_delay
+        self.connections = connections
+
+    def get_request(self) -> tuple[socket.socket, object]:
+        with self.connections.get_lock():
+            self.connections.value += 1
+
+        return super().get_request()
+
+
+class StubServer:
+    """
+    Сервер, запущенный в отдельном процессе.
+
+    Потоки обработки соединений не конкурируют за GIL с измеряемым клиентом.
+    """
+
+    def __init__(self, port: int, connections: "Synchronized[int]") -> None:
+        self.base_url = f"http://127.0.0.1:{port}/"
+        self._connections = connections
+
+    @property
+    def connections(self) -> int:
+        """Количество принятых соединений"""
+
+        return self._connections.value
+
+    @connections.setter
+    def connections(self, value: int) -> None:
+        self._connections.value = value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        # Имитация TLS-рукопожатия: задержка на каждое новое соединение
+        time.sleep(self.server.handshake_delay)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        match = _REQUEST_PATH.search(self.path.split("?")[0])
+        if match is None:
+            self.send_error(404)
+            return
+
+        body = payloads.dumps(
+            {
+                "response_status": {"status_code": 2000, "status": "success"},
+                "request": payloads.request(int(match.group(1))),
+            },
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _serve(
+    handshake_delay: float,
+    connections: "Synchronized[int]",
+    ports: Connection,
+) -> None:
+    server = _Server(handshake_delay=handshake_delay, connections=connections)
+    ports.send(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def run_stub_server(handshake_delay: float = 0.0) -> Iterator[StubServer]:
+    context = multiprocessing.get_context("spawn")
+    connections = context.Value("q", 0)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_serve,
+        args=(handshake_delay, connections, sender),
+        daemon=True,
+    )
+    process.start()
+    try:
+        yield StubServer(port=receiver.recv(), connections=connections)
+    finally:
+        process.terminate()
+        process.join()
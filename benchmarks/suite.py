@@ -0,0 +1,315 @@
+"""
+Бенчмарк методов `HelpdeskClient` против in-process заглушки ServiceDesk Plus v3.
+
+Для каждого метода измеряются:
+- пропускная способность при `--concurrency` одновременных вызовах (лучший из `--rounds` замеров);
+- p50/p99 задержки последовательных вызовов по всем замерам;
+- процессорное время вызова (лучший из замеров) с разбивкой: разбор JSON (`orjson.loads` тела ответа),
+  валидация pydantic (`model_validate_json` за вычетом разбора JSON) и остальное - HTTP
+  (httpx, формирование запроса, multipart).
+
+Результаты сохраняются в `benchmarks/results/<время>.json` и сравниваются с предыдущим запуском
+(или с `--baseline`). Код возврата 1, если пропускная способность или процессорное время хуже
+на `--threshold`. p99 выводится для сведения: на коротких замерах он слишком шумный.
+Сравнивать имеет смысл только запуски на одной и той же машине.
+
+Запуск: `python -m benchmarks.suite`
+"""
+
+import argparse
+import asyncio
+import platform
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+import pydantic
+from helpdesk_client.v3 import HelpdeskClient, UploadFileDTO
+from helpdesk_client.v3.schemas import (
+    IdentSchema,
+    MainNoteSchema,
+    MainRequestAttachmentSchema,
+    MainRequestSchema,
+    NoteCreateSchema,
+    RequestCreateSchema,
+    RequestFilterPagePaginationParams,
+    RequestPaginationResponseSchema,
+    ShortRequesterSchema,
+)
+from pydantic import BaseModel
+
+from benchmarks import payloads
+from benchmarks.servicedesk_stub import ATTACHMENT_SIZE, PAGE_SIZE, ServiceDeskStub
+
+RESULTS_DIR = Path(__file__).parent / "results"
+UPLOAD_SIZE = 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    name: str
+    call: Callable[[HelpdeskClient, int], Awaitable[object]]
+    body: str
+    """Ключ тела ответа в `ServiceDeskStub.bodies`"""
+
+    schema: type[BaseModel] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CaseResult:
+    calls_per_second: float
+    p50_ms: float
+    p99_ms: float
+    cpu_us: float
+    http_us: float
+    json_us: float
+    validation_us: float
+
+
+async def _upload_source() -> AsyncIterator[bytes]:
+    chunk = bytes(UPLOAD_CHUNK_SIZE)
+    for _ in range(UPLOAD_SIZE // UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _upload_dto() -> UploadFileDTO:
+    return UploadFileDTO(
+        file=_upload_source(),
+        filename="log.zip",
+        content_type="application/zip",
+        size=UPLOAD_SIZE,
+    )
+
+
+_PAGE_FILTER = RequestFilterPagePaginationParams(page=1, page_size=PAGE_SIZE)
+_CREATE_SCHEMA = RequestCreateSchema(
+    subject="Не работает принтер",
+    description=payloads.request(1)["description"],
+    requester=ShortRequesterSchema(id=1),
+    urgency=IdentSchema(id=1),
+)
+_NOTE_SCHEMA = NoteCreateSchema(
+    description=payloads.note(1)["description"],
+    show_to_requester=True,
+    mark_first_response=False,
+    add_to_linked_requests=False,
+)
+
+CASES = [
+    Case(
+        "get_request",
+        lambda client, ident: client.get_request(ident),
+        "request",
+        MainRequestSchema,
+    ),
+    Case(
+        f"get_requests_page_paginated[{PAGE_SIZE}]",
+        lambda client, _: client.get_requests_page_paginated(_PAGE_FILTER),
+        "request_page",
+        RequestPaginationResponseSchema,
+    ),
+    Case(
+        "create_request",
+        lambda client, _: client.create_request(_CREATE_SCHEMA),
+        "request",
+        MainRequestSchema,
+    ),
+    Case(
+        "add_note",
+        lambda client, ident: client.add_note(ident, _NOTE_SCHEMA),
+        "note",
+        MainNoteSchema,
+    ),
+    Case(
+        f"attach_file_to_request[{UPLOAD_SIZE // 1024} KB]",
+        lambda client, ident: client.attach_file_to_request(ident, _upload_dto()),
+        "attachment",
+        MainRequestAttachmentSchema,
+    ),
+    Case(
+        f"attach_file_to_note[{UPLOAD_SIZE // 1024} KB]",
+        lambda client, ident: client.attach_file_to_note(ident, 1, _upload_dto()),
+        "attachment",
+        MainRequestAttachmentSchema,
+    ),
+    Case(
+        f"download[{ATTACHMENT_SIZE // 1024} KB]",
+        lambda client, ident: client.download(
+            f"/api/v3/requests/{ident}/attachments/{ident}/download",
+        ),
+        "download",
+    ),
+]
+
+
+def _best(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def _decode_costs(case: Case, body: bytes) -> tuple[float, float]:
+    """Время разбора JSON и валидации pydantic одного ответа, в секундах"""
+
+    schema = case.schema
+    if schema is None:
+        return 0.0, 0.0
+
+    number = max(10, 20_000 // len(body) * 10)
+    json_time = _best(lambda: orjson.loads(body), number)
+    validate_json_time = _best(lambda: schema.model_validate_json(body), number)
+    return json_time, max(validate_json_time - json_time, 0.0)
+
+
+async def _run_case(
+    case: Case,
+    stub: ServiceDeskStub,
+    calls: int,
+    concurrency: int,
+    rounds: int,
+) -> CaseResult:
+    async with httpx.AsyncClient(
+        base_url="http://servicedesk.test/",
+        transport=stub.transport(),
+    ) as http_client:
+        client = HelpdeskClient(http_client)
+        for ident in range(min(calls, 10)):
+            await case.call(client, ident)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(ident: int) -> None:
+            async with semaphore:
+                await case.call(client, ident)
+
+        latencies: list[float] = []
+        cpu = elapsed = float("inf")
+        for _ in range(rounds):
+            cpu_start = time.process_time()
+            for ident in range(calls):
+                start = time.perf_counter()
+                await case.call(client, ident)
+                latencies.append(time.perf_counter() - start)
+            cpu = min(cpu, (time.process_time() - cpu_start) / calls)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(call(ident) for ident in range(calls)))
+            elapsed = min(elapsed, time.perf_counter() - start)
+
+    json_time, validation_time = _decode_costs(case, stub.bodies[case.body])
+    quantiles = statistics.quantiles(latencies, n=100)
+    return CaseResult(
+        calls_per_second=calls / elapsed,
+        p50_ms=quantiles[49] * 1e3,
+        p99_ms=quantiles[98] * 1e3,
+        cpu_us=cpu * 1e6,
+        http_us=max(cpu - json_time - validation_time, 0.0) * 1e6,
+        json_us=json_time * 1e6,
+        validation_us=validation_time * 1e6,
+    )
+
+
+def _latest_results(exclude: Path) -> Path | None:
+    paths = sorted(path for path in RESULTS_DIR.glob("*.json") if path != exclude)
+    return paths[-1] if paths else None
+
+
+def _compare(
+    results: dict[str, CaseResult],
+    baseline_path: Path,
+    threshold: float,
+) -> bool:
+    """Печатает изменения относительно `baseline_path`, возвращает `True` при регрессии"""
+
+    baseline: dict[str, dict[str, Any]] = orjson.loads(baseline_path.read_bytes())[
+        "results"
+    ]
+    print(f"\nСравнение с {baseline_path.name}")
+    print(f"{'method':<40}{'req/s':>10}{'cpu':>10}{'p99':>10}")
+    regression = False
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        throughput = result.calls_per_second / previous["calls_per_second"] - 1
+        cpu = result.cpu_us / previous["cpu_us"] - 1
+        p99 = result.p99_ms / previous["p99_ms"] - 1
+        is_regression = throughput < -threshold or cpu > threshold
+        regression |= is_regression
+        print(
+            f"{name:<40}{throughput:>+10.1%}{cpu:>+10.1%}{p99:>+10.1%}"
+            f"{'  регрессия' if is_regression else ''}",
+        )
+
+    return regression
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    stub = ServiceDeskStub()
+    results: dict[str, CaseResult] = {}
+    print(
+        f"{'method':<40}{'req/s':>10}{'p50, ms':>10}{'p99, ms':>10}"
+        f"{'cpu, µs':>10}{'http':>10}{'json':>10}{'pydantic':>10}",
+    )
+    for case in CASES:
+        result = results[case.name] = await _run_case(
+            case,
+            stub,
+            calls=args.calls,
+            concurrency=args.concurrency,
+            rounds=args.rounds,
+        )
+        print(
+            f"{case.name:<40}{result.calls_per_second:>10.0f}{result.p50_ms:>10.2f}"
+            f"{result.p99_ms:>10.2f}{result.cpu_us:>10.0f}{result.http_us:>10.0f}"
+            f"{result.json_us:>10.0f}{result.validation_us:>10.0f}",
+        )
+
+    path = RESULTS_DIR / f"{datetime.now(tz=UTC):%Y%m%dT%H%M%SZ}.json"
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path.write_bytes(
+            orjson.dumps(
+                {
+                    "created_at": datetime.now(tz=UTC),
+                    "python": platform.python_version(),
+                    "httpx": httpx.__version__,
+                    "pydantic": pydantic.VERSION,
+                    "calls": args.calls,
+                    "concurrency": args.concurrency,
+                    "rounds": args.rounds,
+                    "results": {
+                        name: asdict(result) for name, result in results.items()
+                    },
+                },
+                option=orjson.OPT_INDENT_2,
+            ),
+        )
+        print(f"\nРезультаты сохранены в {path}")
+
+    baseline = args.baseline or _latest_results(exclude=path)
+    if baseline is None:
+        return 0
+
+    return int(_compare(results, baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
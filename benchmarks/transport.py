@@ -0,0 +1,110 @@
+"""
+Влияние настроек пула соединений на `HelpdeskClient.get_request` против локального сервера-заглушки.
+
+Нагрузка идет пачками по `BURST` запросов с паузой `IDLE_GAP` между ними - дольше, чем
+`keepalive_expiry` httpx по умолчанию (5 секунд). Каждое новое соединение на сервере задерживается
+на `HANDSHAKE_DELAY` (имитация TLS-рукопожатия).
+Сравниваются: новый `httpx.AsyncClient` на каждый запрос, `httpx.AsyncClient()` по умолчанию
+и `create_async_http_client` с прогревом соединений и без него.
+
+Запуск: `python -m benchmarks.transport`
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+from helpdesk_client.transport import create_async_http_client, prewarm
+from helpdesk_client.v3 import HelpdeskClient
+
+from benchmarks.stub_server import StubServer, run_stub_server
+
+HANDSHAKE_DELAY = 0.05
+CONCURRENCY = 20
+BURST = 500
+BURSTS = 3
+IDLE_GAP = 6.0
+
+
+async def _run(
+    get_request: Callable[[int], Awaitable[object]],
+) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    async def call(ident: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await get_request(ident)
+            latencies.append(time.perf_counter() - start)
+
+    elapsed = 0.0
+    for burst in range(BURSTS):
+        if burst:
+            await asyncio.sleep(IDLE_GAP)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(call(ident) for ident in range(burst * BURST, (burst + 1) * BURST)),
+        )
+        elapsed += time.perf_counter() - start
+
+    return elapsed, latencies
+
+
+def _report(
+    name: str,
+    server: StubServer,
+    elapsed: float,
+    latencies: list[float],
+) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<40}{len(latencies) / elapsed:>10.0f}{quantiles[49] * 1e3:>10.1f}"
+        f"{quantiles[98] * 1e3:>10.1f}{server.connections:>14}",
+    )
+
+
+async def _per_request_client(server: StubServer) -> None:
+    async def get_request(ident: int) -> object:
+        async with httpx.AsyncClient(base_url=server.base_url) as http_client:
+            return await HelpdeskClient(http_client).get_request(ident)
+
+    _report("new AsyncClient per request", server, *await _run(get_request))
+
+
+async def _default_client(server: StubServer) -> None:
+    async with httpx.AsyncClient(base_url=server.base_url) as http_client:
+        client = HelpdeskClient(http_client)
+        _report("httpx.AsyncClient() defaults", server, *await _run(client.get_request))
+
+
+async def _tuned_client(server: StubServer, *, warm: bool) -> None:
+    async with create_async_http_client(server.base_url) as http_client:
+        if warm:
+            await prewarm(http_client, connections=CONCURRENCY)
+            server.connections = 0
+
+        client = HelpdeskClient(http_client)
+        name = "create_async_http_client" + (" + prewarm" if warm else "")
+        _report(name, server, *await _run(client.get_request))
+
+
+async def main() -> None:
+    print(
+        f"{'client':<40}{'req/s':>10}{'p50, ms':>10}{'p99, ms':>10}{'connections':>14}",
+    )
+    for scenario in (
+        _per_request_client,
+        _default_client,
+        lambda server: _tuned_client(server, warm=False),
+        lambda server: _tuned_client(server, warm=True),
+    ):
+        with run_stub_server(handshake_delay=HANDSHAKE_DELAY) as server:
+            await scenario(server)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
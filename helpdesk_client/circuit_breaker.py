@@ -0,0 +1,208 @@
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+
+import httpx
+
+from helpdesk_client.enums import CircuitStateEnum, EndpointFamilyEnum
+from helpdesk_client.exceptions import CircuitOpenError, DeadlineExceededError
+
+CircuitTransitionCallback = Callable[
+    [EndpointFamilyEnum, CircuitStateEnum, CircuitStateEnum],
+    None,
+]
+"""Вызывается при смене состояния: (семейство, прежнее состояние, новое состояние)"""
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerPolicy:
+    """
+    :param failure_threshold: Сколько сбоев подряд размыкают цепь
+    :param reset_timeout: Через сколько секунд после размыкания пропускаются пробные запросы
+    :param half_open_max_calls: Сколько пробных запросов выполняется одновременно
+    :param success_threshold: Сколько успешных пробных запросов замыкают цепь
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    success_threshold: int = 1
+    failure_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset(
+            {
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                HTTPStatus.BAD_GATEWAY,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.GATEWAY_TIMEOUT,
+            },
+        ),
+    )
+    """
+    Статусы ответа, которые считаются сбоем сервера. Сбоем также считаются `httpx.TransportError`
+    и `DeadlineExceededError`, если срок истек в ожидании сервера.
+    """
+
+
+class Circuit:
+    """Состояние цепи одного семейства эндпоинтов"""
+
+    def __init__(
+        self,
+        family: EndpointFamilyEnum,
+        policy: CircuitBreakerPolicy,
+        on_transition: CircuitTransitionCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._family = family
+        self._policy = policy
+        self._on_transition = on_transition
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitStateEnum.closed
+        self._generation = 0
+        self._failures = 0
+        self._successes = 0
+        self._trials = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitStateEnum:
+        with self._lock:
+            return self._state
+
+    def acquire(self) -> "CircuitCall":
+        """raises: `CircuitOpenError`"""
+
+        transition = None
+        with self._lock:
+            if self._state is CircuitStateEnum.open:
+                retry_after = (
+                    self._opened_at + self._policy.reset_timeout - self._clock()
+                )
+                if retry_after > 0:
+                    raise CircuitOpenError(self._family, retry_after)
+                transition = self._transition(CircuitStateEnum.half_open)
+
+            if self._state is CircuitStateEnum.half_open:
+                if self._trials >= self._policy.half_open_max_calls:
+                    raise CircuitOpenError(self._family, retry_after=None)
+                self._trials += 1
+
+            call = CircuitCall(self, self._generation, self._policy.failure_statuses)
+
+        self._notify(transition)
+        return call
+
+    def complete(self, generation: int, *, failed: bool | None) -> None:
+        """Итог вызова: `failed=None` - итог неизвестен, например вызов отменен"""
+
+        transition = None
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if self._state is CircuitStateEnum.half_open:
+                self._trials -= 1
+                if failed:
+                    transition = self._transition(CircuitStateEnum.open)
+                elif failed is not None:
+                    self._successes += 1
+                    if self._successes >= self._policy.success_threshold:
+                        transition = self._transition(CircuitStateEnum.closed)
+            elif failed:
+                self._failures += 1
+                if self._failures >= self._policy.failure_threshold:
+                    transition = self._transition(CircuitStateEnum.open)
+            elif failed is not None:
+                self._failures = 0
+
+        self._notify(transition)
+
+    def _transition(
+        self,
+        state: CircuitStateEnum,
+    ) -> tuple[CircuitStateEnum, CircuitStateEnum]:
+        previous = self._state
+        self._state = state
+        self._generation += 1
+        self._failures = self._successes = self._trials = 0
+        if state is CircuitStateEnum.open:
+            self._opened_at = self._clock()
+        return previous, state
+
+    def _notify(
+        self,
+        transition: tuple[CircuitStateEnum, CircuitStateEnum] | None,
+    ) -> None:
+        if transition is not None and self._on_transition is not None:
+            self._on_transition(self._family, *transition)
+
+
+def _is_server_failure(error: BaseException) -> bool:
+    """Ошибка сети или срок, истекший после отправки запроса либо по таймауту httpx"""
+
+    if isinstance(error, DeadlineExceededError):
+        return error.sent or isinstance(error.__cause__, httpx.TransportError)
+
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitCall:
+    """Один вызов через цепь. Учитывается только первый итог"""
+
+    def __init__(
+        self,
+        circuit: Circuit,
+        generation: int,
+        failure_statuses: frozenset[int],
+    ) -> None:
+        self._circuit = circuit
+        self._generation = generation
+        self._failure_statuses = failure_statuses
+        self._completed = False
+
+    def record_response(self, response: httpx.Response) -> None:
+        self._complete(failed=response.status_code in self._failure_statuses)
+
+    def record_error(self, error: BaseException) -> None:
+        self._complete(failed=True if _is_server_failure(error) else None)
+
+    def _complete(self, *, failed: bool | None) -> None:
+        if self._completed:
+            return
+
+        self._completed = True
+        self._circuit.complete(self._generation, failed=failed)
+
+
+class CircuitBreaker:
+    """
+    Предохранитель с отдельной цепью на каждое семейство эндпоинтов.
+
+    После `failure_threshold` сбоев подряд (5xx, ошибка сети или истекший в ожидании сервера срок) цепь размыкается, и запросы
+    семейства сразу завершаются `CircuitOpenError`, не отправляясь на сервер. Через `reset_timeout`
+    пропускаются пробные запросы: успех замыкает цепь, сбой снова размыкает.
+    Один экземпляр можно передать нескольким клиентам одного сервера.
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy | None = None,
+        on_transition: CircuitTransitionCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        policy = policy or CircuitBreakerPolicy()
+        self._circuits = {
+            family: Circuit(family, policy, on_transition=on_transition, clock=clock)
+            for family in EndpointFamilyEnum
+        }
+
+    def states(self) -> dict[EndpointFamilyEnum, CircuitStateEnum]:
+        return {family: circuit.state for family, circuit in self._circuits.items()}
+
+    def acquire(self, family: EndpointFamilyEnum) -> CircuitCall:
+        """raises: `CircuitOpenError`"""
+
+        return self._circuits[family].acquire()
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+import httpx
+
+from helpdesk_client.exceptions import DeadlineExceededError
+
+_expires_at: ContextVar[float | None] = ContextVar(
+    "helpdesk_client_deadline",
+    default=None,
+)
+"""Срок по `time.monotonic()`, установленный `deadline`"""
+
+_CLOCK_TOLERANCE = 0.01
+"""Таймаут сокета может сработать чуть раньше срока, до которого он был ограничен"""
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """
+    Ограничивает общее время всех запросов клиентов внутри блока `timeout` секундами.
+
+    Каждый запрос получает только оставшееся время, повтор не начинается, если задержка
+    не укладывается в срок. `HelpdeskClient` отменяет запрос и поток ответа по истечении срока,
+    `SyncHelpdeskClient` проверяет срок между фрагментами ответа, а ожидание сети ограничивает
+    таймаутами httpx. Вложенный блок может только сократить срок внешнего.
+    Срок передается в задачи asyncio и в потоки, которые запускает клиент.
+    raises: `DeadlineExceededError` при вызове методов клиента
+    """
+
+    expires_at = time.monotonic() + timeout
+    outer = _expires_at.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+
+    token = _expires_at.set(expires_at)
+    try:
+        yield
+    finally:
+        _expires_at.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Срок по `time.monotonic()` или `None`, если срок не установлен"""
+
+    return _expires_at.get()
+
+
+def remaining_time() -> float | None:
+    """Оставшееся время в секундах или `None`, если срок не установлен. raises: `DeadlineExceededError`"""
+
+    expires_at = _expires_at.get()
+    if expires_at is None:
+        return None
+
+    return time_left(expires_at)
+
+
+def time_left(expires_at: float) -> float:
+    """Оставшееся до `expires_at` время в секундах. raises: `DeadlineExceededError`"""
+
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError(sent=False)
+    return remaining
+
+
+def within_deadline(delay: float | None) -> float | None:
+    """`delay` перед повтором, если после него останется время, иначе `None`"""
+
+    expires_at = _expires_at.get()
+    if delay is None or expires_at is None:
+        return delay
+
+    return delay if time.monotonic() + delay < expires_at else None
+
+
+def limit_timeout(timeout: httpx.Timeout, remaining: float) -> httpx.Timeout:
+    """Ограничивает каждый таймаут httpx оставшимся временем"""
+
+    def limit(value: float | None) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return httpx.Timeout(
+        connect=limit(timeout.connect),
+        read=limit(timeout.read),
+        write=limit(timeout.write),
+        pool=limit(timeout.pool),
+    )
+
+
+@contextmanager
+def deadline_errors(expires_at: float | None) -> Iterator[None]:
+    """Заменяет `httpx.TimeoutException`, сработавший из-за истечения срока, на `DeadlineExceededError`"""
+
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        if expires_at is None or time.monotonic() < expires_at - _CLOCK_TOLERANCE:
+            raise
+
+        unsent = isinstance(e, (httpx.ConnectTimeout, httpx.PoolTimeout))
+        raise DeadlineExceededError(sent=not unsent) from e
+
+
+@asynccontextmanager
+async def async_deadline_scope(
+    expires_at: float | None,
+    *,
+    sent: bool,
+) -> AsyncIterator[None]:
+    """Отменяет ожидание внутри блока по истечении срока. raises: `DeadlineExceededError`"""
+
+    if expires_at is None:
+        yield
+        return
+
+    try:
+        async with asyncio.timeout(expires_at - time.monotonic()):
+            yield
+    except TimeoutError as e:
+        raise DeadlineExceededError(sent=sent) from e
+
+
+class DeadlineByteStream(httpx.SyncByteStream):
+    """Прерывает чтение ответа `DeadlineExceededError`, если срок истек между фрагментами"""
+
+    def __init__(self, stream: httpx.SyncByteStream, expires_at: float) -> None:
+        self._stream = stream
+        self._expires_at = expires_at
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            if time.monotonic() >= self._expires_at:
+                raise DeadlineExceededError(sent=True)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class AsyncDeadlineByteStream(httpx.AsyncByteStream):
+    """Отменяет чтение ответа `DeadlineExceededError` по истечении срока"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, expires_at: float) -> None:
+        self._stream = stream
+        self._expires_at = expires_at
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        chunks = aiter(self._stream)
+        while True:
+            async with async_deadline_scope(self._expires_at, sent=True):
+                try:
+                    chunk = await anext(chunks)
+                except StopAsyncIteration:
+                    return
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
@@ -9,14 +9,68 @@ class SortEnum(Enum):
 class SearchCriteriaFieldEnum(Enum):
     requester_email = "requester.email_id"
     status_name = "status.name"
+    last_updated_time = "last_updated_time"
 
 
 class SearchCriteriaConditionEnum(Enum):
     eq = "eq"
     neq = "neq"
     contains = "contains"
+    gt = "gt"
+    gte = "gte"
+    lt = "lt"
+    lte = "lte"
 
 
 class SearchCriteriaLogicalOperatorEnum(Enum):
     or_ = "or"
     and_ = "and"
+
+
+class RequestFieldEnum(Enum):
+    """Поля заявки для `fields_required`"""
+
+    id = "id"
+    subject = "subject"
+    description = "description"
+    created_time = "created_time"
+    due_by_time = "due_by_time"
+    completed_time = "completed_time"
+    last_updated_time = "last_updated_time"
+    group = "group"
+    status = "status"
+    requester = "requester"
+    technician = "technician"
+    attachments = "attachments"
+    urgency = "urgency"
+
+
+class EndpointFamilyEnum(Enum):
+    requests = "requests"
+    reference = "reference"
+    """Справочники: категории, подкатегории, срочности, шаблоны"""
+
+    uploads = "uploads"
+    downloads = "downloads"
+
+
+class CircuitStateEnum(Enum):
+    closed = "closed"
+    """Запросы выполняются"""
+
+    open = "open"
+    """Запросы сразу завершаются `CircuitOpenError`"""
+
+    half_open = "half_open"
+    """Выполняются пробные запросы"""
+
+
+class CreateFailureEnum(Enum):
+    not_submitted = "not_submitted"
+    """Запрос не отправлялся: истек срок пакета или не удалось установить соединение. Повтор безопасен"""
+
+    rejected = "rejected"
+    """Сервер отклонил запрос (4xx), заявка не создана"""
+
+    unknown = "unknown"
+    """Запрос мог быть обработан: таймаут ответа, 5xx или неразбираемый ответ. Перед повтором нужно проверить, создана ли заявка"""
@@ -1,10 +1,14 @@
 from contextlib import suppress
 from functools import cached_property
-from typing import Any
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 import orjson
 from orjson import JSONDecodeError
 
+if TYPE_CHECKING:
+    from helpdesk_client.enums import EndpointFamilyEnum
+
 
 class HelpdeskClientError(Exception):
     status_code: int
@@ -26,3 +30,41 @@ class HelpdeskClientError(Exception):
             return orjson.loads(self.response_data) # type: ignore[no-any-return]
 
         return None
+
+
+class DownloadIntegrityError(HelpdeskClientError):
+    """Скачанный файл не совпадает с ожидаемым: другой размер или сервер вернул не тот диапазон."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(status_code=status_code, response_data=message.encode())
+
+
+class CircuitOpenError(HelpdeskClientError):
+    """Цепь предохранителя семейства эндпоинтов разомкнута, запрос не отправлялся."""
+
+    def __init__(
+        self,
+        family: "EndpointFamilyEnum",
+        retry_after: float | None,
+    ) -> None:
+        self.family = family
+        self.retry_after = retry_after
+        """Через сколько секунд будут пропущены пробные запросы, `None` - пробные запросы уже выполняются"""
+
+        super().__init__(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            response_data=f"Circuit breaker is open for {family.value}".encode(),
+        )
+
+
+class DeadlineExceededError(HelpdeskClientError):
+    """Истек срок, установленный `helpdesk_client.deadline.deadline`."""
+
+    def __init__(self, *, sent: bool) -> None:
+        self.sent = sent
+        """Запрос был отправлен на сервер и мог быть обработан"""
+
+        super().__init__(
+            status_code=HTTPStatus.GATEWAY_TIMEOUT,
+            response_data=b"Deadline exceeded",
+        )
@@ -0,0 +1,136 @@
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+from helpdesk_client.enums import EndpointFamilyEnum
+
+_RECALCULATE_EVERY = 16
+"""Через сколько новых замеров пересчитывается задержка дублирующего запроса"""
+
+
+@dataclass(frozen=True, slots=True)
+class HedgingPolicy:
+    """
+    :param percentile: Перцентиль времени ответа, после которого отправляется дублирующий запрос
+    :param min_delay: Минимальная задержка дублирующего запроса в секундах
+    :param max_delay: Максимальная задержка дублирующего запроса в секундах
+    :param min_samples: Сколько замеров нужно, прежде чем запросы начнут дублироваться
+    :param window: Сколько последних замеров учитывается
+    :param budget_ratio: Доля дублирующих запросов от общего числа запросов
+    :param budget_burst: Сколько дублирующих запросов можно накопить в запас
+    """
+
+    percentile: float = 0.95
+    min_delay: float = 0.01
+    max_delay: float = 5.0
+    min_samples: int = 20
+    window: int = 1000
+    budget_ratio: float = 0.05
+    budget_burst: float = 10.0
+    families: frozenset[EndpointFamilyEnum] = field(
+        default_factory=lambda: frozenset(
+            {EndpointFamilyEnum.requests, EndpointFamilyEnum.reference},
+        ),
+    )
+    """Семейства эндпоинтов, GET-запросы которых дублируются"""
+
+
+@dataclass(frozen=True, slots=True)
+class HedgingStats:
+    requests: int
+    """Запросы, которые могли быть продублированы"""
+
+    hedges: int
+    """Отправленные дублирующие запросы"""
+
+    hedges_won: int
+    """Дублирующие запросы, ответившие раньше исходного"""
+
+
+class HedgeWindow:
+    """Замеры времени ответа и бюджет дублирующих запросов одного семейства эндпоинтов"""
+
+    def __init__(self, policy: HedgingPolicy) -> None:
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=policy.window)
+        self._pending_samples = 0
+        self._delay: float | None = None
+        self._budget = 0.0
+        self._requests = 0
+        self._hedges = 0
+        self._hedges_won = 0
+
+    def delay(self) -> float | None:
+        """Задержка дублирующего запроса или `None`, пока замеров недостаточно"""
+
+        with self._lock:
+            self._requests += 1
+            self._budget = min(
+                self._budget + self._policy.budget_ratio,
+                self._policy.budget_burst,
+            )
+            if len(self._latencies) >= self._policy.min_samples and (
+                self._delay is None or self._pending_samples >= _RECALCULATE_EVERY
+            ):
+                self._delay = self._percentile()
+                self._pending_samples = 0
+            return self._delay
+
+    def acquire(self) -> bool:
+        """Расходует бюджет на дублирующий запрос, `False` - бюджет исчерпан"""
+
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+            self._pending_samples += 1
+
+    def record_win(self) -> None:
+        with self._lock:
+            self._hedges_won += 1
+
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            return HedgingStats(
+                requests=self._requests,
+                hedges=self._hedges,
+                hedges_won=self._hedges_won,
+            )
+
+    def _percentile(self) -> float:
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self._policy.percentile), len(latencies) - 1)
+        return min(
+            max(latencies[index], self._policy.min_delay),
+            self._policy.max_delay,
+        )
+
+
+class Hedger:
+    """
+    Дублирующие запросы для идемпотентных GET-запросов семейств `HedgingPolicy.families`.
+
+    Если запрос не получил ответа за `percentile` времени ответа последних запросов семейства,
+    отправляется такой же запрос, используется первый полученный ответ, второй запрос отменяется.
+    Дублирующих запросов не больше `budget_ratio` от всех запросов семейства.
+    Один экземпляр можно передать нескольким клиентам одного сервера.
+    """
+
+    def __init__(self, policy: HedgingPolicy | None = None) -> None:
+        policy = policy or HedgingPolicy()
+        self._windows = {family: HedgeWindow(policy) for family in policy.families}
+
+    def window(self, family: EndpointFamilyEnum) -> HedgeWindow | None:
+        """`None` - запросы семейства не дублируются"""
+
+        return self._windows.get(family)
+
+    def stats(self) -> dict[EndpointFamilyEnum, HedgingStats]:
+        return {family: window.stats() for family, window in self._windows.items()}
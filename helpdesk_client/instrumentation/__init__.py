@@ -0,0 +1,161 @@
+import logging
+import time
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+import orjson
+import pydantic
+
+from helpdesk_client.types_ import RawJson
+
+ModelT = TypeVar("ModelT", bound=pydantic.BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CallEvent:
+    """Метрики одного вызова метода клиента"""
+
+    method: str
+    """Имя метода клиента, например `get_request`"""
+
+    endpoint: str
+    """Имя адреса в `HelpdeskUrls`, например `request_by_id`; `content_url` для скачивания"""
+
+    status_code: int | None
+    """Статус последнего ответа, `None` - ответ не получен"""
+
+    request_bytes: int
+    """Размер тела последнего запроса по `Content-Length`"""
+
+    response_bytes: int
+    """Размер тела последнего ответа по `Content-Length` или по фактически полученным байтам"""
+
+    network_time: float
+    """Время HTTP-запросов попыток, получивших ответ, в секундах, без ожидания ограничителя частоты и повторов"""
+
+    decode_time: float
+    """Время разбора JSON без валидации (`*_raw`-методы) в секундах"""
+
+    validation_time: float
+    """Время валидации pydantic в секундах, включая разбор JSON: `model_validate_json` выполняет их за один проход"""
+
+    retries: int
+    hedges: int
+    """Количество дублирующих запросов, см. `helpdesk_client.hedging.Hedger`"""
+
+    hedges_won: int
+    """Количество дублирующих запросов, ответивших раньше исходного"""
+
+    started_at: float
+    """Время начала вызова, `time.time()`"""
+
+    duration: float
+    """Общее время вызова в секундах"""
+
+    error: BaseException | None
+
+
+CallHook = Callable[[CallEvent], None]
+"""
+Вызывается после завершения каждого вызова метода клиента, в том числе с ошибкой.
+
+Исключение хука логируется и не меняет результат вызова.
+"""
+
+
+class CallRecorder:
+    """Накапливает метрики вызова, пока он выполняется"""
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.status_code: int | None = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self.retries = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.error: BaseException | None = None
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+
+    def record_response(self, response: httpx.Response, network_time: float) -> None:
+        self.status_code = response.status_code
+        self.request_bytes = int(response.request.headers.get("Content-Length", 0))
+        self.response_bytes = (
+            int(response.headers.get("Content-Length", 0))
+            or response.num_bytes_downloaded
+        )
+        self.network_time += network_time
+
+    def event(self) -> CallEvent:
+        return CallEvent(
+            method=self.method,
+            endpoint=self.endpoint,
+            status_code=self.status_code,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            network_time=self.network_time,
+            decode_time=self.decode_time,
+            validation_time=self.validation_time,
+            retries=self.retries,
+            hedges=self.hedges,
+            hedges_won=self.hedges_won,
+            started_at=self._started_at,
+            duration=time.perf_counter() - self._start,
+            error=self.error,
+        )
+
+
+current_call: ContextVar[CallRecorder | None] = ContextVar(
+    "helpdesk_client_current_call",
+    default=None,
+)
+"""Метрики выполняемого вызова, устанавливается клиентом только при наличии хуков"""
+
+
+def emit(hooks: Sequence[CallHook], recorder: CallRecorder) -> None:
+    event = recorder.event()
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Call hook %r failed for %s", hook, event.method)
+
+
+def validate_json(schema: type[ModelT], content: bytes) -> ModelT:
+    """
+    `schema.model_validate_json` с замером времени при выполняемом вызове.
+
+    pydantic разбирает и валидирует JSON за один проход, поэтому все время записывается в `validation_time`.
+    """
+
+    recorder = current_call.get()
+    if recorder is None:
+        return schema.model_validate_json(content)
+
+    start = time.perf_counter()
+    try:
+        return schema.model_validate_json(content)
+    finally:
+        recorder.validation_time += time.perf_counter() - start
+
+
+def decode_json(content: bytes) -> RawJson:
+    recorder = current_call.get()
+    if recorder is None:
+        return orjson.loads(content)  # type: ignore[no-any-return]
+
+    start = time.perf_counter()
+    try:
+        return orjson.loads(content)  # type: ignore[no-any-return]
+    finally:
+        recorder.decode_time += time.perf_counter() - start
@@ -0,0 +1,43 @@
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode, Tracer
+
+from helpdesk_client.instrumentation import CallEvent
+
+
+class OpenTelemetryHook:
+    """
+    Создает span на каждый вызов метода клиента. Требует `servicedesk-client[opentelemetry]`.
+
+    Span создается после завершения вызова с фактическими временем начала и окончания,
+    родителем становится span, активный в момент вызова.
+    """
+
+    def __init__(self, tracer: Tracer | None = None) -> None:
+        self._tracer = tracer or trace.get_tracer("helpdesk_client")
+
+    def __call__(self, event: CallEvent) -> None:
+        start_time = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            f"helpdesk_client {event.method}",
+            kind=SpanKind.CLIENT,
+            start_time=start_time,
+            attributes={
+                "helpdesk_client.method": event.method,
+                "helpdesk_client.endpoint": event.endpoint,
+                "helpdesk_client.request_bytes": event.request_bytes,
+                "helpdesk_client.response_bytes": event.response_bytes,
+                "helpdesk_client.network_time": event.network_time,
+                "helpdesk_client.decode_time": event.decode_time,
+                "helpdesk_client.validation_time": event.validation_time,
+                "helpdesk_client.retries": event.retries,
+                "helpdesk_client.hedges": event.hedges,
+                "helpdesk_client.hedges_won": event.hedges_won,
+            },
+        )
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+
+        span.end(end_time=start_time + int(event.duration * 1e9))
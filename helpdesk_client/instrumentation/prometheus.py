@@ -0,0 +1,90 @@
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+
+from helpdesk_client.instrumentation import CallEvent
+
+_LABELS = ("method", "endpoint", "status")
+_BYTES_BUCKETS = tuple(float(4**power) for power in range(4, 15))
+"""От 256 байт до 256 МБ"""
+
+
+class PrometheusHook:
+    """
+    Записывает метрики вызовов методов клиента в гистограммы. Требует `servicedesk-client[prometheus]`.
+
+    Метки: `method`, `endpoint` и `status` - код последнего ответа или `error`, если ответ не получен.
+    Один экземпляр регистрирует метрики в `registry` и может использоваться несколькими клиентами.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        namespace: str = "helpdesk_client",
+    ) -> None:
+        def histogram(
+            name: str,
+            documentation: str,
+            buckets: tuple[float, ...] = Histogram.DEFAULT_BUCKETS,
+        ) -> Histogram:
+            return Histogram(
+                name,
+                documentation,
+                _LABELS,
+                namespace=namespace,
+                registry=registry,
+                buckets=buckets,
+            )
+
+        def counter(name: str, documentation: str) -> Counter:
+            return Counter(
+                name,
+                documentation,
+                _LABELS,
+                namespace=namespace,
+                registry=registry,
+            )
+
+        self._duration = histogram("call_duration_seconds", "Общее время вызова")
+        self._network = histogram("call_network_seconds", "Время HTTP-запросов")
+        self._decode = histogram(
+            "call_decode_seconds",
+            "Время разбора JSON без валидации",
+        )
+        self._validation = histogram(
+            "call_validation_seconds",
+            "Время валидации pydantic, включая разбор JSON",
+        )
+        self._request_bytes = histogram(
+            "call_request_bytes",
+            "Размер тела запроса",
+            _BYTES_BUCKETS,
+        )
+        self._response_bytes = histogram(
+            "call_response_bytes",
+            "Размер тела ответа",
+            _BYTES_BUCKETS,
+        )
+        self._retries = counter("call_retries", "Количество повторов запросов")
+        self._hedges = counter("call_hedges", "Количество дублирующих запросов")
+        self._hedges_won = counter(
+            "call_hedges_won",
+            "Количество дублирующих запросов, ответивших раньше исходного",
+        )
+
+    def __call__(self, event: CallEvent) -> None:
+        labels = (
+            event.method,
+            event.endpoint,
+            "error" if event.status_code is None else str(event.status_code),
+        )
+        self._duration.labels(*labels).observe(event.duration)
+        self._network.labels(*labels).observe(event.network_time)
+        self._decode.labels(*labels).observe(event.decode_time)
+        self._validation.labels(*labels).observe(event.validation_time)
+        self._request_bytes.labels(*labels).observe(event.request_bytes)
+        self._response_bytes.labels(*labels).observe(event.response_bytes)
+        if event.retries:
+            self._retries.labels(*labels).inc(event.retries)
+        if event.hedges:
+            self._hedges.labels(*labels).inc(event.hedges)
+        if event.hedges_won:
+            self._hedges_won.labels(*labels).inc(event.hedges_won)
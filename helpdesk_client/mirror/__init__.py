@@ -0,0 +1,5 @@
+from .store import RequestMirror
+
+__all__ = [
+    "RequestMirror",
+]
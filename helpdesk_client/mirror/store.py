@@ -0,0 +1,234 @@
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+import orjson
+
+from helpdesk_client.enums import SortEnum
+from helpdesk_client.v3.delta import DeltaWatermark
+from helpdesk_client.v3.schemas.response import DateTimeSchema, RequestSchema
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    id INTEGER PRIMARY KEY,
+    subject TEXT,
+    status TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    requester_id INTEGER NOT NULL,
+    technician_id INTEGER,
+    urgency_id INTEGER,
+    created_time INTEGER NOT NULL,
+    due_by_time INTEGER,
+    completed_time INTEGER,
+    last_updated_time INTEGER,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_requests_status ON requests (status, created_time);
+CREATE INDEX IF NOT EXISTS ix_requests_requester_id ON requests (requester_id, created_time);
+CREATE INDEX IF NOT EXISTS ix_requests_created_time ON requests (created_time);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO requests (
+    id, subject, status, group_name, requester_id, technician_id, urgency_id,
+    created_time, due_by_time, completed_time, last_updated_time, payload
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    subject = excluded.subject,
+    status = excluded.status,
+    group_name = excluded.group_name,
+    requester_id = excluded.requester_id,
+    technician_id = excluded.technician_id,
+    urgency_id = excluded.urgency_id,
+    created_time = excluded.created_time,
+    due_by_time = excluded.due_by_time,
+    completed_time = excluded.completed_time,
+    last_updated_time = excluded.last_updated_time,
+    payload = excluded.payload
+"""
+
+_WATERMARK_KEY = "watermark"
+
+
+def _to_ms(value: DateTimeSchema | datetime | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, DateTimeSchema):
+        value = value.value
+    return round(value.timestamp() * 1000)
+
+
+def _row(request: RequestSchema) -> tuple[Any, ...]:
+    return (
+        request.id,
+        request.subject,
+        request.status.name,
+        request.group.name,
+        request.requester.id,
+        request.technician.id if request.technician else None,
+        request.urgency.id if request.urgency else None,
+        _to_ms(request.created_time),
+        _to_ms(request.due_by_time),
+        _to_ms(request.completed_time),
+        _to_ms(request.last_updated_time),
+        request.__pydantic_serializer__.to_json(request, by_alias=True),
+    )
+
+
+class RequestMirror:
+    """
+    Локальная копия заявок в SQLite с индексами по статусу, заявителю и времени создания.
+
+    Заявки хранятся целиком в JSON, запросы возвращают `RequestSchema`.
+    Экземпляр можно использовать из нескольких потоков.
+    :param path: Путь к файлу базы данных, по умолчанию база в памяти
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if str(path) != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def upsert(self, requests: Iterable[RequestSchema]) -> int:
+        """Добавляет или обновляет заявки одной транзакцией, возвращает их количество"""
+
+        rows = [_row(request) for request in requests]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(_UPSERT, rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return len(rows)
+
+    def delete(self, ident: int) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM requests WHERE id = ?", (ident,))
+
+    def get(self, ident: int) -> RequestSchema | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM requests WHERE id = ?",
+                (ident,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return RequestSchema.model_validate_json(row[0])
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        status: str | None = None,
+        requester_id: int | None = None,
+        group: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        sort_order: SortEnum = SortEnum.desc,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[RequestSchema]:
+        """
+        Заявки, удовлетворяющие всем переданным условиям, отсортированные по времени создания.
+
+        :param created_from: Время создания, включительно
+        :param created_to: Время создания, не включительно
+        """
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        for condition, value in (
+            ("status = ?", status),
+            ("requester_id = ?", requester_id),
+            ("group_name = ?", group),
+            ("created_time >= ?", _to_ms(created_from)),
+            ("created_time < ?", _to_ms(created_to)),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "ASC" if sort_order == SortEnum.asc else "DESC"
+        sql = f"SELECT payload FROM requests {where} ORDER BY created_time {order}, id {order} LIMIT ? OFFSET ?"  # noqa: S608
+        with self._lock:
+            rows = self._connection.execute(sql, (*params, limit, offset)).fetchall()
+
+        return [RequestSchema.model_validate_json(row[0]) for row in rows]
+
+    def count(self, *, status: str | None = None) -> int:
+        with self._lock:
+            if status is None:
+                row = self._connection.execute(
+                    "SELECT count(*) FROM requests",
+                ).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT count(*) FROM requests WHERE status = ?",
+                    (status,),
+                ).fetchone()
+        return row[0]  # type: ignore[no-any-return]
+
+    def save_watermark(self, watermark: DeltaWatermark) -> None:
+        """Сохраняет `DeltaWatermark` синхронизации, в результате которой заполнена копия"""
+
+        value = orjson.dumps(
+            {
+                "updated_at": watermark.updated_at,
+                "recent": sorted(watermark.recent),
+            },
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (_WATERMARK_KEY, value),
+            )
+
+    def load_watermark(self) -> DeltaWatermark | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?",
+                (_WATERMARK_KEY,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        data = orjson.loads(row[0])
+        return DeltaWatermark(
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            recent=frozenset((ident, updated) for ident, updated in data["recent"]),
+        )
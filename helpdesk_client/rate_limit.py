@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from helpdesk_client.enums import EndpointFamilyEnum
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """raises: `ValueError`, если `rate` не больше нуля"""
+
+    rate: float
+    """Запросов в секунду"""
+
+    burst: int
+    """Максимальное количество запросов подряд без ожидания"""
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            msg = f"Rate must be positive, got {self.rate}"
+            raise ValueError(msg)
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        limit: RateLimit,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limit = limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(limit.burst)
+        self._updated_at = clock()
+
+    @property
+    def level(self) -> float:
+        """Текущее количество токенов, отрицательное - есть ожидающие запросы"""
+
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self) -> float:
+        """Резервирует токен и возвращает время ожидания до его появления в секундах"""
+
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._limit.rate
+
+    def refund(self) -> None:
+        """Возвращает зарезервированный токен, если запрос не был выполнен"""
+
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self._limit.burst), self._tokens + 1)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            float(self._limit.burst),
+            self._tokens + (now - self._updated_at) * self._limit.rate,
+        )
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов с отдельным бюджетом на каждое семейство эндпоинтов.
+
+    Один экземпляр можно передать нескольким клиентам, чтобы они делили общий бюджет.
+    Семейства без лимита не ограничиваются.
+    """
+
+    def __init__(self, limits: Mapping[EndpointFamilyEnum, RateLimit]) -> None:
+        self._buckets = {family: TokenBucket(limit) for family, limit in limits.items()}
+
+    def levels(self) -> dict[EndpointFamilyEnum, float]:
+        return {family: bucket.level for family, bucket in self._buckets.items()}
+
+    async def acquire(self, family: EndpointFamilyEnum) -> None:
+        """При отмене ожидания зарезервированный токен возвращается"""
+
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            return
+
+        delay = bucket.reserve()
+        if not delay:
+            return
+
+        try:
+            await asyncio.sleep(delay)
+        except BaseException:
+            bucket.refund()
+            raise
+
+    def acquire_sync(
+        self,
+        family: EndpointFamilyEnum,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Ждет токен не дольше `timeout` секунд.
+
+        Возвращает `False` без ожидания, если токен появится позже `timeout`; токен при этом не расходуется.
+        """
+
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            return True
+
+        delay = bucket.reserve()
+        if timeout is not None and delay > timeout:
+            bucket.refund()
+            return False
+
+        if delay:
+            time.sleep(delay)
+        return True
@@ -0,0 +1,148 @@
+import random
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+import httpx
+
+from helpdesk_client.deadline import deadline
+from helpdesk_client.exceptions import CircuitOpenError, DeadlineExceededError
+
+_SAFE_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS})
+"""Статусы, при которых сервер гарантированно не обработал запрос"""
+
+_SAFE_EXCEPTIONS: tuple[type[httpx.TransportError], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+"""Ошибки, при которых запрос гарантированно не был отправлен"""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой и decorrelated jitter.
+
+    Неидемпотентные запросы (`create_request`, `add_note`, загрузка файлов) повторяются только
+    если запрос гарантированно не был обработан: ошибка соединения или `429 Too Many Requests`.
+    Загрузка файла из асинхронного источника не повторяется: его можно прочитать только один раз.
+    :param max_attempts: Максимальное количество попыток, включая первую
+    :param base_delay: Минимальная задержка между попытками в секундах
+    :param max_delay: Максимальная задержка между попытками в секундах (кроме `Retry-After`)
+    :param total_timeout: Ограничение общего времени вызова вместе с задержками в секундах.
+        Таймауты каждой попытки ограничиваются оставшимся временем, по его истечении вызов
+        завершается `DeadlineExceededError`
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 10.0
+    total_timeout: float | None = 30.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset(
+            {
+                HTTPStatus.TOO_MANY_REQUESTS,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                HTTPStatus.BAD_GATEWAY,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.GATEWAY_TIMEOUT,
+            },
+        ),
+    )
+
+    def attempts(self, *, idempotent: bool) -> "RetryAttempts":
+        return RetryAttempts(policy=self, idempotent=idempotent)
+
+
+class RetryAttempts:
+    """Состояние повторов одного вызова"""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        *,
+        idempotent: bool,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy = policy
+        self._idempotent = idempotent
+        self._clock = clock
+        self._started_at = clock()
+        self._delay = policy.base_delay
+        self.count = 1
+        """Номер текущей попытки"""
+
+    def time_limit(self) -> AbstractContextManager[None]:
+        """`deadline` на `total_timeout` политики: попытки получают только оставшееся время"""
+
+        if self._policy.total_timeout is None:
+            return nullcontext()
+
+        remaining = self._policy.total_timeout - (self._clock() - self._started_at)
+        return deadline(remaining)
+
+    def delay_after_response(self, response: httpx.Response) -> float | None:
+        """Задержка перед следующей попыткой или `None`, если ответ нужно вернуть"""
+
+        if response.status_code not in self._policy.retry_statuses:
+            return None
+        if not self._idempotent and response.status_code not in _SAFE_STATUSES:
+            return None
+
+        return self._next_delay(retry_after=parse_retry_after(response))
+
+    def delay_after_error(self, error: httpx.TransportError) -> float | None:
+        """Задержка перед следующей попыткой или `None`, если ошибку нужно пробросить"""
+
+        if not self._idempotent and not isinstance(error, _SAFE_EXCEPTIONS):
+            return None
+
+        return self._next_delay(retry_after=None)
+
+    def _next_delay(self, retry_after: float | None) -> float | None:
+        if self.count >= self._policy.max_attempts:
+            return None
+
+        self._delay = min(
+            self._policy.max_delay,
+            random.uniform(self._policy.base_delay, self._delay * 3),  # noqa: S311
+        )
+        delay = self._delay if retry_after is None else max(self._delay, retry_after)
+        if self._policy.total_timeout is not None:
+            elapsed = self._clock() - self._started_at
+            if elapsed + delay > self._policy.total_timeout:
+                return None
+
+        self.count += 1
+        return delay
+
+
+def is_unsent_error(error: BaseException) -> bool:
+    """Запрос гарантированно не был отправлен на сервер: повтор безопасен даже для неидемпотентного метода"""
+
+    if isinstance(error, DeadlineExceededError):
+        return not error.sent
+
+    return isinstance(error, (*_SAFE_EXCEPTIONS, CircuitOpenError))
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Значение заголовка `Retry-After` в секундах: число секунд или HTTP-дата"""
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future, wait
+from typing import Any, TypeVar
+
+from helpdesk_client.deadline import async_deadline_scope, current_deadline, time_left
+from helpdesk_client.exceptions import DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    """
+    Объединяет одновременные вызовы с одинаковым ключом в один.
+
+    Объединяются только вызовы с одинаковым сроком `deadline`, поэтому истечение чужого срока
+    не передается вызывающему, а каждый ожидающий ограничен своим сроком.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """raises: `DeadlineExceededError`, если срок истек раньше общего вызова"""
+
+        expires_at = current_deadline()
+        key = (expires_at, key)
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+
+        # Отмена одного из ожидающих не должна отменять общий вызов
+        async with async_deadline_scope(expires_at, sent=True):
+            return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+
+class SingleFlight:
+    """Объединяет одновременные вызовы с одинаковым ключом из разных потоков в один, сроки - как в `AsyncSingleFlight`"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """raises: `DeadlineExceededError`, если срок истек раньше общего вызова"""
+
+        expires_at = current_deadline()
+        key = (expires_at, key)
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            timeout = None if expires_at is None else time_left(expires_at)
+            if not wait([future], timeout).done:
+                raise DeadlineExceededError(sent=True)
+            return future.result()  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
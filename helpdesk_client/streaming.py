@@ -0,0 +1,104 @@
+import re
+
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_STRING_END = re.compile(rb'["\\]')
+
+_QUOTE, _BACKSLASH = ord('"'), ord("\\")
+_OPENING = frozenset(b"{[")
+
+
+class JsonArrayItemsParser:
+    """
+    Инкрементально выделяет элементы-объекты массива из поля `key` верхнего уровня JSON-объекта.
+
+    Элементы возвращаются как байты по мере получения, в буфере хранится только текущий
+    незавершенный элемент. Содержимое строк пропускается регулярным выражением целиком,
+    поэтому длинные HTML-описания не разбираются посимвольно.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._key = b'"' + key.encode() + b'"'
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._is_key = False
+        self._in_array = False
+        self._item_start: int | None = None
+        self.is_done = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self.is_done:
+            return []
+
+        self._buffer += chunk
+        items = self._parse()
+        self._compact()
+        return items
+
+    def _parse(self) -> list[bytes]:  # noqa: C901, PLR0912
+        items: list[bytes] = []
+        buffer = self._buffer
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return items
+                if buffer[match.start()] == _BACKSLASH:
+                    if match.end() >= len(buffer):
+                        # Экранированный символ придет в следующем фрагменте
+                        self._pos = match.start()
+                        return items
+                    self._pos = match.end() + 1
+                    continue
+
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 1 and not self._in_array:
+                    self._is_key = buffer[self._string_start : self._pos] == self._key
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                return items
+
+            char = buffer[match.start()]
+            self._pos = match.end()
+            if char == _QUOTE:
+                self._in_string = True
+                self._string_start = match.start()
+            elif char in _OPENING:
+                if self._depth == 1 and self._is_key:
+                    self._in_array = True
+                elif self._in_array and self._depth == 2:  # noqa: PLR2004
+                    self._item_start = match.start()
+                self._is_key = False
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._in_array:
+                    continue
+                if self._depth == 2 and self._item_start is not None:  # noqa: PLR2004
+                    items.append(bytes(buffer[self._item_start : self._pos]))
+                    self._item_start = None
+                elif self._depth == 1:
+                    self.is_done = True
+                    return items
+
+    def _compact(self) -> None:
+        start = self._pos
+        if self._item_start is not None:
+            start = min(start, self._item_start)
+        if self._in_string and self._depth == 1:
+            start = min(start, self._string_start)
+        if not start:
+            return
+
+        del self._buffer[:start]
+        self._pos -= start
+        self._string_start -= start
+        if self._item_start is not None:
+            self._item_start -= start
@@ -0,0 +1,196 @@
+import asyncio
+import ssl
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+
+from helpdesk_client.deadline import current_deadline, limit_timeout
+from helpdesk_client.enums import EndpointFamilyEnum
+
+FAMILY_EXTENSION = "helpdesk_client.family"
+"""Ключ `request.extensions`, в котором клиенты передают `EndpointFamilyEnum` запроса"""
+
+DEFAULT_FAMILY_TIMEOUTS: Mapping[EndpointFamilyEnum, httpx.Timeout] = {
+    EndpointFamilyEnum.requests: httpx.Timeout(15.0, connect=5.0),
+    EndpointFamilyEnum.reference: httpx.Timeout(10.0, connect=5.0),
+    EndpointFamilyEnum.uploads: httpx.Timeout(15.0, connect=5.0, write=120.0),
+    EndpointFamilyEnum.downloads: httpx.Timeout(15.0, connect=5.0, read=120.0),
+}
+
+
+def family_extensions(family: EndpointFamilyEnum) -> dict[str, Any]:
+    return {FAMILY_EXTENSION: family}
+
+
+def _apply_family_timeout(
+    request: httpx.Request,
+    timeouts: Mapping[EndpointFamilyEnum, httpx.Timeout],
+) -> None:
+    timeout = timeouts.get(request.extensions.get(FAMILY_EXTENSION))  # type: ignore[arg-type]
+    if timeout is None:
+        return
+
+    expires_at = current_deadline()
+    if expires_at is not None:
+        timeout = limit_timeout(timeout, max(expires_at - time.monotonic(), 0.0))
+    request.extensions["timeout"] = timeout.as_dict()
+
+
+class FamilyTimeoutTransport(httpx.BaseTransport):
+    """
+    Подставляет таймауты по семейству эндпоинтов (`FAMILY_EXTENSION`) вместо таймаута клиента.
+
+    Внутри `helpdesk_client.deadline.deadline` таймауты ограничиваются оставшимся временем.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        timeouts: Mapping[EndpointFamilyEnum, httpx.Timeout],
+    ) -> None:
+        self._transport = transport
+        self._timeouts = timeouts
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _apply_family_timeout(request, self._timeouts)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncFamilyTimeoutTransport(httpx.AsyncBaseTransport):
+    """Асинхронный вариант `FamilyTimeoutTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        timeouts: Mapping[EndpointFamilyEnum, httpx.Timeout],
+    ) -> None:
+        self._transport = transport
+        self._timeouts = timeouts
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _apply_family_timeout(request, self._timeouts)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_async_http_client(  # noqa: PLR0913
+    base_url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: httpx.Timeout | float = 10.0,
+    family_timeouts: Mapping[EndpointFamilyEnum, httpx.Timeout] | None = (
+        DEFAULT_FAMILY_TIMEOUTS
+    ),
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+    http2: bool = False,
+    verify: ssl.SSLContext | bool = True,
+) -> httpx.AsyncClient:
+    """
+    Создает `httpx.AsyncClient` для `HelpdeskClient` с пулом соединений, настроенным под нагрузку.
+
+    :param headers: Заголовки всех запросов, например `{"authtoken": ...}`
+    :param timeout: Таймаут запросов без семейства эндпоинтов
+    :param family_timeouts: Таймауты по `EndpointFamilyEnum`, `None` - только `timeout`
+    :param max_connections: Максимальное количество соединений
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+        Пул httpcore проверяет каждое простаивающее соединение при назначении запроса,
+        поэтому большое значение при высокой конкурентности увеличивает нагрузку на CPU
+    :param keepalive_expiry: Через сколько секунд простоя закрывать соединение.
+        В httpx по умолчанию 5 секунд - после паузы в нагрузке соединения открываются заново
+    :param http2: Использовать HTTP/2 - все запросы мультиплексируются в одно соединение.
+        Требует `servicedesk-client[http2]`
+    """
+
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        verify=verify,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    if family_timeouts:
+        transport = AsyncFamilyTimeoutTransport(transport, family_timeouts)
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        transport=transport,
+    )
+
+
+def create_http_client(  # noqa: PLR0913
+    base_url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: httpx.Timeout | float = 10.0,
+    family_timeouts: Mapping[EndpointFamilyEnum, httpx.Timeout] | None = (
+        DEFAULT_FAMILY_TIMEOUTS
+    ),
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+    http2: bool = False,
+    verify: ssl.SSLContext | bool = True,
+) -> httpx.Client:
+    """Создает `httpx.Client` для `SyncHelpdeskClient`, параметры как у `create_async_http_client`."""
+
+    transport: httpx.BaseTransport = httpx.HTTPTransport(
+        verify=verify,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    if family_timeouts:
+        transport = FamilyTimeoutTransport(transport, family_timeouts)
+
+    return httpx.Client(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        transport=transport,
+    )
+
+
+async def prewarm(
+    http_client: httpx.AsyncClient,
+    connections: int = 1,
+    url: str = "",
+) -> None:
+    """
+    Заранее открывает `connections` соединений одновременными запросами `HEAD url`.
+
+    Статус ответа не проверяется. Для HTTP/2 достаточно одного соединения.
+    raises: `httpx.HTTPError`
+    """
+
+    await asyncio.gather(*(http_client.head(url) for _ in range(connections)))
+
+
+def prewarm_sync(
+    http_client: httpx.Client,
+    connections: int = 1,
+    url: str = "",
+) -> None:
+    """Синхронный вариант `prewarm`. raises: `httpx.HTTPError`"""
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        for future in [
+            executor.submit(http_client.head, url) for _ in range(connections)
+        ]:
+            future.result()
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU-кэш с ограничением по количеству записей и времени жизни записи.
+
+    :param maxsize: Максимальное количество записей, при превышении вытесняются давно не использованные
+    :param ttl: Время жизни записи в секундах, `None` - без ограничения
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        """Возвращает `(True, value)` при попадании и `(False, None)` при промахе"""
+
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False, None
+
+            expires_at, value = item
+            if expires_at < self._clock():
+                del self._data[key]
+                return False, None
+
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = float("inf") if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[K], bool] | None = None) -> None:
+        """Удаляет записи, ключи которых удовлетворяют `predicate`, или все записи"""
+
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
@@ -1,5 +1,10 @@
+from typing import Any, TypeAlias
+
 from pydantic import BaseModel, ConfigDict
 
+RawJson: TypeAlias = dict[str, Any]
+"""Декодированный JSON ответа без валидации"""
+
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
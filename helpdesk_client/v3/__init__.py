@@ -1,5 +1,15 @@
+from .attachment_cache import AttachmentCache
+from .cached_client import CachedHelpdeskClient, SyncCachedHelpdeskClient
 from .client import HelpdeskClient, SyncHelpdeskClient
-from .dto import UploadFileDTO
+from .delta import DeltaWatermark, RequestDeltaSync, SyncRequestDeltaSync
+from .dto import (
+    CreateRequestFailureDTO,
+    CreateRequestsDTO,
+    RequestsByIdsDTO,
+    ResolutionResourcesDTO,
+    UploadFileDTO,
+)
+from .resolution import extract_inline_urls
 from .schemas import (
     CategoryFilterParams,
     CategoryPaginationResponseSchema,
@@ -23,6 +33,9 @@ from .schemas import (
     PaginationBaseResponse,
     PaginationInfo,
     PaginationResponseSchema,
+    PartialRequestListSchema,
+    PartialRequestPaginationResponseSchema,
+    PartialRequestSchema,
     RequestAttachmentSchema,
     RequestCreateSchema,
     RequestCriteriaFilterPagePaginationParams,
@@ -55,11 +68,16 @@ from .schemas import (
 from .urls import HelpdeskUrls
 
 __all__ = [
+    "AttachmentCache",
+    "CachedHelpdeskClient",
     "CategoryFilterParams",
     "CategoryPaginationResponseSchema",
     "CategorySchema",
     "CategorySearchFields",
+    "CreateRequestFailureDTO",
+    "CreateRequestsDTO",
     "DateTimeSchema",
+    "DeltaWatermark",
     "FileSizeSchema",
     "HasNameSchema",
     "HelpdeskClient",
@@ -79,9 +97,13 @@ __all__ = [
     "PaginationBaseResponse",
     "PaginationInfo",
     "PaginationResponseSchema",
+    "PartialRequestListSchema",
+    "PartialRequestPaginationResponseSchema",
+    "PartialRequestSchema",
     "RequestAttachmentSchema",
     "RequestCreateSchema",
     "RequestCriteriaFilterPagePaginationParams",
+    "RequestDeltaSync",
     "RequestFilterParams",
     "RequestListSchema",
     "RequestSchema",
@@ -89,7 +111,9 @@ __all__ = [
     "RequestUpdateSchema",
     "RequestWithResolutionSchema",
     "RequesterSchema",
+    "RequestsByIdsDTO",
     "ResolutionBaseSchema",
+    "ResolutionResourcesDTO",
     "ResolutionSchema",
     "SearchCriteria",
     "ShortCategorySchema",
@@ -100,7 +124,9 @@ __all__ = [
     "SubcategoryPaginationResponseSchema",
     "SubcategorySchema",
     "SubcategorySearchFields",
+    "SyncCachedHelpdeskClient",
     "SyncHelpdeskClient",
+    "SyncRequestDeltaSync",
     "TemplateFilterParams",
     "TemplateSchema",
     "TemplateSearchFields",
@@ -109,4 +135,5 @@ __all__ = [
     "UrgencyPaginationResponseSchema",
     "UrgencySchema",
     "UrgencySearchFields",
+    "extract_inline_urls",
 ]
@@ -0,0 +1,331 @@
+import asyncio
+import hashlib
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+
+_READ_CHUNK_SIZE = 256 * 1024
+_TMP_SUFFIX = ".tmp"
+_STALE_TMP_SECONDS = 24 * 60 * 60
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_url(content_url: str) -> str:
+    return content_url.removeprefix("/")
+
+
+class AttachmentCache:
+    """
+    Дисковый кэш вложений и изображений из решений, адресуемый по `content_url`.
+
+    Файл записи называется SHA-256 от `content_url`. При превышении `max_bytes` вытесняются
+    давно не использованные записи; порядок использования хранится в mtime файлов и
+    переживает перезапуск. Если передан ожидаемый размер (`RequestAttachmentSchema.size.value`),
+    запись другого размера считается промахом и удаляется. Каталог можно использовать из
+    нескольких процессов: временные файлы записи уникальны, при загрузке удаляются только
+    временные файлы старше суток, оставшиеся после сбоя.
+
+    :param directory: Каталог кэша
+    :param max_bytes: Максимальный суммарный размер файлов в байтах
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._load()
+
+    def _load(self) -> None:
+        files = []
+        stale_before = time.time() - _STALE_TMP_SECONDS
+        for path in self._directory.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            if path.name.endswith(_TMP_SUFFIX):
+                if stat.st_mtime < stale_before:
+                    path.unlink(missing_ok=True)
+                continue
+
+            files.append((stat.st_mtime_ns, path.name, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        with self._lock:
+            self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(content_url: str) -> str:
+        return hashlib.sha256(_normalize_url(content_url).encode()).hexdigest()
+
+    def lookup(self, content_url: str, size: int | None = None) -> Path | None:
+        """Возвращает путь к файлу записи при попадании и отмечает ее как использованную"""
+
+        key = self.key(content_url)
+        with self._lock:
+            cached_size = self._entries.get(key)
+            if cached_size is None:
+                return None
+
+            if size is not None and cached_size != size:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+        path = self._directory / key
+        with suppress(OSError):
+            os.utime(path)
+
+        return path
+
+    def open(self, content_url: str, size: int | None = None) -> BinaryIO | None:
+        """Открывает файл записи на чтение, `None` при промахе"""
+
+        path = self.lookup(content_url, size)
+        if path is None:
+            return None
+
+        try:
+            return path.open("rb")
+        except FileNotFoundError:
+            self.pop(content_url)
+            return None
+
+    def read(self, content_url: str, size: int | None = None) -> bytes | None:
+        file = self.open(content_url, size)
+        if file is None:
+            return None
+
+        with file:
+            return file.read()
+
+    def put(self, content_url: str, data: bytes, size: int | None = None) -> bool:
+        """
+        Сохраняет запись. Возвращает `False`, если размер не совпал с `size` или больше `max_bytes`.
+
+        Ошибки записи на диск не пробрасываются: они логируются, и запись не сохраняется.
+        """
+
+        writer = self.writer(content_url, size)
+        writer.write(data)
+        return writer.commit()
+
+    def writer(
+        self,
+        content_url: str,
+        size: int | None = None,
+    ) -> "AttachmentCacheWriter":
+        """Запись по частям: запись появляется в кэше только после `commit`"""
+
+        key = self.key(content_url)
+        return AttachmentCacheWriter(
+            tmp_path=self._tmp_path(key),
+            size=size,
+            max_bytes=self._max_bytes,
+            on_commit=partial(self._commit, key),
+        )
+
+    def pop(self, content_url: str) -> None:
+        with self._lock:
+            self._remove(self.key(content_url))
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _tmp_path(self, key: str) -> Path:
+        return self._directory / f"{key}.{secrets.token_hex(4)}{_TMP_SUFFIX}"
+
+    def _commit(self, key: str, tmp_path: Path, size: int) -> bool:
+        if size > self._max_bytes:
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        with self._lock:
+            tmp_path.replace(self._directory / key)
+            self._total_bytes += size - self._entries.get(key, 0)
+            self._entries[key] = size
+            self._entries.move_to_end(key)
+            self._evict()
+
+        return True
+
+    def _evict(self) -> None:
+        while self._total_bytes > self._max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is None:
+            return
+
+        self._total_bytes -= size
+        with suppress(OSError):
+            (self._directory / key).unlink()
+
+
+class AttachmentCacheWriter:
+    """
+    Пишет запись во временный файл, `commit` атомарно добавляет ее в кэш.
+
+    При ошибке записи на диск (`OSError`) запись отбрасывается с предупреждением в лог.
+    """
+
+    def __init__(
+        self,
+        tmp_path: Path,
+        size: int | None,
+        max_bytes: int,
+        on_commit: Callable[[Path, int], bool],
+    ) -> None:
+        self._tmp_path = tmp_path
+        self._size = size
+        self._max_bytes = max_bytes
+        self._on_commit = on_commit
+        self._written = 0
+        self._file: BinaryIO | None = None
+        try:
+            self._file = self._tmp_path.open("wb")
+        except OSError:
+            logger.warning("Failed to create %s", self._tmp_path, exc_info=True)
+
+    def write(self, data: bytes) -> None:
+        if self._file is None:
+            return
+
+        self._written += len(data)
+        if self._written > self._max_bytes:
+            self.discard()
+            return
+
+        try:
+            self._file.write(data)
+        except OSError:
+            logger.warning("Failed to write %s", self._tmp_path, exc_info=True)
+            self.discard()
+
+    def commit(self) -> bool:
+        if self._file is None:
+            return False
+
+        file, self._file = self._file, None
+        try:
+            file.close()
+            if self._size is not None and self._written != self._size:
+                self._tmp_path.unlink(missing_ok=True)
+                return False
+
+            return self._on_commit(self._tmp_path, self._written)
+        except OSError:
+            logger.warning("Failed to commit %s", self._tmp_path, exc_info=True)
+            with suppress(OSError):
+                self._tmp_path.unlink(missing_ok=True)
+            return False
+
+    def discard(self) -> None:
+        if self._file is None:
+            return
+
+        file, self._file = self._file, None
+        with suppress(OSError):
+            file.close()
+        with suppress(OSError):
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class CachedFileStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Тело ответа из файла кэша, читается фрагментами."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self._file.read(_READ_CHUNK_SIZE):
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while chunk := await asyncio.to_thread(self._file.read, _READ_CHUNK_SIZE):
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    async def aclose(self) -> None:
+        self._file.close()
+
+
+class TeeStream(httpx.SyncByteStream):
+    """Отдает тело ответа и одновременно пишет его в кэш. Прочитанное не до конца тело не сохраняется."""
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        writer: AttachmentCacheWriter,
+    ) -> None:
+        self._stream = stream
+        self._writer = writer
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._writer.write(chunk)
+            yield chunk
+
+        self._writer.commit()
+
+    def close(self) -> None:
+        self._writer.discard()
+        self._stream.close()
+
+
+class AsyncTeeStream(httpx.AsyncByteStream):
+    """Асинхронный вариант `TeeStream`."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        writer: AttachmentCacheWriter,
+    ) -> None:
+        self._stream = stream
+        self._writer = writer
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            await asyncio.to_thread(self._writer.write, chunk)
+            yield chunk
+
+        await asyncio.to_thread(self._writer.commit)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._writer.discard)
+        await self._stream.aclose()
@@ -0,0 +1,601 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, TypeVar, Unpack
+
+import httpx
+from pydantic import BaseModel
+
+from helpdesk_client.singleflight import AsyncSingleFlight, SingleFlight
+from helpdesk_client.ttl_cache import TTLCache
+from helpdesk_client.v3.client import (
+    ClientOptions,
+    HelpdeskClient,
+    SyncHelpdeskClient,
+)
+from helpdesk_client.v3.schemas.body import TemplateSchema
+from helpdesk_client.v3.schemas.pagination import PaginationInfo
+from helpdesk_client.v3.schemas.query_params import (
+    CategoryFilterParams,
+    SubcategoryFilterParams,
+    TemplateFilterParams,
+    UrgencyFilterParams,
+    dump_input_data,
+)
+from helpdesk_client.v3.schemas.response import (
+    CategoryPaginationResponseSchema,
+    CategorySchema,
+    PaginationBaseResponse,
+    PaginationResponseSchema,
+    ServiceCategoryPaginationResponseSchema,
+    SubcategoryPaginationResponseSchema,
+    SubcategorySchema,
+    TemplatePaginationResponseSchema,
+    UrgencyPaginationResponseSchema,
+    UrgencySchema,
+)
+from helpdesk_client.v3.schemas.response import (
+    TemplateSchema as TemplateListItemSchema,
+)
+
+T = TypeVar("T")
+ResponseT = TypeVar("ResponseT", bound=PaginationBaseResponse)
+
+CacheKey = tuple[str, Hashable]
+
+_FIRST_INDEX = 1
+_PAGE_FIELDS = frozenset(PaginationInfo.model_fields)
+_PRELOADED_METHODS = {
+    "get_categories": "get_all_categories",
+    "get_service_categories": "get_all_service_categories",
+    "get_subcategories": "get_all_subcategories",
+    "get_templates": "get_all_templates",
+    "get_urgencies": "get_all_urgencies",
+}
+
+
+def _filter_key(method: str, filter_: BaseModel) -> CacheKey:
+    return method, dump_input_data(filter_)
+
+
+def _invalidated_methods(method: str) -> frozenset[str]:
+    """Метод и справочник `get_all_*`, из которого отдаются его страницы"""
+
+    preloaded = _PRELOADED_METHODS.get(method)
+    return frozenset({method} if preloaded is None else {method, preloaded})
+
+
+def _preloaded_page(
+    cache: TTLCache[CacheKey, Any],
+    method: str,
+    filter_: CategoryFilterParams
+    | SubcategoryFilterParams
+    | TemplateFilterParams
+    | UrgencyFilterParams,
+) -> tuple[Sequence[Any], PaginationResponseSchema] | None:
+    """
+    Страница из справочника, загруженного `get_all_*` (`method`), если фильтр задает только пагинацию.
+
+    Фильтры с поиском и сортировкой выполняются на сервере.
+    """
+
+    if not filter_.model_fields_set <= _PAGE_FIELDS or filter_.offset < _FIRST_INDEX:
+        return None
+
+    is_hit, items = cache.get((method, None))
+    if not is_hit or items is None:
+        return None
+
+    start = filter_.offset - _FIRST_INDEX
+    list_info = PaginationResponseSchema(
+        limit=filter_.limit,
+        offset=filter_.offset,
+        can_include_count=filter_.can_include_count,
+        has_next=start + filter_.limit < len(items),
+        total_count=len(items) if filter_.can_include_count else None,
+    )
+    return items[start : start + filter_.limit], list_info
+
+
+class CachedHelpdeskClient(HelpdeskClient):
+    """
+    `HelpdeskClient` с кэшированием справочников: категорий, подкатегорий, срочностей и шаблонов.
+
+    Одновременные промахи по одному ключу выполняют один запрос к ServiceDesk.
+    :param ttl: Время жизни записи в секундах
+    :param maxsize: Максимальное количество записей в кэше
+    :param page_size: Размер страницы при загрузке справочников целиком
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        *,
+        ttl: float | None = 3600,
+        maxsize: int = 1024,
+        page_size: int = 100,
+        **kwargs: Unpack[ClientOptions],
+    ) -> None:
+        super().__init__(http_client, **kwargs)
+        self._cache: TTLCache[CacheKey, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._single_flight = AsyncSingleFlight()
+        self._page_size = page_size
+
+    def invalidate(self, method: str | None = None) -> None:
+        """
+        Сбрасывает кэш метода `method` (например, `get_categories`) или весь кэш.
+
+        Для методов страниц сбрасывается и справочник `get_all_*`, из которого они отдаются.
+        """
+
+        if method is None:
+            self._cache.invalidate()
+            return
+
+        methods = _invalidated_methods(method)
+        self._cache.invalidate(lambda key: key[0] in methods)
+
+    async def warm_up(self, concurrency: int = 10) -> None:
+        """
+        Загружает в кэш все страницы всех справочников и каждый шаблон по id (`get_template`).
+
+        После загрузки запросы страниц справочников без поиска и сортировки выполняются без обращения к серверу.
+        :param concurrency: Количество одновременных запросов шаблонов
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        *_, templates = await asyncio.gather(
+            self.get_all_categories(),
+            self.get_all_service_categories(),
+            self.get_all_subcategories(),
+            self.get_all_urgencies(),
+            self.get_all_templates(),
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(ident: int) -> None:
+            async with semaphore:
+                await self.get_template(ident)
+
+        await asyncio.gather(*(fetch(template.id) for template in templates))
+
+    async def get_all_categories(self) -> Sequence[CategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return await self._cached(
+            ("get_all_categories", None),
+            partial(
+                self._fetch_all,
+                super().get_categories,
+                CategoryFilterParams,
+                lambda response: response.categories,
+            ),
+        )
+
+    async def get_all_service_categories(self) -> Sequence[CategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return await self._cached(
+            ("get_all_service_categories", None),
+            partial(
+                self._fetch_all,
+                super().get_service_categories,
+                CategoryFilterParams,
+                lambda response: response.service_categories,
+            ),
+        )
+
+    async def get_all_subcategories(self) -> Sequence[SubcategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return await self._cached(
+            ("get_all_subcategories", None),
+            partial(
+                self._fetch_all,
+                super().get_subcategories,
+                SubcategoryFilterParams,
+                lambda response: response.subcategories,
+            ),
+        )
+
+    async def get_all_urgencies(self) -> Sequence[UrgencySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return await self._cached(
+            ("get_all_urgencies", None),
+            partial(
+                self._fetch_all,
+                super().get_urgencies,
+                UrgencyFilterParams,
+                lambda response: response.urgencies,
+            ),
+        )
+
+    async def get_all_templates(self) -> Sequence[TemplateListItemSchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return await self._cached(
+            ("get_all_templates", None),
+            partial(
+                self._fetch_all,
+                super().get_templates,
+                TemplateFilterParams,
+                lambda response: response.request_templates,
+            ),
+        )
+
+    async def get_categories(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> CategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_categories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return CategoryPaginationResponseSchema(
+                list_info=list_info,
+                categories=items,
+            )
+
+        return await self._cached(
+            _filter_key("get_categories", filter_),
+            partial(super().get_categories, filter_),
+        )
+
+    async def get_service_categories(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> ServiceCategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_service_categories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return ServiceCategoryPaginationResponseSchema(
+                list_info=list_info,
+                service_categories=items,
+            )
+
+        return await self._cached(
+            _filter_key("get_service_categories", filter_),
+            partial(super().get_service_categories, filter_),
+        )
+
+    async def get_subcategories(
+        self,
+        filter_: SubcategoryFilterParams,
+    ) -> SubcategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_subcategories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return SubcategoryPaginationResponseSchema(
+                list_info=list_info,
+                subcategories=items,
+            )
+
+        return await self._cached(
+            _filter_key("get_subcategories", filter_),
+            partial(super().get_subcategories, filter_),
+        )
+
+    async def get_templates(
+        self,
+        filter_: TemplateFilterParams,
+    ) -> TemplatePaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_templates", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return TemplatePaginationResponseSchema(
+                list_info=list_info,
+                request_templates=items,
+            )
+
+        return await self._cached(
+            _filter_key("get_templates", filter_),
+            partial(super().get_templates, filter_),
+        )
+
+    async def get_template(
+        self,
+        ident: int,
+    ) -> TemplateSchema | None:
+        return await self._cached(
+            ("get_template", ident),
+            partial(super().get_template, ident),
+        )
+
+    async def get_urgencies(
+        self,
+        filter_: UrgencyFilterParams,
+    ) -> UrgencyPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_urgencies", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return UrgencyPaginationResponseSchema(list_info=list_info, urgencies=items)
+
+        return await self._cached(
+            _filter_key("get_urgencies", filter_),
+            partial(super().get_urgencies, filter_),
+        )
+
+    async def _cached(self, key: CacheKey, fetch: Callable[[], Awaitable[T]]) -> T:
+        is_hit, value = self._cache.get(key)
+        if is_hit:
+            return value  # type: ignore[return-value]
+
+        async def fetch_and_store() -> T:
+            value = await fetch()
+            self._cache.set(key, value)
+            return value
+
+        return await self._single_flight.do(key, fetch_and_store)
+
+    async def _fetch_all(
+        self,
+        fetch_page: Callable[[Any], Awaitable[ResponseT]],
+        filter_type: type[
+            CategoryFilterParams
+            | SubcategoryFilterParams
+            | TemplateFilterParams
+            | UrgencyFilterParams
+        ],
+        get_items: Callable[[ResponseT], Sequence[T]],
+    ) -> Sequence[T]:
+        items: list[T] = []
+        offset = _FIRST_INDEX
+        while True:
+            response = await fetch_page(
+                filter_type(limit=self._page_size, offset=offset),
+            )
+            items.extend(get_items(response))
+            if not response.list_info.has_next:
+                return items
+            offset += self._page_size
+
+
+class SyncCachedHelpdeskClient(SyncHelpdeskClient):
+    """
+    `SyncHelpdeskClient` с кэшированием справочников: категорий, подкатегорий, срочностей и шаблонов.
+
+    Одновременные промахи по одному ключу из разных потоков выполняют один запрос к ServiceDesk.
+    :param ttl: Время жизни записи в секундах
+    :param maxsize: Максимальное количество записей в кэше
+    :param page_size: Размер страницы при загрузке справочников целиком
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.Client,
+        *,
+        ttl: float | None = 3600,
+        maxsize: int = 1024,
+        page_size: int = 100,
+        **kwargs: Unpack[ClientOptions],
+    ) -> None:
+        super().__init__(http_client, **kwargs)
+        self._cache: TTLCache[CacheKey, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._single_flight = SingleFlight()
+        self._page_size = page_size
+
+    def invalidate(self, method: str | None = None) -> None:
+        """
+        Сбрасывает кэш метода `method` (например, `get_categories`) или весь кэш.
+
+        Для методов страниц сбрасывается и справочник `get_all_*`, из которого они отдаются.
+        """
+
+        if method is None:
+            self._cache.invalidate()
+            return
+
+        methods = _invalidated_methods(method)
+        self._cache.invalidate(lambda key: key[0] in methods)
+
+    def warm_up(self, concurrency: int = 10) -> None:
+        """
+        Загружает в кэш все страницы всех справочников и каждый шаблон по id (`get_template`).
+
+        После загрузки запросы страниц справочников без поиска и сортировки выполняются без обращения к серверу.
+        :param concurrency: Количество одновременных запросов шаблонов
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        self.get_all_categories()
+        self.get_all_service_categories()
+        self.get_all_subcategories()
+        self.get_all_urgencies()
+        templates = self.get_all_templates()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(copy_context().run, self.get_template, template.id)
+                for template in templates
+            ]
+            for future in futures:
+                future.result()
+
+    def get_all_categories(self) -> Sequence[CategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return self._cached(
+            ("get_all_categories", None),
+            partial(
+                self._fetch_all,
+                super().get_categories,
+                CategoryFilterParams,
+                lambda response: response.categories,
+            ),
+        )
+
+    def get_all_service_categories(self) -> Sequence[CategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return self._cached(
+            ("get_all_service_categories", None),
+            partial(
+                self._fetch_all,
+                super().get_service_categories,
+                CategoryFilterParams,
+                lambda response: response.service_categories,
+            ),
+        )
+
+    def get_all_subcategories(self) -> Sequence[SubcategorySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return self._cached(
+            ("get_all_subcategories", None),
+            partial(
+                self._fetch_all,
+                super().get_subcategories,
+                SubcategoryFilterParams,
+                lambda response: response.subcategories,
+            ),
+        )
+
+    def get_all_urgencies(self) -> Sequence[UrgencySchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return self._cached(
+            ("get_all_urgencies", None),
+            partial(
+                self._fetch_all,
+                super().get_urgencies,
+                UrgencyFilterParams,
+                lambda response: response.urgencies,
+            ),
+        )
+
+    def get_all_templates(self) -> Sequence[TemplateListItemSchema]:
+        """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+        return self._cached(
+            ("get_all_templates", None),
+            partial(
+                self._fetch_all,
+                super().get_templates,
+                TemplateFilterParams,
+                lambda response: response.request_templates,
+            ),
+        )
+
+    def get_categories(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> CategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_categories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return CategoryPaginationResponseSchema(
+                list_info=list_info,
+                categories=items,
+            )
+
+        return self._cached(
+            _filter_key("get_categories", filter_),
+            partial(super().get_categories, filter_),
+        )
+
+    def get_service_categories(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> ServiceCategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_service_categories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return ServiceCategoryPaginationResponseSchema(
+                list_info=list_info,
+                service_categories=items,
+            )
+
+        return self._cached(
+            _filter_key("get_service_categories", filter_),
+            partial(super().get_service_categories, filter_),
+        )
+
+    def get_subcategories(
+        self,
+        filter_: SubcategoryFilterParams,
+    ) -> SubcategoryPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_subcategories", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return SubcategoryPaginationResponseSchema(
+                list_info=list_info,
+                subcategories=items,
+            )
+
+        return self._cached(
+            _filter_key("get_subcategories", filter_),
+            partial(super().get_subcategories, filter_),
+        )
+
+    def get_templates(
+        self,
+        filter_: TemplateFilterParams,
+    ) -> TemplatePaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_templates", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return TemplatePaginationResponseSchema(
+                list_info=list_info,
+                request_templates=items,
+            )
+
+        return self._cached(
+            _filter_key("get_templates", filter_),
+            partial(super().get_templates, filter_),
+        )
+
+    def get_template(
+        self,
+        ident: int,
+    ) -> TemplateSchema | None:
+        return self._cached(
+            ("get_template", ident),
+            partial(super().get_template, ident),
+        )
+
+    def get_urgencies(
+        self,
+        filter_: UrgencyFilterParams,
+    ) -> UrgencyPaginationResponseSchema:
+        preloaded = _preloaded_page(self._cache, "get_all_urgencies", filter_)
+        if preloaded is not None:
+            items, list_info = preloaded
+            return UrgencyPaginationResponseSchema(list_info=list_info, urgencies=items)
+
+        return self._cached(
+            _filter_key("get_urgencies", filter_),
+            partial(super().get_urgencies, filter_),
+        )
+
+    def _cached(self, key: CacheKey, fetch: Callable[[], T]) -> T:
+        is_hit, value = self._cache.get(key)
+        if is_hit:
+            return value  # type: ignore[return-value]
+
+        def fetch_and_store() -> T:
+            value = fetch()
+            self._cache.set(key, value)
+            return value
+
+        return self._single_flight.do(key, fetch_and_store)
+
+    def _fetch_all(
+        self,
+        fetch_page: Callable[[Any], ResponseT],
+        filter_type: type[
+            CategoryFilterParams
+            | SubcategoryFilterParams
+            | TemplateFilterParams
+            | UrgencyFilterParams
+        ],
+        get_items: Callable[[ResponseT], Sequence[T]],
+    ) -> Sequence[T]:
+        items: list[T] = []
+        offset = _FIRST_INDEX
+        while True:
+            response = fetch_page(filter_type(limit=self._page_size, offset=offset))
+            items.extend(get_items(response))
+            if not response.list_info.has_next:
+                return items
+            offset += self._page_size
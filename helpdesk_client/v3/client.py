@@ -1,11 +1,98 @@
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+import asyncio
+import os
+import threading
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from contextvars import copy_context
+from functools import partial, wraps
 from http import HTTPStatus
-from typing import Literal
+from pathlib import Path
+from typing import (
+    Any,
+    Concatenate,
+    Literal,
+    ParamSpec,
+    TypedDict,
+    TypeVar,
+    Unpack,
+)
 
 import httpx
-
+import pydantic
+
+from helpdesk_client.circuit_breaker import CircuitBreaker
+from helpdesk_client.deadline import (
+    AsyncDeadlineByteStream,
+    DeadlineByteStream,
+    async_deadline_scope,
+    current_deadline,
+    deadline,
+    deadline_errors,
+    limit_timeout,
+    time_left,
+    within_deadline,
+)
+from helpdesk_client.enums import CreateFailureEnum, EndpointFamilyEnum
+from helpdesk_client.exceptions import DeadlineExceededError, HelpdeskClientError
+from helpdesk_client.hedging import Hedger, HedgeWindow
+from helpdesk_client.instrumentation import (
+    CallHook,
+    CallRecorder,
+    current_call,
+    decode_json,
+    emit,
+    validate_json,
+)
+from helpdesk_client.rate_limit import RateLimiter
+from helpdesk_client.retry import RetryPolicy, is_unsent_error
+from helpdesk_client.singleflight import AsyncSingleFlight, SingleFlight
+from helpdesk_client.streaming import JsonArrayItemsParser
+from helpdesk_client.transport import family_extensions
+from helpdesk_client.types_ import RawJson
 from helpdesk_client.utils import raise_for_status
-from helpdesk_client.v3.dto import UploadFileDTO
+from helpdesk_client.v3.attachment_cache import (
+    AsyncTeeStream,
+    AttachmentCache,
+    CachedFileStream,
+    TeeStream,
+)
+from helpdesk_client.v3.download import (
+    DEFAULT_RANGE_CHUNK_SIZE,
+    DEFAULT_RANGE_CONCURRENCY,
+    RangedDownload,
+)
+from helpdesk_client.v3.dto import (
+    CreateRequestFailureDTO,
+    CreateRequestsDTO,
+    RequestsByIdsDTO,
+    ResolutionResourcesDTO,
+    UploadFileDTO,
+)
+from helpdesk_client.v3.resolution import resolution_resource_urls
 from helpdesk_client.v3.schemas.body import (
     MainNoteCreateSchema,
     MainRequestCreateUpdateSchema,
@@ -16,13 +103,13 @@ from helpdesk_client.v3.schemas.body import (
 )
 from helpdesk_client.v3.schemas.query_params import (
     CategoryFilterParams,
-    HelpdeskFilter,
     RequestCriteriaFilterPagePaginationParams,
     RequestFilterPagePaginationParams,
     RequestFilterParams,
     SubcategoryFilterParams,
     TemplateFilterParams,
     UrgencyFilterParams,
+    dump_input_data,
 )
 from helpdesk_client.v3.schemas.response import (
     CategoryPaginationResponseSchema,
@@ -31,6 +118,8 @@ from helpdesk_client.v3.schemas.response import (
     MainRequestWithResolutionSchema,
     MainResolutionSchema,
     NoteSchema,
+    PartialRequestListSchema,
+    PartialRequestPaginationResponseSchema,
     RequestAttachmentSchema,
     RequestPaginationResponseSchema,
     RequestSchema,
@@ -41,32 +130,265 @@ from helpdesk_client.v3.schemas.response import (
     TemplatePaginationResponseSchema,
     UrgencyPaginationResponseSchema,
 )
+from helpdesk_client.v3.upload import MultipartUpload, ProgressCallback
 
 from .schemas import MainRequestSchema, RequestListSchema
 from .urls import HelpdeskUrls
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class ClientOptions(TypedDict, total=False):
+    """Необязательные параметры `HelpdeskClient`/`SyncHelpdeskClient` для передачи наследникам"""
+
+    urls: HelpdeskUrls | None
+    retry_policy: RetryPolicy | None
+    rate_limiter: RateLimiter | None
+    coalesce_reads: bool
+    attachment_cache: AttachmentCache | None
+    hooks: Sequence[CallHook]
+    circuit_breaker: CircuitBreaker | None
+    hedger: Hedger | None
+
+
+class RequestKwargs(TypedDict, total=False):
+    """Аргументы запроса httpx, которые методы клиента передают в `_send` и `_stream`"""
+
+    params: Mapping[str, str]
+    data: Mapping[str, str]
+    content: bytes | Iterable[bytes] | AsyncIterable[bytes]
+    headers: Mapping[str, str]
+    timeout: httpx.Timeout
+
+
+_HEDGE_WORKERS = 32
+"""
+Потоки `SyncHelpdeskClient` для запросов с дублированием: исходный и дублирующий запрос занимают по потоку.
+
+Когда свободных потоков нет, запрос выполняется в вызывающем потоке без дублирования, а не ждет в очереди.
+"""
+
+
+def _coalesce_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    def key_part(value: object) -> Hashable:
+        if isinstance(value, pydantic.BaseModel):
+            return dump_input_data(value)
+        return value
+
+    return (
+        name,
+        tuple(key_part(arg) for arg in args),
+        tuple((key, key_part(value)) for key, value in sorted(kwargs.items())),
+    )
+
+
+def _coalesced(
+    method: "Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]",
+) -> "Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]":
+    """Объединяет одновременные одинаковые вызовы метода чтения, если включен `coalesce_reads`"""
+
+    @wraps(method)
+    async def wrapper(
+        self: "HelpdeskClient",
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        if self._coalescer is None:
+            return await method(self, *args, **kwargs)
+
+        return await self._coalescer.do(
+            _coalesce_key(method.__name__, args, kwargs),
+            partial(method, self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def _sync_coalesced(
+    method: "Callable[Concatenate[SyncHelpdeskClient, P], T]",
+) -> "Callable[Concatenate[SyncHelpdeskClient, P], T]":
+    """Объединяет одновременные одинаковые вызовы метода чтения, если включен `coalesce_reads`"""
+
+    @wraps(method)
+    def wrapper(
+        self: "SyncHelpdeskClient",
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        if self._coalescer is None:
+            return method(self, *args, **kwargs)
+
+        return self._coalescer.do(
+            _coalesce_key(method.__name__, args, kwargs),
+            partial(method, self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def _instrumented(
+    endpoint: str,
+) -> "Callable[[Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]], Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]]":
+    """Передает `CallEvent` вызова в `hooks` клиента, без хуков вызывает метод напрямую"""
+
+    def decorator(
+        method: "Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]",
+    ) -> "Callable[Concatenate[HelpdeskClient, P], Coroutine[Any, Any, T]]":
+        @wraps(method)
+        async def wrapper(
+            self: "HelpdeskClient",
+            /,
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> T:
+            if not self._hooks:
+                return await method(self, *args, **kwargs)
+
+            recorder = CallRecorder(method.__name__, endpoint)
+            token = current_call.set(recorder)
+            try:
+                return await method(self, *args, **kwargs)
+            except BaseException as e:
+                recorder.error = e
+                raise
+            finally:
+                current_call.reset(token)
+                emit(self._hooks, recorder)
+
+        return wrapper
+
+    return decorator
+
+
+def _sync_instrumented(
+    endpoint: str,
+) -> "Callable[[Callable[Concatenate[SyncHelpdeskClient, P], T]], Callable[Concatenate[SyncHelpdeskClient, P], T]]":
+    """Передает `CallEvent` вызова в `hooks` клиента, без хуков вызывает метод напрямую"""
+
+    def decorator(
+        method: "Callable[Concatenate[SyncHelpdeskClient, P], T]",
+    ) -> "Callable[Concatenate[SyncHelpdeskClient, P], T]":
+        @wraps(method)
+        def wrapper(
+            self: "SyncHelpdeskClient",
+            /,
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> T:
+            if not self._hooks:
+                return method(self, *args, **kwargs)
+
+            recorder = CallRecorder(method.__name__, endpoint)
+            token = current_call.set(recorder)
+            try:
+                return method(self, *args, **kwargs)
+            except BaseException as e:
+                recorder.error = e
+                raise
+            finally:
+                current_call.reset(token)
+                emit(self._hooks, recorder)
+
+        return wrapper
+
+    return decorator
+
+
+def _create_failure(error: Exception) -> CreateRequestFailureDTO:
+    if is_unsent_error(error):
+        status = CreateFailureEnum.not_submitted
+    elif (
+        isinstance(error, HelpdeskClientError)
+        and error.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+    ):
+        status = CreateFailureEnum.rejected
+    else:
+        status = CreateFailureEnum.unknown
+
+    return CreateRequestFailureDTO(status=status, error=error)
+
 
 class HelpdeskClient:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         http_client: httpx.AsyncClient,
         urls: HelpdeskUrls | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        coalesce_reads: bool = False,
+        attachment_cache: AttachmentCache | None = None,
+        hooks: Sequence[CallHook] = (),
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
     ) -> None:
         self._http_client = http_client
         self._urls = urls or HelpdeskUrls()
-
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = AsyncSingleFlight() if coalesce_reads else None
+        self._attachment_cache = attachment_cache
+        self._hooks = tuple(hooks)
+        self._circuit_breaker = circuit_breaker
+        self._hedger = hedger
+
+    @_coalesced
+    @_instrumented("request_by_id")
     async def get_request(self, ident: int) -> RequestSchema | None:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_by_id(ident)
-        response = await self._http_client.get(url)
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        schema = MainRequestSchema.model_validate(response.json())
+        schema = validate_json(MainRequestSchema, response.content)
         return schema.request
 
+    async def get_requests_by_ids(
+        self,
+        idents: Iterable[int],
+        concurrency: int = 10,
+    ) -> RequestsByIdsDTO:
+        """
+        Получает заявки по id конкурентно, не более `concurrency` запросов одновременно.
+
+        Ошибка получения одной заявки не прерывает остальные и попадает в `RequestsByIdsDTO.errors`.
+        """
+
+        idents = list(dict.fromkeys(idents))
+        semaphore = asyncio.Semaphore(concurrency)
+        requests: dict[int, RequestSchema | None] = {}
+        errors: dict[int, Exception] = {}
+
+        async def fetch(ident: int) -> None:
+            async with semaphore:
+                try:
+                    requests[ident] = await self.get_request(ident)
+                except (
+                    HelpdeskClientError,
+                    httpx.HTTPError,
+                    pydantic.ValidationError,
+                ) as e:
+                    errors[ident] = e
+
+        await asyncio.gather(*(fetch(ident) for ident in idents))
+        return RequestsByIdsDTO(
+            requests={ident: requests[ident] for ident in idents if ident in requests},
+            errors={ident: errors[ident] for ident in idents if ident in errors},
+        )
+
+    @_coalesced
+    @_instrumented("request_by_id")
     async def get_request_with_resolution(
         self,
         ident: int,
@@ -74,28 +396,40 @@ class HelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_by_id(ident)
-        response = await self._http_client.get(url)
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        schema = MainRequestWithResolutionSchema.model_validate(response.json())
+        schema = validate_json(MainRequestWithResolutionSchema, response.content)
         return schema.request
 
+    @_coalesced
+    @_instrumented("requests")
     async def get_requests(
         self,
         filter_: RequestFilterParams,
     ) -> RequestListSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(self._urls.requests, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
         raise_for_status(response)
-        return RequestListSchema.model_validate(response.json())
+        return validate_json(RequestListSchema, response.content)
 
+    @_coalesced
+    @_instrumented("requests")
     async def get_requests_page_paginated(
         self,
         filter_: (
@@ -105,14 +439,136 @@ class HelpdeskClient:
     ) -> RequestPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(self._urls.requests, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
+        raise_for_status(response)
+        return validate_json(RequestPaginationResponseSchema, response.content)
+
+    @_coalesced
+    @_instrumented("requests")
+    async def get_partial_requests(
+        self,
+        filter_: RequestFilterParams,
+    ) -> PartialRequestListSchema:
+        """
+        Получение заявок только с полями из `filter_.fields_required`.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
+        raise_for_status(response)
+        return validate_json(PartialRequestListSchema, response.content)
+
+    @_coalesced
+    @_instrumented("requests")
+    async def get_partial_requests_page_paginated(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> PartialRequestPaginationResponseSchema:
+        """
+        Получение страницы заявок только с полями из `filter_.fields_required`.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
         raise_for_status(response)
-        return RequestPaginationResponseSchema.model_validate(response.json())
+        return validate_json(PartialRequestPaginationResponseSchema, response.content)
 
+    async def iter_requests(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> AsyncIterator[RequestSchema]:
+        """
+        Итерирует заявки по всем страницам, начиная со страницы `filter_.page`.
+
+        Следующая страница запрашивается в фоне, пока вызывающий код обрабатывает текущую.
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        page = filter_.page
+        response = await self.get_requests_page_paginated(filter_)
+        while True:
+            next_response: asyncio.Task[RequestPaginationResponseSchema] | None = None
+            if response.list_info.has_next and response.requests:
+                page += 1
+                next_response = asyncio.create_task(
+                    self.get_requests_page_paginated(
+                        filter_.model_copy(update={"page": page}),
+                    ),
+                )
+
+            try:
+                for request in response.requests:
+                    yield request
+            except BaseException:
+                if next_response is not None:
+                    next_response.cancel()
+                raise
+
+            if next_response is None:
+                return
+            response = await next_response
+
+    async def stream_requests(
+        self,
+        filter_: (
+            RequestFilterParams
+            | RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> AsyncIterator[RequestSchema]:
+        """
+        Возвращает заявки одной страницы по мере получения ответа, не загружая его целиком.
+
+        Память не зависит от размера страницы. `list_info` ответа не разбирается.
+        raises: `HelpdeskClientError`, `httpx.HTTPError`, `pydantic.ValidationError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        async with self._stream(
+            "GET",
+            self._urls.requests,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                raise_for_status(response)
+
+            parser = JsonArrayItemsParser("requests")
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield RequestSchema.model_validate_json(item)
+
+    @_instrumented("requests")
     async def create_request(
         self,
         schema: RequestCreateSchema,
@@ -126,11 +582,64 @@ class HelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = await self._http_client.post(self._urls.requests, data=body)
+        response = await self._send(
+            "POST",
+            self._urls.requests,
+            idempotent=False,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        response_schema = MainRequestSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestSchema, response.content)
         return response_schema.request
 
+    async def create_requests(
+        self,
+        schemas: Iterable[RequestCreateSchema],
+        concurrency: int = 5,
+        batch_timeout: float | None = None,
+    ) -> CreateRequestsDTO:
+        """
+        Создает заявки конкурентно, не более `concurrency` запросов одновременно.
+
+        Результаты и ошибки возвращаются в порядке переданных схем. Создание заявки не повторяется
+        при неизвестном исходе (таймаут ответа, 5xx): такие ошибки помечаются `CreateFailureEnum.unknown`,
+        не отправленные до истечения `batch_timeout` - `CreateFailureEnum.not_submitted`.
+
+        :param schemas: Схемы создаваемых заявок
+        :param concurrency: Количество одновременных запросов
+        :param batch_timeout: Срок выполнения всего пакета в секундах, задается как `deadline`
+        """
+
+        schemas = list(schemas)
+        semaphore = asyncio.Semaphore(concurrency)
+        requests: list[RequestSchema | None] = [None] * len(schemas)
+        failures: dict[int, CreateRequestFailureDTO] = {}
+
+        async def submit(index: int, schema: RequestCreateSchema) -> None:
+            async with semaphore:
+                try:
+                    requests[index] = await self.create_request(schema)
+                except (
+                    HelpdeskClientError,
+                    httpx.HTTPError,
+                    pydantic.ValidationError,
+                ) as e:
+                    failures[index] = _create_failure(e)
+
+        # Ожидание лимита и истекший до отправки срок завершаются
+        # `DeadlineExceededError(sent=False)`, то есть `not_submitted`
+        with nullcontext() if batch_timeout is None else deadline(batch_timeout):
+            await asyncio.gather(
+                *(submit(index, schema) for index, schema in enumerate(schemas)),
+            )
+
+        return CreateRequestsDTO(
+            requests=requests,
+            failures=dict(sorted(failures.items())),
+        )
+
+    @_instrumented("request_by_id")
     async def update_request(
         self,
         ident: int,
@@ -150,11 +659,18 @@ class HelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = await self._http_client.put(url, data=body)
+        response = await self._send(
+            "PUT",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        response_schema = MainRequestSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestSchema, response.content)
         return response_schema.request
 
+    @_instrumented("cancel_request")
     async def cancel_request(
         self,
         request_id: int,
@@ -162,14 +678,21 @@ class HelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.cancel_request(request_id)
-        response = await self._http_client.put(url)
+        response = await self._send(
+            "PUT",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         raise_for_status(response)
 
+    @_instrumented("upload_file")
     async def attach_file_to_request(
         self,
         request_id: int,
         dto: UploadFileDTO,
         file_field: Literal["file", "input_file"] = "input_file",
+        on_progress: ProgressCallback | None = None,
     ) -> RequestAttachmentSchema:
         """
         Прикрепляет файл к заявке.
@@ -177,61 +700,84 @@ class HelpdeskClient:
         :param request_id: Идентификатор заявки
         :param dto: `UploadFileDTO`
         :param file_field: Наименование поля файла. В версии ServiceDesk 14.8 вместо `file` ожидается `input_file`
+        :param on_progress: Вызывается после отправки каждого фрагмента файла
         raises: `HelpdeskClientError`, `httpx.HTTPError`
         """
 
         url = self._urls.upload_file(request_id)
-        files = {file_field: (dto.filename, dto.file, dto.content_type)}
-        response = await self._http_client.put(url, files=files)
+        upload = MultipartUpload(dto, field=file_field, on_progress=on_progress)
+        response = await self._send(
+            "PUT",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.uploads,
+            replayable=upload.is_replayable,
+            content=upload.async_content(),
+            headers=upload.headers,
+        )
         raise_for_status(response)
-        response_schema = MainRequestAttachmentSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestAttachmentSchema, response.content)
         return response_schema.attachment
 
+    @_coalesced
+    @_instrumented("categories")
     async def get_categories(
         self,
         filter_: CategoryFilterParams,
     ) -> CategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(self._urls.categories, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.categories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return CategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(CategoryPaginationResponseSchema, response.content)
 
+    @_coalesced
+    @_instrumented("service_categories")
     async def get_service_categories(
         self,
         filter_: CategoryFilterParams,
     ) -> ServiceCategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
             self._urls.service_categories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
             params=params,
         )
         raise_for_status(response)
-        return ServiceCategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(ServiceCategoryPaginationResponseSchema, response.content)
 
+    @_coalesced
+    @_instrumented("subcategories")
     async def get_subcategories(
         self,
         filter_: SubcategoryFilterParams,
     ) -> SubcategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(self._urls.subcategories, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.subcategories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return SubcategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(SubcategoryPaginationResponseSchema, response.content)
 
+    @_coalesced
+    @_instrumented("request_template")
     async def get_templates(
         self,
         filter_: TemplateFilterParams,
@@ -239,14 +785,19 @@ class HelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_template
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(url, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return TemplatePaginationResponseSchema.model_validate(response.json())
+        return validate_json(TemplatePaginationResponseSchema, response.content)
 
+    @_coalesced
+    @_instrumented("template_by_id")
     async def get_template(
         self,
         ident: int,
@@ -254,27 +805,167 @@ class HelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.template_by_id(ident)
-        response = await self._http_client.get(url)
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        return TemplateSchema.model_validate(response.json())
+        return validate_json(TemplateSchema, response.content)
 
+    @_coalesced
+    @_instrumented("urgencies")
     async def get_urgencies(
         self,
         filter_: UrgencyFilterParams,
     ) -> UrgencyPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = await self._http_client.get(self._urls.urgencies, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            self._urls.urgencies,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return UrgencyPaginationResponseSchema.model_validate(response.json())
+        return validate_json(UrgencyPaginationResponseSchema, response.content)
+
+    @_coalesced
+    @_instrumented("requests")
+    async def get_requests_raw(
+        self,
+        filter_: RequestFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_requests`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.requests,
+            filter_,
+            family=EndpointFamilyEnum.requests,
+        )
+
+    @_coalesced
+    @_instrumented("requests")
+    async def get_requests_page_paginated_raw(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> RawJson:
+        """
+        То же, что `get_requests_page_paginated`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.requests,
+            filter_,
+            family=EndpointFamilyEnum.requests,
+        )
+
+    @_coalesced
+    @_instrumented("categories")
+    async def get_categories_raw(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_categories`, но возвращает декодированный JSON без валидации pydantic.
 
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.categories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_coalesced
+    @_instrumented("service_categories")
+    async def get_service_categories_raw(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_service_categories`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.service_categories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_coalesced
+    @_instrumented("subcategories")
+    async def get_subcategories_raw(
+        self,
+        filter_: SubcategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_subcategories`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.subcategories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_coalesced
+    @_instrumented("request_template")
+    async def get_templates_raw(
+        self,
+        filter_: TemplateFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_templates`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.request_template,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_coalesced
+    @_instrumented("urgencies")
+    async def get_urgencies_raw(
+        self,
+        filter_: UrgencyFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_urgencies`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return await self._get_list_raw(
+            self._urls.urgencies,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_instrumented("create_note")
     async def add_note(
         self,
         request_id: int,
@@ -290,16 +981,24 @@ class HelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = await self._http_client.post(url, data=body)
+        response = await self._send(
+            "POST",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        return MainNoteSchema.model_validate(response.json()).note
+        return validate_json(MainNoteSchema, response.content).note
 
+    @_instrumented("upload_note_file")
     async def attach_file_to_note(
         self,
         request_id: int,
         note_id: int,
         dto: UploadFileDTO,
         file_field: Literal["file", "input_file"] = "input_file",
+        on_progress: ProgressCallback | None = None,
     ) -> RequestAttachmentSchema:
         """
         Прикрепляет файл к комментарию/обсуждению.
@@ -308,16 +1007,27 @@ class HelpdeskClient:
         :param note_id: Идентификатор комментария/обсуждения
         :param dto: `UploadFileDTO`
         :param file_field: Наименование поля файла. В версии ServiceDesk 14.8 вместо `file` ожидается `input_file`
+        :param on_progress: Вызывается после отправки каждого фрагмента файла
         raises: `HelpdeskClientError`, `httpx.HTTPError`
         """
 
         url = self._urls.upload_note_file(request_id=request_id, note_id=note_id)
-        files = {file_field: (dto.filename, dto.file, dto.content_type)}
-        response = await self._http_client.put(url, files=files)
+        upload = MultipartUpload(dto, field=file_field, on_progress=on_progress)
+        response = await self._send(
+            "PUT",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.uploads,
+            replayable=upload.is_replayable,
+            content=upload.async_content(),
+            headers=upload.headers,
+        )
         raise_for_status(response)
-        response_schema = MainRequestAttachmentSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestAttachmentSchema, response.content)
         return response_schema.attachment
 
+    @_coalesced
+    @_instrumented("resolutions")
     async def get_resolution(
         self,
         request_id: int,
@@ -325,66 +1035,660 @@ class HelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.resolutions(request_id)
-        response = await self._http_client.get(url)
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        return MainResolutionSchema.model_validate(response.json()).resolution
+        return validate_json(MainResolutionSchema, response.content).resolution
+
+    async def get_resolution_resources(
+        self,
+        resolution: ResolutionSchema,
+        concurrency: int = 8,
+        directory: Path | None = None,
+    ) -> ResolutionResourcesDTO:
+        """
+        Скачивает изображения из `raw_content` и вложения решения конкурентно, не более `concurrency` одновременно.
+
+        Ошибка скачивания одного ресурса не прерывает остальные и попадает в `ResolutionResourcesDTO.errors`.
+        :param resolution: Решение из `get_resolution`
+        :param concurrency: Количество одновременных скачиваний
+        :param directory: Каталог, в который ресурсы скачиваются через `download_to` вместо памяти
+        """
+
+        urls = resolution_resource_urls(resolution, self._http_client.base_url)
+        semaphore = asyncio.Semaphore(concurrency)
+        resources: dict[str, bytes | Path | None] = {}
+        errors: dict[str, Exception] = {}
+
+        async def fetch(url: str, size: int | None) -> None:
+            async with semaphore:
+                try:
+                    if directory is None:
+                        resources[url] = await self.download(url, size)
+                    else:
+                        resources[url] = await self.download_to(
+                            url,
+                            directory / AttachmentCache.key(url),
+                            expected_size=size,
+                        )
+                except (HelpdeskClientError, httpx.HTTPError) as e:
+                    errors[url] = e
+
+        await asyncio.gather(*(fetch(url, size) for url, size in urls.items()))
+        return ResolutionResourcesDTO(
+            resources={url: resources[url] for url in urls if url in resources},
+            errors={url: errors[url] for url in urls if url in errors},
+        )
 
-    async def download(self, content_url: str) -> bytes | None:
+    @_coalesced
+    @_instrumented("content_url")
+    async def download(
+        self,
+        content_url: str,
+        size: int | None = None,
+    ) -> bytes | None:
         """
         Скачивает ресурс по указанному URL.
 
         :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
+        :param size: Ожидаемый размер в байтах (`RequestAttachmentSchema.size.value`), запись кэша вложений другого размера не используется
         raises: `HelpdeskClientError`, `httpx.HTTPError`
         """
 
         if content_url.startswith("/"):
             content_url = content_url.removeprefix("/")
 
-        response = await self._http_client.get(content_url)
+        if self._attachment_cache is not None:
+            content = await asyncio.to_thread(
+                self._attachment_cache.read,
+                content_url,
+                size,
+            )
+            if content is not None:
+                return content
+
+        response = await self._send(
+            "GET",
+            content_url,
+            idempotent=True,
+            family=EndpointFamilyEnum.downloads,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
+        if self._attachment_cache is not None:
+            await asyncio.to_thread(
+                self._attachment_cache.put,
+                content_url,
+                response.content,
+                size,
+            )
+
         return response.content
 
-    def stream(self, content_url: str) -> AbstractAsyncContextManager[httpx.Response]:
+    def stream(
+        self,
+        content_url: str,
+        size: int | None = None,
+    ) -> AbstractAsyncContextManager[httpx.Response]:
         """
         Стримит ресурс по указанному URL.
 
         :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
-        raises: `httpx.HTTPError`
+        :param size: Ожидаемый размер в байтах (`RequestAttachmentSchema.size.value`), запись кэша вложений другого размера не используется
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        if content_url.startswith("/"):
+            content_url = content_url.removeprefix("/")
+
+        if self._attachment_cache is None:
+            return self._stream(
+                "GET",
+                content_url,
+                family=EndpointFamilyEnum.downloads,
+            )
+
+        return self._cached_stream(self._attachment_cache, content_url, size)
+
+    @asynccontextmanager
+    async def _cached_stream(
+        self,
+        cache: AttachmentCache,
+        content_url: str,
+        size: int | None,
+    ) -> AsyncIterator[httpx.Response]:
+        file = await asyncio.to_thread(cache.open, content_url, size)
+        if file is not None:
+            response = httpx.Response(
+                HTTPStatus.OK,
+                headers={"Content-Length": str(os.fstat(file.fileno()).st_size)},
+                stream=CachedFileStream(file),
+                request=self._http_client.build_request("GET", content_url),
+            )
+            try:
+                yield response
+            finally:
+                await response.aclose()
+            return
+
+        async with self._stream(
+            "GET",
+            content_url,
+            family=EndpointFamilyEnum.downloads,
+        ) as response:
+            if response.status_code == HTTPStatus.OK:
+                if response.is_stream_consumed:
+                    await asyncio.to_thread(
+                        cache.put,
+                        content_url,
+                        response.content,
+                        size,
+                    )
+                elif "Content-Encoding" not in response.headers and isinstance(
+                    response.stream,
+                    httpx.AsyncByteStream,
+                ):
+                    writer = await asyncio.to_thread(cache.writer, content_url, size)
+                    response.stream = AsyncTeeStream(response.stream, writer)
+
+            yield response
+
+    @_instrumented("content_url")
+    async def download_to(
+        self,
+        content_url: str,
+        path: Path,
+        *,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_RANGE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_RANGE_CONCURRENCY,
+    ) -> Path | None:
+        """
+        Скачивает ресурс по указанному URL в файл частями (HTTP Range), которые загружаются параллельно.
+
+        В памяти находится не больше `concurrency` частей. Если скачивание прервалось,
+        повторный вызов с тем же `path` докачивает недостающие части.
+        Если сервер не поддерживает Range, файл скачивается целиком одним потоком.
+
+        :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
+        :param path: Путь к файлу. Части сохраняются в `<path>.part`, состояние - в `<path>.part.json`
+        :param expected_size: Ожидаемый размер в байтах, например `RequestAttachmentSchema.size.value`
+        :param chunk_size: Размер части в байтах
+        :param concurrency: Количество одновременно скачиваемых частей
+        :return: `path` или `None`, если ресурс не найден
+        raises: `HelpdeskClientError`, `DownloadIntegrityError`, `httpx.HTTPError`
         """
 
         if content_url.startswith("/"):
             content_url = content_url.removeprefix("/")
 
-        return self._http_client.stream("GET", content_url)
+        download = RangedDownload(path, content_url, chunk_size, expected_size)
+        download.open()
+        try:
+            if not download.is_started:
+                status_code = await self._download_first_chunk(content_url, download)
+                if status_code is None:
+                    download.discard()
+                    return None
+
+                if not download.is_started:
+                    return await asyncio.to_thread(download.finish, status_code)
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def download_chunk(index: int, range_header: str) -> None:
+                async with semaphore:
+                    response = await self._send(
+                        "GET",
+                        content_url,
+                        idempotent=True,
+                        family=EndpointFamilyEnum.downloads,
+                        headers={"Range": range_header},
+                    )
+                    raise_for_status(response)
+                    await asyncio.to_thread(download.complete_chunk, index, response)
+
+            tasks = [
+                asyncio.create_task(download_chunk(index, range_header))
+                for index, range_header in download.pending()
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            return await asyncio.to_thread(download.finish, HTTPStatus.PARTIAL_CONTENT)
+        finally:
+            download.close()
+
+    async def _download_first_chunk(
+        self,
+        content_url: str,
+        download: RangedDownload,
+    ) -> int | None:
+        """Скачивает первую часть и узнает размер файла. Возвращает `None`, если ресурс не найден."""
+
+        async with self._stream(
+            "GET",
+            content_url,
+            family=EndpointFamilyEnum.downloads,
+            headers={"Range": download.first_range_header()},
+        ) as response:
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return None
+
+            if download.is_empty(response):
+                return response.status_code
+
+            if not response.is_success:
+                await response.aread()
+                raise_for_status(response)
+
+            is_ranged = download.start(response)
+            received = 0
+            async for chunk in response.aiter_bytes():
+                await asyncio.to_thread(download.write, received, chunk)
+                received += len(chunk)
+
+        if is_ranged:
+            download.complete_first_chunk(response.status_code, received)
+
+        return response.status_code
+
+    async def _get_list_raw(
+        self,
+        url: str,
+        filter_: (
+            RequestFilterParams
+            | RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+            | CategoryFilterParams
+            | SubcategoryFilterParams
+            | TemplateFilterParams
+            | UrgencyFilterParams
+        ),
+        *,
+        family: EndpointFamilyEnum,
+    ) -> RawJson:
+        params = {"input_data": dump_input_data(filter_)}
+        response = await self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=family,
+            params=params,
+        )
+        raise_for_status(response)
+        return decode_json(response.content)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool,
+        family: EndpointFamilyEnum,
+        replayable: bool = True,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        window = self._hedge_window(method, idempotent=idempotent, family=family)
+        request = self._request if window is None else partial(self._hedged, window)
+        # Тело из одноразового источника нельзя отправить повторно
+        if self._retry_policy is None or not replayable:
+            return await request(method, url, family=family, **kwargs)
+
+        attempts = self._retry_policy.attempts(idempotent=idempotent)
+        with attempts.time_limit():
+            while True:
+                try:
+                    response = await request(method, url, family=family, **kwargs)
+                except httpx.TransportError as e:
+                    delay = within_deadline(attempts.delay_after_error(e))
+                    if delay is None:
+                        raise
+                else:
+                    delay = within_deadline(attempts.delay_after_response(response))
+                    if delay is None:
+                        return response
+
+                await asyncio.sleep(delay)
+                if self._hooks:
+                    self._record_retry()
+
+    async def _hedged(
+        self,
+        window: HedgeWindow,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        """
+        Отправляет дублирующий запрос, если ответ не получен за задержку `window`.
+
+        Для отмененного исходного запроса в `window` записывается время его ожидания - нижняя граница времени ответа.
+        """
+
+        attempt = partial(
+            self._timed_request,
+            window,
+            method,
+            url,
+            family=family,
+            **kwargs,
+        )
+        delay = window.delay()
+        if delay is None:
+            return await attempt()
+
+        start = time.perf_counter()
+        primary = asyncio.create_task(attempt())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and window.acquire():
+                pending.add(asyncio.create_task(attempt()))
+                self._record_hedge(won=False)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            window.record_win()
+                            self._record_hedge(won=True)
+                        return task.result()
+
+            return primary.result()
+        finally:
+            if primary in pending:
+                # Без этого замера медленные ответы выпадают из окна, и задержка занижается
+                window.record_latency(time.perf_counter() - start)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _timed_request(
+        self,
+        window: HedgeWindow,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self._request(method, url, family=family, **kwargs)
+        window.record_latency(time.perf_counter() - start)
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        if self._circuit_breaker is None:
+            return await self._request_http(method, url, family=family, **kwargs)
+
+        call = self._circuit_breaker.acquire(family)
+        try:
+            response = await self._request_http(method, url, family=family, **kwargs)
+        except BaseException as e:
+            call.record_error(e)
+            raise
+
+        call.record_response(response)
+        return response
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> AsyncIterator[httpx.Response]:
+        expires_at = current_deadline()
+        if expires_at is not None:
+            time_left(expires_at)
+
+        call = (
+            None
+            if self._circuit_breaker is None
+            else self._circuit_breaker.acquire(family)
+        )
+        try:
+            with deadline_errors(expires_at):
+                if self._rate_limiter is not None:
+                    async with async_deadline_scope(expires_at, sent=False):
+                        await self._rate_limiter.acquire(family)
+
+                async with AsyncExitStack() as stack:
+                    start = time.perf_counter()
+                    async with async_deadline_scope(expires_at, sent=True):
+                        if expires_at is not None:
+                            kwargs["timeout"] = self._deadline_timeout(expires_at)
+
+                        response = await stack.enter_async_context(
+                            self._http_client.stream(
+                                method,
+                                url,
+                                extensions=family_extensions(family),
+                                **kwargs,
+                            ),
+                        )
+
+                    if expires_at is not None:
+                        response.stream = AsyncDeadlineByteStream(
+                            response.stream,  # type: ignore[arg-type]
+                            expires_at,
+                        )
+                    recorder = current_call.get()
+                    if recorder is not None:
+                        recorder.record_response(response, time.perf_counter() - start)
+                    if call is not None:
+                        call.record_response(response)
+                    yield response
+        except BaseException as e:
+            if call is not None:
+                call.record_error(e)
+            raise
+
+    async def _request_http(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        expires_at = current_deadline()
+        if expires_at is None:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(family)
+
+            return await self._send_http(method, url, family=family, **kwargs)
+
+        time_left(expires_at)
+        if self._rate_limiter is not None:
+            async with async_deadline_scope(expires_at, sent=False):
+                await self._rate_limiter.acquire(family)
+
+        with deadline_errors(expires_at):
+            async with async_deadline_scope(expires_at, sent=True):
+                kwargs["timeout"] = self._deadline_timeout(expires_at)
+                return await self._send_http(method, url, family=family, **kwargs)
+
+    async def _send_http(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        if not self._hooks:
+            return await self._http_client.request(
+                method,
+                url,
+                extensions=family_extensions(family),
+                **kwargs,
+            )
+
+        start = time.perf_counter()
+        response = await self._http_client.request(
+            method,
+            url,
+            extensions=family_extensions(family),
+            **kwargs,
+        )
+        recorder = current_call.get()
+        if recorder is not None:
+            recorder.record_response(response, time.perf_counter() - start)
+
+        return response
+
+    def _deadline_timeout(self, expires_at: float) -> httpx.Timeout:
+        """Таймаут клиента, ограниченный оставшимся временем. raises: `DeadlineExceededError`"""
+
+        return limit_timeout(self._http_client.timeout, time_left(expires_at))
+
+    def _hedge_window(
+        self,
+        method: str,
+        *,
+        idempotent: bool,
+        family: EndpointFamilyEnum,
+    ) -> HedgeWindow | None:
+        if self._hedger is None or not idempotent or method != "GET":
+            return None
+
+        return self._hedger.window(family)
+
+    @staticmethod
+    def _record_retry() -> None:
+        recorder = current_call.get()
+        if recorder is not None:
+            recorder.retries += 1
+
+    @staticmethod
+    def _record_hedge(*, won: bool) -> None:
+        recorder = current_call.get()
+        if recorder is None:
+            return
+
+        if won:
+            recorder.hedges_won += 1
+        else:
+            recorder.hedges += 1
 
 
 class SyncHelpdeskClient:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         http_client: httpx.Client,
         urls: HelpdeskUrls | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        coalesce_reads: bool = False,
+        attachment_cache: AttachmentCache | None = None,
+        hooks: Sequence[CallHook] = (),
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
     ) -> None:
         self._http_client = http_client
         self._urls = urls or HelpdeskUrls()
-
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = SingleFlight() if coalesce_reads else None
+        self._attachment_cache = attachment_cache
+        self._hooks = tuple(hooks)
+        self._circuit_breaker = circuit_breaker
+        self._hedger = hedger
+        self._hedge_lock = threading.Lock()
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_slots = threading.BoundedSemaphore(_HEDGE_WORKERS)
+
+    def close(self) -> None:
+        """Останавливает пул потоков дублирующих запросов, `http_client` не закрывается"""
+
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @_sync_coalesced
+    @_sync_instrumented("request_by_id")
     def get_request(self, ident: int) -> RequestSchema | None:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_by_id(ident)
-        response = self._http_client.get(url)
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        schema = MainRequestSchema.model_validate(response.json())
+        schema = validate_json(MainRequestSchema, response.content)
         return schema.request
 
+    def get_requests_by_ids(
+        self,
+        idents: Iterable[int],
+        concurrency: int = 10,
+    ) -> RequestsByIdsDTO:
+        """
+        Получает заявки по id в пуле из `concurrency` потоков.
+
+        Ошибка получения одной заявки не прерывает остальные и попадает в `RequestsByIdsDTO.errors`.
+        """
+
+        idents = list(dict.fromkeys(idents))
+        requests: dict[int, RequestSchema | None] = {}
+        errors: dict[int, Exception] = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                ident: executor.submit(copy_context().run, self.get_request, ident)
+                for ident in idents
+            }
+            for ident, future in futures.items():
+                try:
+                    requests[ident] = future.result()
+                except (
+                    HelpdeskClientError,
+                    httpx.HTTPError,
+                    pydantic.ValidationError,
+                ) as e:
+                    errors[ident] = e
+
+        return RequestsByIdsDTO(requests=requests, errors=errors)
+
+    @_sync_coalesced
+    @_sync_instrumented("request_by_id")
     def get_request_with_resolution(
         self,
         ident: int,
@@ -392,28 +1696,40 @@ class SyncHelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_by_id(ident)
-        response = self._http_client.get(url)
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        schema = MainRequestWithResolutionSchema.model_validate(response.json())
+        schema = validate_json(MainRequestWithResolutionSchema, response.content)
         return schema.request
 
+    @_sync_coalesced
+    @_sync_instrumented("requests")
     def get_requests(
         self,
         filter_: RequestFilterParams,
     ) -> RequestListSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(self._urls.requests, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
         raise_for_status(response)
-        return RequestListSchema.model_validate(response.json())
+        return validate_json(RequestListSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("requests")
     def get_requests_page_paginated(
         self,
         filter_: (
@@ -423,14 +1739,134 @@ class SyncHelpdeskClient:
     ) -> RequestPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(self._urls.requests, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
         raise_for_status(response)
-        return RequestPaginationResponseSchema.model_validate(response.json())
+        return validate_json(RequestPaginationResponseSchema, response.content)
+
+    @_sync_coalesced
+    @_sync_instrumented("requests")
+    def get_partial_requests(
+        self,
+        filter_: RequestFilterParams,
+    ) -> PartialRequestListSchema:
+        """
+        Получение заявок только с полями из `filter_.fields_required`.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
+        raise_for_status(response)
+        return validate_json(PartialRequestListSchema, response.content)
+
+    @_sync_coalesced
+    @_sync_instrumented("requests")
+    def get_partial_requests_page_paginated(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> PartialRequestPaginationResponseSchema:
+        """
+        Получение страницы заявок только с полями из `filter_.fields_required`.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.requests,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        )
+        raise_for_status(response)
+        return validate_json(PartialRequestPaginationResponseSchema, response.content)
+
+    def iter_requests(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> Iterator[RequestSchema]:
+        """
+        Итерирует заявки по всем страницам, начиная со страницы `filter_.page`.
+
+        Следующая страница запрашивается в фоновом потоке, пока вызывающий код обрабатывает текущую.
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = filter_.page
+            response = self.get_requests_page_paginated(filter_)
+            while True:
+                next_response: Future[RequestPaginationResponseSchema] | None = None
+                if response.list_info.has_next and response.requests:
+                    page += 1
+                    next_response = executor.submit(
+                        copy_context().run,
+                        self.get_requests_page_paginated,
+                        filter_.model_copy(update={"page": page}),
+                    )
+
+                yield from response.requests
+
+                if next_response is None:
+                    return
+                response = next_response.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stream_requests(
+        self,
+        filter_: (
+            RequestFilterParams
+            | RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> Iterator[RequestSchema]:
+        """
+        Возвращает заявки одной страницы по мере получения ответа, не загружая его целиком.
+
+        Память не зависит от размера страницы. `list_info` ответа не разбирается.
+        raises: `HelpdeskClientError`, `httpx.HTTPError`, `pydantic.ValidationError`
+        """
+
+        params = {"input_data": dump_input_data(filter_)}
+        with self._stream(
+            "GET",
+            self._urls.requests,
+            family=EndpointFamilyEnum.requests,
+            params=params,
+        ) as response:
+            if not response.is_success:
+                response.read()
+                raise_for_status(response)
+
+            parser = JsonArrayItemsParser("requests")
+            for chunk in response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield RequestSchema.model_validate_json(item)
 
+    @_sync_instrumented("requests")
     def create_request(
         self,
         schema: RequestCreateSchema,
@@ -444,11 +1880,75 @@ class SyncHelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = self._http_client.post(self._urls.requests, data=body)
+        response = self._send(
+            "POST",
+            self._urls.requests,
+            idempotent=False,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        response_schema = MainRequestSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestSchema, response.content)
         return response_schema.request
 
+    def create_requests(
+        self,
+        schemas: Iterable[RequestCreateSchema],
+        concurrency: int = 5,
+        batch_timeout: float | None = None,
+    ) -> CreateRequestsDTO:
+        """
+        Создает заявки в пуле из `concurrency` потоков.
+
+        Результаты и ошибки возвращаются в порядке переданных схем. Создание заявки не повторяется
+        при неизвестном исходе (таймаут ответа, 5xx): такие ошибки помечаются `CreateFailureEnum.unknown`,
+        не отправленные до истечения `batch_timeout` - `CreateFailureEnum.not_submitted`.
+
+        :param schemas: Схемы создаваемых заявок
+        :param concurrency: Количество одновременных запросов
+        :param batch_timeout: Срок выполнения всего пакета в секундах, задается как `deadline`. Запросы, не завершившиеся к сроку,
+            продолжают выполняться в фоне, их результат не возвращается
+        """
+
+        schemas = list(schemas)
+        requests: list[RequestSchema | None] = [None] * len(schemas)
+        failures: dict[int, CreateRequestFailureDTO] = {}
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            with nullcontext() if batch_timeout is None else deadline(batch_timeout):
+                expires_at = current_deadline()
+                futures = [
+                    executor.submit(copy_context().run, self.create_request, schema)
+                    for schema in schemas
+                ]
+
+            for index, future in enumerate(futures):
+                remaining = (
+                    None
+                    if expires_at is None
+                    else max(expires_at - time.monotonic(), 0)
+                )
+                try:
+                    requests[index] = future.result(timeout=remaining)
+                except TimeoutError as e:
+                    status = (
+                        CreateFailureEnum.not_submitted
+                        if future.cancel()
+                        else CreateFailureEnum.unknown
+                    )
+                    failures[index] = CreateRequestFailureDTO(status=status, error=e)
+                except (
+                    HelpdeskClientError,
+                    httpx.HTTPError,
+                    pydantic.ValidationError,
+                ) as e:
+                    failures[index] = _create_failure(e)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return CreateRequestsDTO(requests=requests, failures=failures)
+
+    @_sync_instrumented("request_by_id")
     def update_request(
         self,
         ident: int,
@@ -468,11 +1968,18 @@ class SyncHelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = self._http_client.put(url, data=body)
+        response = self._send(
+            "PUT",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        response_schema = MainRequestSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestSchema, response.content)
         return response_schema.request
 
+    @_sync_instrumented("cancel_request")
     def cancel_request(
         self,
         request_id: int,
@@ -480,14 +1987,21 @@ class SyncHelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.cancel_request(request_id)
-        response = self._http_client.put(url)
+        response = self._send(
+            "PUT",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         raise_for_status(response)
 
+    @_sync_instrumented("upload_file")
     def attach_file_to_request(
         self,
         request_id: int,
         dto: UploadFileDTO,
         file_field: Literal["file", "input_file"] = "input_file",
+        on_progress: ProgressCallback | None = None,
     ) -> RequestAttachmentSchema:
         """
         Прикрепляет файл к заявке.
@@ -495,61 +2009,83 @@ class SyncHelpdeskClient:
         :param request_id: Идентификатор заявки
         :param dto: `UploadFileDTO`
         :param file_field: Наименование поля файла. В версии ServiceDesk 14.8 вместо `file` ожидается `input_file`
-        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        :param on_progress: Вызывается после отправки каждого фрагмента файла
+        raises: `HelpdeskClientError`, `httpx.HTTPError`, `ValueError`
         """
 
         url = self._urls.upload_file(request_id)
-        files = {file_field: (dto.filename, dto.file, dto.content_type)}
-        response = self._http_client.put(url, files=files)
+        upload = MultipartUpload(dto, field=file_field, on_progress=on_progress)
+        response = self._send(
+            "PUT",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.uploads,
+            content=upload.sync_content(),
+            headers=upload.headers,
+        )
         raise_for_status(response)
-        response_schema = MainRequestAttachmentSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestAttachmentSchema, response.content)
         return response_schema.attachment
 
+    @_sync_coalesced
+    @_sync_instrumented("categories")
     def get_categories(
         self,
         filter_: CategoryFilterParams,
     ) -> CategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(self._urls.categories, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.categories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return CategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(CategoryPaginationResponseSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("service_categories")
     def get_service_categories(
         self,
         filter_: CategoryFilterParams,
     ) -> ServiceCategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
             self._urls.service_categories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
             params=params,
         )
         raise_for_status(response)
-        return ServiceCategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(ServiceCategoryPaginationResponseSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("subcategories")
     def get_subcategories(
         self,
         filter_: SubcategoryFilterParams,
     ) -> SubcategoryPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(self._urls.subcategories, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.subcategories,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return SubcategoryPaginationResponseSchema.model_validate(response.json())
+        return validate_json(SubcategoryPaginationResponseSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("request_template")
     def get_templates(
         self,
         filter_: TemplateFilterParams,
@@ -557,14 +2093,19 @@ class SyncHelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.request_template
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(url, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return TemplatePaginationResponseSchema.model_validate(response.json())
+        return validate_json(TemplatePaginationResponseSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("template_by_id")
     def get_template(
         self,
         ident: int,
@@ -572,27 +2113,167 @@ class SyncHelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.template_by_id(ident)
-        response = self._http_client.get(url)
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        return TemplateSchema.model_validate(response.json())
+        return validate_json(TemplateSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("urgencies")
     def get_urgencies(
         self,
         filter_: UrgencyFilterParams,
     ) -> UrgencyPaginationResponseSchema:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
-        schema = HelpdeskFilter(list_info=filter_)
-        params = {
-            "input_data": schema.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-        response = self._http_client.get(self._urls.urgencies, params=params)
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            self._urls.urgencies,
+            idempotent=True,
+            family=EndpointFamilyEnum.reference,
+            params=params,
+        )
         raise_for_status(response)
-        return UrgencyPaginationResponseSchema.model_validate(response.json())
+        return validate_json(UrgencyPaginationResponseSchema, response.content)
 
+    @_sync_coalesced
+    @_sync_instrumented("requests")
+    def get_requests_raw(
+        self,
+        filter_: RequestFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_requests`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.requests,
+            filter_,
+            family=EndpointFamilyEnum.requests,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("requests")
+    def get_requests_page_paginated_raw(
+        self,
+        filter_: (
+            RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+        ),
+    ) -> RawJson:
+        """
+        То же, что `get_requests_page_paginated`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.requests,
+            filter_,
+            family=EndpointFamilyEnum.requests,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("categories")
+    def get_categories_raw(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_categories`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.categories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("service_categories")
+    def get_service_categories_raw(
+        self,
+        filter_: CategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_service_categories`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.service_categories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("subcategories")
+    def get_subcategories_raw(
+        self,
+        filter_: SubcategoryFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_subcategories`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.subcategories,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("request_template")
+    def get_templates_raw(
+        self,
+        filter_: TemplateFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_templates`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.request_template,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_sync_coalesced
+    @_sync_instrumented("urgencies")
+    def get_urgencies_raw(
+        self,
+        filter_: UrgencyFilterParams,
+    ) -> RawJson:
+        """
+        То же, что `get_urgencies`, но возвращает декодированный JSON без валидации pydantic.
+
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        """
+
+        return self._get_list_raw(
+            self._urls.urgencies,
+            filter_,
+            family=EndpointFamilyEnum.reference,
+        )
+
+    @_sync_instrumented("create_note")
     def add_note(
         self,
         request_id: int,
@@ -608,16 +2289,24 @@ class SyncHelpdeskClient:
                 exclude_unset=True,
             ),
         }
-        response = self._http_client.post(url, data=body)
+        response = self._send(
+            "POST",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.requests,
+            data=body,
+        )
         raise_for_status(response)
-        return MainNoteSchema.model_validate(response.json()).note
+        return validate_json(MainNoteSchema, response.content).note
 
+    @_sync_instrumented("upload_note_file")
     def attach_file_to_note(
         self,
         request_id: int,
         note_id: int,
         dto: UploadFileDTO,
         file_field: Literal["file", "input_file"] = "input_file",
+        on_progress: ProgressCallback | None = None,
     ) -> RequestAttachmentSchema:
         """
         Прикрепляет файл к комментарию/обсуждению.
@@ -626,16 +2315,26 @@ class SyncHelpdeskClient:
         :param note_id: Идентификатор комментария/обсуждения
         :param dto: `UploadFileDTO`
         :param file_field: Наименование поля файла. В версии ServiceDesk 14.8 вместо `file` ожидается `input_file`
-        raises: `HelpdeskClientError`, `httpx.HTTPError`
+        :param on_progress: Вызывается после отправки каждого фрагмента файла
+        raises: `HelpdeskClientError`, `httpx.HTTPError`, `ValueError`
         """
 
         url = self._urls.upload_note_file(request_id=request_id, note_id=note_id)
-        files = {file_field: (dto.filename, dto.file, dto.content_type)}
-        response = self._http_client.put(url, files=files)
+        upload = MultipartUpload(dto, field=file_field, on_progress=on_progress)
+        response = self._send(
+            "PUT",
+            url,
+            idempotent=False,
+            family=EndpointFamilyEnum.uploads,
+            content=upload.sync_content(),
+            headers=upload.headers,
+        )
         raise_for_status(response)
-        response_schema = MainRequestAttachmentSchema.model_validate(response.json())
+        response_schema = validate_json(MainRequestAttachmentSchema, response.content)
         return response_schema.attachment
 
+    @_sync_coalesced
+    @_sync_instrumented("resolutions")
     def get_resolution(
         self,
         request_id: int,
@@ -643,40 +2342,582 @@ class SyncHelpdeskClient:
         """raises: `HelpdeskClientError`, `httpx.HTTPError`"""
 
         url = self._urls.resolutions(request_id)
-        response = self._http_client.get(url)
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=EndpointFamilyEnum.requests,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
-        return MainResolutionSchema.model_validate(response.json()).resolution
+        return validate_json(MainResolutionSchema, response.content).resolution
 
-    def download(self, content_url: str) -> bytes | None:
+    def get_resolution_resources(
+        self,
+        resolution: ResolutionSchema,
+        concurrency: int = 8,
+        directory: Path | None = None,
+    ) -> ResolutionResourcesDTO:
+        """
+        Скачивает изображения из `raw_content` и вложения решения в пуле из `concurrency` потоков.
+
+        Ошибка скачивания одного ресурса не прерывает остальные и попадает в `ResolutionResourcesDTO.errors`.
+        :param resolution: Решение из `get_resolution`
+        :param concurrency: Количество одновременных скачиваний
+        :param directory: Каталог, в который ресурсы скачиваются через `download_to` вместо памяти
+        """
+
+        def fetch(url: str, size: int | None) -> bytes | Path | None:
+            if directory is None:
+                return self.download(url, size)
+
+            return self.download_to(
+                url,
+                directory / AttachmentCache.key(url),
+                expected_size=size,
+            )
+
+        resources: dict[str, bytes | Path | None] = {}
+        errors: dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                url: executor.submit(copy_context().run, fetch, url, size)
+                for url, size in resolution_resource_urls(
+                    resolution,
+                    self._http_client.base_url,
+                ).items()
+            }
+            for url, future in futures.items():
+                try:
+                    resources[url] = future.result()
+                except (HelpdeskClientError, httpx.HTTPError) as e:
+                    errors[url] = e
+
+        return ResolutionResourcesDTO(resources=resources, errors=errors)
+
+    @_sync_coalesced
+    @_sync_instrumented("content_url")
+    def download(
+        self,
+        content_url: str,
+        size: int | None = None,
+    ) -> bytes | None:
         """
         Скачивает ресурс по указанному URL.
 
         :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
+        :param size: Ожидаемый размер в байтах (`RequestAttachmentSchema.size.value`), запись кэша вложений другого размера не используется
         raises: `HelpdeskClientError`, `httpx.HTTPError`
         """
 
         if content_url.startswith("/"):
             content_url = content_url.removeprefix("/")
 
-        response = self._http_client.get(content_url)
+        if self._attachment_cache is not None:
+            content = self._attachment_cache.read(content_url, size)
+            if content is not None:
+                return content
+
+        response = self._send(
+            "GET",
+            content_url,
+            idempotent=True,
+            family=EndpointFamilyEnum.downloads,
+        )
         if response.status_code == HTTPStatus.NOT_FOUND:
             return None
 
         raise_for_status(response)
+        if self._attachment_cache is not None:
+            self._attachment_cache.put(content_url, response.content, size)
+
         return response.content
 
-    def stream(self, content_url: str) -> AbstractContextManager[httpx.Response]:
+    def stream(
+        self,
+        content_url: str,
+        size: int | None = None,
+    ) -> AbstractContextManager[httpx.Response]:
         """
         Стримит ресурс по указанному URL.
 
         :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
-        raises: `httpx.HTTPError`
+        :param size: Ожидаемый размер в байтах (`RequestAttachmentSchema.size.value`), запись кэша вложений другого размера не используется
+        raises: `HelpdeskClientError`, `httpx.HTTPError`
         """
 
         if content_url.startswith("/"):
             content_url = content_url.removeprefix("/")
 
-        return self._http_client.stream("GET", content_url)
+        if self._attachment_cache is None:
+            return self._stream(
+                "GET",
+                content_url,
+                family=EndpointFamilyEnum.downloads,
+            )
+
+        return self._cached_stream(self._attachment_cache, content_url, size)
+
+    @contextmanager
+    def _cached_stream(
+        self,
+        cache: AttachmentCache,
+        content_url: str,
+        size: int | None,
+    ) -> Iterator[httpx.Response]:
+        file = cache.open(content_url, size)
+        if file is not None:
+            response = httpx.Response(
+                HTTPStatus.OK,
+                headers={"Content-Length": str(os.fstat(file.fileno()).st_size)},
+                stream=CachedFileStream(file),
+                request=self._http_client.build_request("GET", content_url),
+            )
+            try:
+                yield response
+            finally:
+                response.close()
+            return
+
+        with self._stream(
+            "GET",
+            content_url,
+            family=EndpointFamilyEnum.downloads,
+        ) as response:
+            if response.status_code == HTTPStatus.OK:
+                if response.is_stream_consumed:
+                    cache.put(content_url, response.content, size)
+                elif "Content-Encoding" not in response.headers and isinstance(
+                    response.stream,
+                    httpx.SyncByteStream,
+                ):
+                    response.stream = TeeStream(
+                        response.stream,
+                        cache.writer(content_url, size),
+                    )
+
+            yield response
+
+    @_sync_instrumented("content_url")
+    def download_to(
+        self,
+        content_url: str,
+        path: Path,
+        *,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_RANGE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_RANGE_CONCURRENCY,
+    ) -> Path | None:
+        """
+        Скачивает ресурс по указанному URL в файл частями (HTTP Range), которые загружаются параллельно.
+
+        В памяти находится не больше `concurrency` частей. Если скачивание прервалось,
+        повторный вызов с тем же `path` докачивает недостающие части.
+        Если сервер не поддерживает Range, файл скачивается целиком одним потоком.
+
+        :param content_url: Примеры: 1) `content_url` из `RequestAttachmentSchema`; 2) значение атрибута `src` тега `img` из `ResolutionSchema.raw_content`.
+        :param path: Путь к файлу. Части сохраняются в `<path>.part`, состояние - в `<path>.part.json`
+        :param expected_size: Ожидаемый размер в байтах, например `RequestAttachmentSchema.size.value`
+        :param chunk_size: Размер части в байтах
+        :param concurrency: Количество одновременно скачиваемых частей
+        :return: `path` или `None`, если ресурс не найден
+        raises: `HelpdeskClientError`, `DownloadIntegrityError`, `httpx.HTTPError`
+        """
+
+        if content_url.startswith("/"):
+            content_url = content_url.removeprefix("/")
+
+        download = RangedDownload(path, content_url, chunk_size, expected_size)
+        download.open()
+        try:
+            if not download.is_started:
+                status_code = self._download_first_chunk(content_url, download)
+                if status_code is None:
+                    download.discard()
+                    return None
+
+                if not download.is_started:
+                    return download.finish(status_code)
+
+            def download_chunk(index: int, range_header: str) -> None:
+                response = self._send(
+                    "GET",
+                    content_url,
+                    idempotent=True,
+                    family=EndpointFamilyEnum.downloads,
+                    headers={"Range": range_header},
+                )
+                raise_for_status(response)
+                download.complete_chunk(index, response)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(
+                        copy_context().run,
+                        download_chunk,
+                        index,
+                        range_header,
+                    )
+                    for index, range_header in download.pending()
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+            return download.finish(HTTPStatus.PARTIAL_CONTENT)
+        finally:
+            download.close()
+
+    def _download_first_chunk(
+        self,
+        content_url: str,
+        download: RangedDownload,
+    ) -> int | None:
+        """Скачивает первую часть и узнает размер файла. Возвращает `None`, если ресурс не найден."""
+
+        with self._stream(
+            "GET",
+            content_url,
+            family=EndpointFamilyEnum.downloads,
+            headers={"Range": download.first_range_header()},
+        ) as response:
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return None
+
+            if download.is_empty(response):
+                return response.status_code
+
+            if not response.is_success:
+                response.read()
+                raise_for_status(response)
+
+            is_ranged = download.start(response)
+            received = 0
+            for chunk in response.iter_bytes():
+                download.write(received, chunk)
+                received += len(chunk)
+
+        if is_ranged:
+            download.complete_first_chunk(response.status_code, received)
+
+        return response.status_code
+
+    def _get_list_raw(
+        self,
+        url: str,
+        filter_: (
+            RequestFilterParams
+            | RequestFilterPagePaginationParams
+            | RequestCriteriaFilterPagePaginationParams
+            | CategoryFilterParams
+            | SubcategoryFilterParams
+            | TemplateFilterParams
+            | UrgencyFilterParams
+        ),
+        *,
+        family: EndpointFamilyEnum,
+    ) -> RawJson:
+        params = {"input_data": dump_input_data(filter_)}
+        response = self._send(
+            "GET",
+            url,
+            idempotent=True,
+            family=family,
+            params=params,
+        )
+        raise_for_status(response)
+        return decode_json(response.content)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        window = self._hedge_window(method, idempotent=idempotent, family=family)
+        request = self._request if window is None else partial(self._hedged, window)
+        if self._retry_policy is None:
+            return request(method, url, family=family, **kwargs)
+
+        attempts = self._retry_policy.attempts(idempotent=idempotent)
+        with attempts.time_limit():
+            while True:
+                try:
+                    response = request(method, url, family=family, **kwargs)
+                except httpx.TransportError as e:
+                    delay = within_deadline(attempts.delay_after_error(e))
+                    if delay is None:
+                        raise
+                else:
+                    delay = within_deadline(attempts.delay_after_response(response))
+                    if delay is None:
+                        return response
+
+                time.sleep(delay)
+                if self._hooks:
+                    self._record_retry()
+
+    def _hedged(
+        self,
+        window: HedgeWindow,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        """
+        Отправляет дублирующий запрос, если ответ не получен за задержку `window`.
+
+        Запросы выполняются в пуле потоков клиента, который создается при первом дублируемом запросе.
+        Если свободных потоков нет, запрос выполняется в вызывающем потоке без дублирования.
+        Выполняющийся проигравший запрос не прерывается: он завершается в фоне, а его ответ отбрасывается,
+        но время ответа учитывается в `window`.
+        """
+
+        attempt = partial(
+            self._timed_request,
+            window,
+            method,
+            url,
+            family=family,
+            **kwargs,
+        )
+        delay = window.delay()
+        if delay is None or not self._hedge_slots.acquire(blocking=False):
+            return attempt()
+
+        primary = self._submit_attempt(attempt)
+        pending = {primary}
+        try:
+            done, _ = wait(pending, timeout=delay)
+            if not done and self._hedge_slots.acquire(blocking=False):
+                if window.acquire():
+                    pending.add(self._submit_attempt(attempt))
+                    self._record_hedge(won=False)
+                else:
+                    self._hedge_slots.release()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is not primary:
+                            window.record_win()
+                            self._record_hedge(won=True)
+                        return future.result()
+
+            return primary.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _submit_attempt(
+        self,
+        attempt: Callable[[], httpx.Response],
+    ) -> Future[httpx.Response]:
+        """Запускает попытку в пуле дублирующих запросов, поток уже занят через `_hedge_slots`"""
+
+        try:
+            with self._hedge_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=_HEDGE_WORKERS,
+                        thread_name_prefix="helpdesk-client-hedge",
+                    )
+                future = self._hedge_executor.submit(copy_context().run, attempt)
+        except BaseException:
+            self._hedge_slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._hedge_slots.release())
+        return future
+
+    def _timed_request(
+        self,
+        window: HedgeWindow,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        response = self._request(method, url, family=family, **kwargs)
+        window.record_latency(time.perf_counter() - start)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        if self._circuit_breaker is None:
+            return self._request_http(method, url, family=family, **kwargs)
+
+        call = self._circuit_breaker.acquire(family)
+        try:
+            response = self._request_http(method, url, family=family, **kwargs)
+        except BaseException as e:
+            call.record_error(e)
+            raise
+
+        call.record_response(response)
+        return response
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> Iterator[httpx.Response]:
+        expires_at = current_deadline()
+        if expires_at is not None:
+            time_left(expires_at)
+
+        call = (
+            None
+            if self._circuit_breaker is None
+            else self._circuit_breaker.acquire(family)
+        )
+        try:
+            self._acquire_rate_limit(family, expires_at)
+            if expires_at is not None:
+                kwargs["timeout"] = self._deadline_timeout(expires_at)
+
+            start = time.perf_counter()
+            with (
+                deadline_errors(expires_at),
+                self._http_client.stream(
+                    method,
+                    url,
+                    extensions=family_extensions(family),
+                    **kwargs,
+                ) as response,
+            ):
+                if expires_at is not None:
+                    response.stream = DeadlineByteStream(
+                        response.stream,  # type: ignore[arg-type]
+                        expires_at,
+                    )
+                recorder = current_call.get()
+                if recorder is not None:
+                    recorder.record_response(response, time.perf_counter() - start)
+                if call is not None:
+                    call.record_response(response)
+                yield response
+        except BaseException as e:
+            if call is not None:
+                call.record_error(e)
+            raise
+
+    def _request_http(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        expires_at = current_deadline()
+        if expires_at is not None:
+            time_left(expires_at)
+
+        self._acquire_rate_limit(family, expires_at)
+        if expires_at is None:
+            return self._send_http(method, url, family=family, **kwargs)
+
+        kwargs["timeout"] = self._deadline_timeout(expires_at)
+        with deadline_errors(expires_at):
+            return self._send_http(method, url, family=family, **kwargs)
+
+    def _send_http(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: EndpointFamilyEnum,
+        **kwargs: Unpack[RequestKwargs],
+    ) -> httpx.Response:
+        if not self._hooks:
+            return self._http_client.request(
+                method,
+                url,
+                extensions=family_extensions(family),
+                **kwargs,
+            )
+
+        start = time.perf_counter()
+        response = self._http_client.request(
+            method,
+            url,
+            extensions=family_extensions(family),
+            **kwargs,
+        )
+        recorder = current_call.get()
+        if recorder is not None:
+            recorder.record_response(response, time.perf_counter() - start)
+
+        return response
+
+    def _acquire_rate_limit(
+        self,
+        family: EndpointFamilyEnum,
+        expires_at: float | None,
+    ) -> None:
+        """Ожидание лимита не дольше оставшегося времени. raises: `DeadlineExceededError`"""
+
+        if self._rate_limiter is None:
+            return
+
+        timeout = None if expires_at is None else time_left(expires_at)
+        if not self._rate_limiter.acquire_sync(family, timeout):
+            raise DeadlineExceededError(sent=False)
+
+    def _deadline_timeout(self, expires_at: float) -> httpx.Timeout:
+        """Таймаут клиента, ограниченный оставшимся временем. raises: `DeadlineExceededError`"""
+
+        return limit_timeout(self._http_client.timeout, time_left(expires_at))
+
+    def _hedge_window(
+        self,
+        method: str,
+        *,
+        idempotent: bool,
+        family: EndpointFamilyEnum,
+    ) -> HedgeWindow | None:
+        if self._hedger is None or not idempotent or method != "GET":
+            return None
+
+        return self._hedger.window(family)
+
+    @staticmethod
+    def _record_retry() -> None:
+        recorder = current_call.get()
+        if recorder is not None:
+            recorder.retries += 1
+
+    @staticmethod
+    def _record_hedge(*, won: bool) -> None:
+        recorder = current_call.get()
+        if recorder is None:
+            return
+
+        if won:
+            recorder.hedges_won += 1
+        else:
+            recorder.hedges += 1
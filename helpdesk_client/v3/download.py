@@ -0,0 +1,256 @@
+import re
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+import orjson
+
+from helpdesk_client.exceptions import DownloadIntegrityError
+
+DEFAULT_RANGE_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_RANGE_CONCURRENCY = 4
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def parse_content_range(response: httpx.Response) -> tuple[int, int, int] | None:
+    """Возвращает (начало, конец, размер файла) из заголовка `Content-Range`."""
+
+    match = _CONTENT_RANGE_PATTERN.fullmatch(response.headers.get("Content-Range", ""))
+    if match is None:
+        return None
+
+    start, end, size = match.groups()
+    return int(start), int(end), int(size)
+
+
+class RangedDownload:
+    """
+    Состояние скачивания файла по частям (HTTP Range) во временный файл `<path>.part`.
+
+    Скачанные части записываются в `<path>.part.json`, поэтому после сбоя скачивание
+    продолжается с недостающих частей. Если `ETag` части не совпадает с `ETag` первой части,
+    файл на сервере изменился: состояние сбрасывается, и следующее скачивание начнется заново.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        content_url: str,
+        chunk_size: int = DEFAULT_RANGE_CHUNK_SIZE,
+        expected_size: int | None = None,
+    ) -> None:
+        self.path = path
+        self.part_path = path.with_name(f"{path.name}.part")
+        self.state_path = path.with_name(f"{path.name}.part.json")
+        self._content_url = content_url
+        self._chunk_size = chunk_size
+        self._expected_size = expected_size
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._is_stale = False
+
+        self.size: int | None = None
+        self.etag: str | None = None
+        self._done: set[int] = set()
+        self._load_state()
+
+    def _load_state(self) -> None:
+        if not self.part_path.exists() or not self.state_path.exists():
+            return
+
+        try:
+            state = orjson.loads(self.state_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return
+
+        if (
+            state.get("content_url") != self._content_url
+            or state.get("chunk_size") != self._chunk_size
+            or self._expected_size not in (None, state.get("size"))
+            or self.part_path.stat().st_size != state.get("size")
+        ):
+            return
+
+        self.size = state["size"]
+        self.etag = state.get("etag")
+        self._done = set(state["done"])
+
+    def _save_state(self) -> None:
+        state = {
+            "content_url": self._content_url,
+            "chunk_size": self._chunk_size,
+            "size": self.size,
+            "etag": self.etag,
+            "done": sorted(self._done),
+        }
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.tmp")
+        tmp_path.write_bytes(orjson.dumps(state))
+        tmp_path.replace(self.state_path)
+
+    def open(self) -> None:
+        self._file = self.part_path.open("r+b" if self.size is not None else "wb")
+
+    def close(self) -> None:
+        """Закрывает временный файл. Если скачанные части оказались неверными, удаляет состояние."""
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+            if self._is_stale:
+                self.part_path.unlink(missing_ok=True)
+                self.state_path.unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        """Временный файл и состояние будут удалены при закрытии."""
+
+        self._is_stale = True
+
+    @property
+    def is_started(self) -> bool:
+        return self.size is not None
+
+    def first_range_header(self) -> str:
+        return f"bytes=0-{self._chunk_size - 1}"
+
+    @staticmethod
+    def is_empty(response: httpx.Response) -> bool:
+        """Ответ 416 на запрос первой части пустого файла: `Content-Range: bytes */0`."""
+
+        return (
+            response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+            and response.headers.get("Content-Range") == "bytes */0"
+        )
+
+    def start(self, response: httpx.Response) -> bool:
+        """
+        Разбирает ответ на запрос первой части.
+
+        Возвращает `False`, если сервер не поддерживает Range и прислал файл целиком.
+        raises: `DownloadIntegrityError`
+        """
+
+        content_range = parse_content_range(response)
+        if response.status_code != httpx.codes.PARTIAL_CONTENT or content_range is None:
+            return False
+
+        _, _, size = content_range
+        self._check_size(response.status_code, size)
+        self.size = size
+        self.etag = response.headers.get("ETag")
+        if self._file is not None:
+            self._file.truncate(size)
+        self._save_state()
+        return True
+
+    def pending(self) -> list[tuple[int, str]]:
+        """Недостающие части: (номер части, значение заголовка `Range`)."""
+
+        count = -(-(self.size or 0) // self._chunk_size)
+        return [
+            (index, f"bytes={self._offset(index)}-{self._end(index)}")
+            for index in range(count)
+            if index not in self._done
+        ]
+
+    def write(self, offset: int, data: bytes) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+
+            self._file.seek(offset)
+            self._file.write(data)
+
+    def complete_chunk(self, index: int, response: httpx.Response) -> None:
+        """
+        Проверяет ответ на запрос части и записывает ее.
+
+        raises: `DownloadIntegrityError`
+        """
+
+        content_range = parse_content_range(response)
+        expected = (self._offset(index), self._end(index), self.size)
+        if (
+            response.status_code != httpx.codes.PARTIAL_CONTENT
+            or content_range != expected
+        ):
+            self._is_stale = True
+            raise DownloadIntegrityError(
+                status_code=response.status_code,
+                message=f"Expected range {expected}, got {content_range}",
+            )
+
+        etag = response.headers.get("ETag")
+        if self.etag is not None and etag != self.etag:
+            self._is_stale = True
+            raise DownloadIntegrityError(
+                status_code=response.status_code,
+                message=f"Resource changed: ETag {self.etag} -> {etag}",
+            )
+
+        if len(response.content) != self._end(index) - self._offset(index) + 1:
+            raise DownloadIntegrityError(
+                status_code=response.status_code,
+                message=f"Incomplete range {content_range}",
+            )
+
+        self.write(self._offset(index), response.content)
+        self.mark_done(index)
+
+    def mark_done(self, index: int) -> None:
+        with self._lock:
+            if self._file is None or self._is_stale:
+                return
+
+            self._file.flush()
+            self._done.add(index)
+            self._save_state()
+
+    def complete_first_chunk(self, status_code: int, received: int) -> None:
+        """raises: `DownloadIntegrityError`"""
+
+        if received != self._end(0) + 1:
+            raise DownloadIntegrityError(
+                status_code=status_code,
+                message=f"Incomplete range 0-{self._end(0)}: got {received} bytes",
+            )
+
+        self.mark_done(0)
+
+    def finish(self, status_code: int) -> Path:
+        """
+        Проверяет размер и переносит временный файл в `path`.
+
+        raises: `DownloadIntegrityError`
+        """
+
+        self.close()
+        actual_size = self.part_path.stat().st_size
+        if self.size is not None and actual_size != self.size:
+            self._is_stale = True
+            raise DownloadIntegrityError(
+                status_code=status_code,
+                message=f"Expected {self.size} bytes, got {actual_size}",
+            )
+
+        self._check_size(status_code, actual_size)
+        self.part_path.replace(self.path)
+        self.state_path.unlink(missing_ok=True)
+        return self.path
+
+    def _check_size(self, status_code: int, size: int) -> None:
+        if self._expected_size is not None and size != self._expected_size:
+            self._is_stale = True
+            raise DownloadIntegrityError(
+                status_code=status_code,
+                message=f"Expected {self._expected_size} bytes, got {size}",
+            )
+
+    def _offset(self, index: int) -> int:
+        return index * self._chunk_size
+
+    def _end(self, index: int) -> int:
+        return min((index + 1) * self._chunk_size, self.size or 0) - 1
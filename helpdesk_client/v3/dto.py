@@ -1,9 +1,58 @@
+from collections.abc import AsyncIterable, Mapping, Sequence
 from dataclasses import dataclass
 from io import BufferedReader
+from pathlib import Path
+
+from helpdesk_client.enums import CreateFailureEnum
+from helpdesk_client.v3.schemas.response import RequestSchema
 
 
 @dataclass(frozen=True, slots=True)
 class UploadFileDTO:
-    file: BufferedReader
+    file: BufferedReader | Path | AsyncIterable[bytes]
+    """Открытый файл и файл по пути читаются с начала, асинхронный источник - только в `HelpdeskClient` и без повторов"""
+
     filename: str
     content_type: str
+    size: int | None = None
+    """Размер асинхронного источника в байтах, без него тело отправляется с `Transfer-Encoding: chunked`"""
+
+    use_mmap: bool = False
+    """Читать файл через отображение в память"""
+
+
+@dataclass(frozen=True, slots=True)
+class RequestsByIdsDTO:
+    requests: Mapping[int, RequestSchema | None]
+    """Заявки в порядке переданных id, `None` - заявка не найдена"""
+
+    errors: Mapping[int, Exception]
+    """Ошибки получения заявок по id: `HelpdeskClientError`, `httpx.HTTPError`, `pydantic.ValidationError`"""
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionResourcesDTO:
+    resources: Mapping[str, bytes | Path | None]
+    """Содержимое (или путь к файлу) по URL из `raw_content` и `attachments`, `None` - ресурс не найден"""
+
+    errors: Mapping[str, Exception]
+    """Ошибки скачивания по URL: `HelpdeskClientError`, `httpx.HTTPError`"""
+
+
+@dataclass(frozen=True, slots=True)
+class CreateRequestFailureDTO:
+    status: CreateFailureEnum
+    error: Exception
+    """
+    `HelpdeskClientError` (в том числе `DeadlineExceededError`), `httpx.HTTPError`, `pydantic.ValidationError`
+    или `TimeoutError`, если `SyncHelpdeskClient` не дождался запроса к сроку пакета
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class CreateRequestsDTO:
+    requests: Sequence[RequestSchema | None]
+    """Созданные заявки в порядке переданных схем, `None` - заявка не создана или результат неизвестен"""
+
+    failures: Mapping[int, CreateRequestFailureDTO]
+    """Ошибки по индексу переданной схемы, в порядке возрастания индекса"""
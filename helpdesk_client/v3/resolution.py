@@ -0,0 +1,90 @@
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import httpx
+
+from helpdesk_client.v3.schemas.response import ResolutionSchema
+
+
+class _InlineResourceParser(HTMLParser):
+    def __init__(self, base_url: httpx.URL | None) -> None:
+        super().__init__()
+        self.urls: dict[str, None] = {}
+        self._base_url = base_url
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "img":
+            return
+
+        for name, value in attrs:
+            if name != "src" or not value:
+                continue
+            url = _relative_to(value, self._base_url)
+            if url is not None:
+                self.urls[url] = None
+
+
+def _relative_to(url: str, base_url: httpx.URL | None) -> str | None:
+    """
+    Относительный URL ресурса ServiceDesk или `None` для внешнего ресурса.
+
+    Абсолютный URL на хосте `base_url` (внутри его пути) приводится к относительному.
+    """
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if not parts.scheme and not parts.netloc:
+        return url
+    if base_url is None or not base_url.host:
+        return None
+
+    try:
+        absolute = base_url.join(url)
+    except httpx.InvalidURL:
+        return None
+
+    base_path = base_url.raw_path.rstrip(b"/")
+    path = absolute.raw_path
+    if (
+        (absolute.scheme, absolute.host, absolute.port)
+        != (base_url.scheme, base_url.host, base_url.port)
+        or not path.startswith(base_path)
+        or path[len(base_path) : len(base_path) + 1] not in {b"/", b"", b"?"}
+    ):
+        return None
+
+    return path[len(base_path) :].decode("ascii") or "/"
+
+
+def extract_inline_urls(
+    html: str,
+    base_url: httpx.URL | str | None = None,
+) -> list[str]:
+    """
+    Возвращает значения `src` тегов `img` без повторов, в порядке появления.
+
+    Внешние ссылки (со схемой или хостом) и `data:` пропускаются: их не нужно скачивать через ServiceDesk.
+    Ссылки на хост `base_url` приводятся к относительным и не пропускаются.
+    """
+
+    parser = _InlineResourceParser(None if base_url is None else httpx.URL(base_url))
+    parser.feed(html)
+    parser.close()
+    return list(parser.urls)
+
+
+def resolution_resource_urls(
+    resolution: ResolutionSchema,
+    base_url: httpx.URL | str | None = None,
+) -> dict[str, int | None]:
+    """Ресурсы решения: изображения из `raw_content` и вложения. Значение - ожидаемый размер в байтах, если известен."""
+
+    resources: dict[str, int | None] = dict.fromkeys(
+        extract_inline_urls(resolution.raw_content, base_url),
+    )
+    for attachment in resolution.attachments:
+        resources[attachment.content_url] = attachment.size.value
+
+    return resources
@@ -12,6 +12,7 @@ from .pagination import PagePaginationInfo, PaginationInfo
 from .query_params import (
     CategoryFilterParams,
     CategorySearchFields,
+    FieldsRequiredParams,
     HelpdeskFilter,
     OrderingParams,
     RequestCriteriaFilterPagePaginationParams,
@@ -42,6 +43,9 @@ from .response import (
     PagePaginationResponseSchema,
     PaginationBaseResponse,
     PaginationResponseSchema,
+    PartialRequestListSchema,
+    PartialRequestPaginationResponseSchema,
+    PartialRequestSchema,
     RequestAttachmentSchema,
     RequesterSchema,
     RequestListSchema,
@@ -65,6 +69,7 @@ __all__ = [
     "CategorySchema",
     "CategorySearchFields",
     "DateTimeSchema",
+    "FieldsRequiredParams",
     "FileSizeSchema",
     "HasNameSchema",
     "HelpdeskFilter",
@@ -85,6 +90,9 @@ __all__ = [
     "PaginationBaseResponse",
     "PaginationInfo",
     "PaginationResponseSchema",
+    "PartialRequestListSchema",
+    "PartialRequestPaginationResponseSchema",
+    "PartialRequestSchema",
     "RequestAttachmentSchema",
     "RequestCreateSchema",
     "RequestCriteriaFilterPagePaginationParams",
@@ -1,10 +1,12 @@
-from collections.abc import Sequence
-from typing import Annotated
+from collections.abc import Hashable, Sequence
+from typing import Annotated, Any
 
+import orjson
 import pydantic
-from pydantic import PlainSerializer
+from pydantic import BaseModel, PlainSerializer
 
 from helpdesk_client.enums import (
+    RequestFieldEnum,
     SearchCriteriaConditionEnum,
     SearchCriteriaFieldEnum,
     SearchCriteriaLogicalOperatorEnum,
@@ -21,6 +23,11 @@ class OrderingParams(BaseSchema):
     sort_order: SortEnum | None = None
 
 
+class FieldsRequiredParams(BaseSchema):
+    fields_required: Sequence[RequestFieldEnum | str] | None = None
+    """Поля заявки в ответе, остальные сервер не возвращает. Ответ разбирается частичными схемами `PartialRequest*`"""
+
+
 class SearchCriteria(BaseSchema):
     field: SearchCriteriaFieldEnum | str
     value: str
@@ -61,17 +68,28 @@ JsonDumpedRequestSearchFields = Annotated[
 ]
 
 
-class RequestFilterParams(PaginationInfo, OrderingParams, BaseSchema):
+class RequestFilterParams(
+    PaginationInfo,
+    OrderingParams,
+    FieldsRequiredParams,
+    BaseSchema,
+):
     search_fields: JsonDumpedRequestSearchFields = None
 
 
-class RequestFilterPagePaginationParams(PagePaginationInfo, OrderingParams, BaseSchema):
+class RequestFilterPagePaginationParams(
+    PagePaginationInfo,
+    OrderingParams,
+    FieldsRequiredParams,
+    BaseSchema,
+):
     search_fields: JsonDumpedRequestSearchFields = None
 
 
 class RequestCriteriaFilterPagePaginationParams(
     PagePaginationInfo,
     OrderingParams,
+    FieldsRequiredParams,
     BaseSchema,
 ):
     """
@@ -141,3 +159,89 @@ class HelpdeskFilter(BaseSchema):
         | UrgencyFilterParams
         | TemplateFilterParams
     )
+
+
+_PAGINATION_FIELDS = frozenset(
+    {*PaginationInfo.model_fields, *PagePaginationInfo.model_fields},
+)
+
+_COMPILED_FILTERS_MAXSIZE = 512
+_compiled_filters: dict[Hashable, list[tuple[str, str | None, Any]]] = {}
+"""Поля `list_info` в порядке полей фильтра: (ключ, имя поля пагинации или `None`, значение)"""
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, BaseModel):
+        values = value.__dict__
+        return (
+            type(value),
+            tuple(
+                sorted(
+                    (name, _freeze(values[name])) for name in value.model_fields_set
+                ),
+            ),
+        )
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _compile(filter_: BaseModel) -> list[tuple[str, str | None, Any]]:
+    dumped = filter_.model_dump(
+        mode="json",
+        by_alias=True,
+        exclude_unset=True,
+        exclude=set(_PAGINATION_FIELDS),
+    )
+    compiled: list[tuple[str, str | None, Any]] = []
+    for name, field in type(filter_).model_fields.items():
+        alias = field.alias or name
+        if name in _PAGINATION_FIELDS:
+            compiled.append((alias, name, None))
+        elif alias in dumped:
+            compiled.append((alias, None, dumped[alias]))
+    return compiled
+
+
+def dump_input_data(filter_: BaseModel) -> str:
+    """
+    Значение параметра `input_data` для фильтра: `HelpdeskFilter(list_info=filter_)` в JSON.
+
+    Все поля фильтра, кроме пагинации, сериализуются один раз и кэшируются,
+    при повторных вызовах подставляются только значения пагинации.
+    """
+
+    fields_set = filter_.model_fields_set
+    values = filter_.__dict__
+    # Фильтр с нехешируемыми значениями сериализуется без кэша
+    try:
+        key = (
+            type(filter_),
+            tuple(
+                sorted(
+                    (name, _freeze(values[name]))
+                    for name in fields_set
+                    if name not in _PAGINATION_FIELDS
+                ),
+            ),
+        )
+        compiled = _compiled_filters.get(key)
+    except TypeError:
+        return HelpdeskFilter(list_info=filter_).model_dump_json(  # type: ignore[arg-type]
+            by_alias=True,
+            exclude_unset=True,
+        )
+
+    if compiled is None:
+        compiled = _compile(filter_)
+        if len(_compiled_filters) >= _COMPILED_FILTERS_MAXSIZE:
+            _compiled_filters.clear()
+        _compiled_filters[key] = compiled
+
+    list_info: dict[str, Any] = {}
+    for alias, pagination_field, value in compiled:
+        if pagination_field is None:
+            list_info[alias] = value
+        elif pagination_field in fields_set:
+            list_info[alias] = values[pagination_field]
+    return orjson.dumps({"list_info": list_info}).decode()
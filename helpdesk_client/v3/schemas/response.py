@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, Any
 
 import pydantic
@@ -70,6 +71,7 @@ class RequestSchema(BaseSchema):
     created_time: DateTimeSchema
     due_by_time: DateTimeSchema | None = None
     completed_time: DateTimeSchema | None = None
+    last_updated_time: DateTimeSchema | None = None
     group: HasNameSchema
     status: HasNameSchema
     requester: RequesterSchema
@@ -80,6 +82,24 @@ class RequestSchema(BaseSchema):
     urgency: "ShortUrgencySchema | None" = None
 
 
+class PartialRequestSchema(BaseSchema):
+    """Заявка, полученная с `fields_required`: заполнены только запрошенные поля"""
+
+    id: int
+    subject: str | None = None
+    description: str | None = None
+    created_time: DateTimeSchema | None = None
+    due_by_time: DateTimeSchema | None = None
+    completed_time: DateTimeSchema | None = None
+    last_updated_time: DateTimeSchema | None = None
+    group: HasNameSchema | None = None
+    status: HasNameSchema | None = None
+    requester: RequesterSchema | None = None
+    technician: RequesterSchema | None = None
+    attachments: Sequence["RequestAttachmentSchema"] | None = None
+    urgency: "ShortUrgencySchema | None" = None
+
+
 class RequestWithResolutionSchema(RequestSchema):
     resolution: "ResolutionBaseSchema | None"
 
@@ -100,6 +120,10 @@ class RequestListSchema(BaseSchema):
     requests: list[RequestSchema]
 
 
+class PartialRequestListSchema(BaseSchema):
+    requests: list[PartialRequestSchema]
+
+
 class MainRequestSchema(BaseSchema):
     request: RequestSchema
 
@@ -149,6 +173,10 @@ class RequestPaginationResponseSchema(PagePaginationBaseResponse):
     requests: Sequence[RequestSchema]
 
 
+class PartialRequestPaginationResponseSchema(PagePaginationBaseResponse):
+    requests: Sequence[PartialRequestSchema]
+
+
 class CategoryPaginationResponseSchema(PaginationBaseResponse):
     categories: Sequence[CategorySchema]
 
@@ -209,7 +237,6 @@ class ResolutionBaseSchema(BaseSchema):
 
 
 class ResolutionSchema(BaseSchema):
-    content: Annotated[str, pydantic.BeforeValidator(remove_html_tags)]
     raw_content: Annotated[str, pydantic.Field(alias="content")]
     attachments: Annotated[
         list[RequestAttachmentSchema],
@@ -218,6 +245,12 @@ class ResolutionSchema(BaseSchema):
     submitted_by: RequesterSchema
     submitted_on: DateTimeSchema
 
+    @cached_property
+    def content(self) -> str:
+        """`raw_content` без HTML-тегов, вычисляется при первом обращении и не сериализуется"""
+
+        return remove_html_tags(self.raw_content)
+
 
 class MainResolutionSchema(BaseSchema):
     resolution: ResolutionSchema
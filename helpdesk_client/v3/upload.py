@@ -0,0 +1,196 @@
+import asyncio
+import mmap
+import os
+import secrets
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from contextlib import ExitStack, suppress
+from io import BufferedReader
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import httpx
+
+from helpdesk_client.v3.dto import UploadFileDTO
+
+ProgressCallback = Callable[[int, int | None], None]
+"""Вызывается после отправки каждого фрагмента файла: (отправлено байт, размер файла или `None`)"""
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+_ESCAPED_CHARS = {'"': "%22", "\\": "\\\\", "\r": "%0D", "\n": "%0A"}
+
+
+def _escape(value: str) -> str:
+    return "".join(_ESCAPED_CHARS.get(char, char) for char in value)
+
+
+class MultipartUpload:
+    """
+    Тело `multipart/form-data` с одним файлом, которое читается и отправляется фрагментами.
+
+    В памяти одновременно находится не больше одного фрагмента. Файл из `BufferedReader`
+    и `Path` читается с начала при каждой отправке, поэтому запрос можно повторить.
+    Асинхронный источник можно отправить только один раз, запрос с ним не повторяется.
+    """
+
+    def __init__(
+        self,
+        dto: UploadFileDTO,
+        field: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        self._dto = dto
+        self._chunk_size = chunk_size
+        self._on_progress = on_progress
+        self._boundary = secrets.token_hex(16)
+        self._head = (
+            f"--{self._boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_escape(field)}"; '
+            f'filename="{_escape(dto.filename)}"\r\n'
+            f"Content-Type: {dto.content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self._boundary}--\r\n".encode()
+        self._size = self._file_size()
+        self._is_source_consumed = False
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"Content-Type": f"multipart/form-data; boundary={self._boundary}"}
+        if self._size is not None:
+            headers["Content-Length"] = str(
+                len(self._head) + self._size + len(self._tail),
+            )
+        return headers
+
+    @property
+    def is_replayable(self) -> bool:
+        """Тело можно отправить повторно: источник - не асинхронный"""
+
+        return not isinstance(self._dto.file, AsyncIterable)
+
+    def async_content(self) -> AsyncIterable[bytes]:
+        """Тело запроса для `httpx.AsyncClient`, каждая итерация читает файл заново"""
+
+        return _AsyncContent(self)
+
+    def sync_content(self) -> Iterable[bytes]:
+        """Тело запроса для `httpx.Client`, каждая итерация читает файл заново. raises: `ValueError`"""
+
+        if isinstance(self._dto.file, AsyncIterable):
+            msg = "Async file source can not be uploaded with SyncHelpdeskClient"
+            raise ValueError(msg)  # noqa: TRY004
+        return _SyncContent(self)
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        yield self._head
+        sent = 0
+        async for chunk in self._aiter_file():
+            yield chunk
+            sent += len(chunk)
+            self._report(sent)
+        yield self._tail
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        yield self._head
+        sent = 0
+        for chunk in self._iter_file():
+            yield chunk
+            sent += len(chunk)
+            self._report(sent)
+        yield self._tail
+
+    def _report(self, sent: int) -> None:
+        if self._on_progress is not None:
+            self._on_progress(sent, self._size)
+
+    def _file_size(self) -> int | None:
+        file = self._dto.file
+        if isinstance(file, Path):
+            return file.stat().st_size
+        if isinstance(file, BufferedReader):
+            return os.fstat(file.fileno()).st_size
+        return self._dto.size
+
+    async def _aiter_file(self) -> AsyncIterator[bytes]:
+        file = self._dto.file
+        if isinstance(file, AsyncIterable):
+            if self._is_source_consumed:
+                raise httpx.StreamConsumed
+            self._is_source_consumed = True
+            async for chunk in file:
+                yield chunk
+            return
+
+        with ExitStack() as stack:
+            reader = self._open(stack, file)
+            if self._dto.use_mmap:
+                for chunk in self._iter_mmap(reader):
+                    yield chunk
+                    # Отдает управление циклу событий между фрагментами
+                    await asyncio.sleep(0)
+                return
+
+            while chunk := await asyncio.to_thread(reader.read, self._chunk_size):
+                yield chunk
+
+    def _iter_file(self) -> Iterator[bytes]:
+        file = self._dto.file
+        if isinstance(file, AsyncIterable):
+            msg = "Async file source can not be uploaded with SyncHelpdeskClient"
+            raise ValueError(msg)  # noqa: TRY004
+
+        with ExitStack() as stack:
+            reader = self._open(stack, file)
+            if self._dto.use_mmap:
+                yield from self._iter_mmap(reader)
+                return
+
+            while chunk := reader.read(self._chunk_size):
+                yield chunk
+
+    def _open(self, stack: ExitStack, file: BufferedReader | Path) -> BinaryIO:
+        if isinstance(file, Path):
+            return stack.enter_context(file.open("rb"))
+
+        file.seek(0)
+        return file
+
+    def _iter_mmap(self, reader: BinaryIO) -> Iterator[bytes]:
+        """Фрагменты файла как `memoryview` поверх отображения файла в память, без копирования"""
+
+        if not self._size:
+            return
+
+        mapped = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            for start in range(0, len(view), self._chunk_size):
+                yield cast("bytes", view[start : start + self._chunk_size])
+        finally:
+            view.release()
+            # Пока на фрагменты есть ссылки, отображение закроется при их удалении
+            with suppress(BufferError):
+                mapped.close()
+
+
+class _AsyncContent:
+    def __init__(self, upload: MultipartUpload) -> None:
+        self._upload = upload
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._upload.aiter_chunks()
+
+
+class _SyncContent:
+    def __init__(self, upload: MultipartUpload) -> None:
+        self._upload = upload
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._upload.iter_chunks()
@@ -0,0 +1,150 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from helpdesk_client.v3.attachment_cache import AttachmentCache
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+
+class Downloads:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(200, content=request.url.path.encode())
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path, max_bytes=10)
+    assert cache.put("files/a", b"aaaa")
+    assert cache.put("files/b", b"bbbb")
+    assert cache.read("files/a") == b"aaaa"
+    assert cache.put("files/c", b"cccc")
+
+    assert cache.read("files/b") is None
+    assert cache.read("files/a") == b"aaaa"
+    assert cache.read("files/c") == b"cccc"
+    assert (len(cache), cache.total_bytes) == (2, 8)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_entry_larger_than_cache_is_not_stored(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path, max_bytes=4)
+    assert not cache.put("files/a", b"aaaaa")
+    assert cache.read("files/a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_hit_after_reload_keeps_usage_order(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path, max_bytes=10)
+    cache.put("files/a", b"aaaa")
+    cache.put("files/b", b"bbbb")
+    now = time.time()
+    os.utime(tmp_path / AttachmentCache.key("files/a"), (now, now))
+    os.utime(tmp_path / AttachmentCache.key("files/b"), (now - 60, now - 60))
+
+    reloaded = AttachmentCache(tmp_path, max_bytes=10)
+    assert (len(reloaded), reloaded.total_bytes) == (2, 8)
+    assert reloaded.read("/files/a") == b"aaaa"
+    reloaded.put("files/c", b"cccc")
+    assert reloaded.read("files/b") is None
+
+
+def test_size_mismatch_is_a_miss(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path)
+    assert not cache.put("files/a", b"aaaa", size=5)
+    assert cache.read("files/a") is None
+
+    cache.put("files/a", b"aaaa", size=4)
+    assert cache.read("files/a", size=5) is None
+    assert cache.read("files/a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_only_stale_temp_files_are_removed(tmp_path: Path) -> None:
+    fresh = tmp_path / "fresh.0000.tmp"
+    stale = tmp_path / "stale.0000.tmp"
+    fresh.write_bytes(b"writing")
+    stale.write_bytes(b"crashed")
+    two_days_ago = time.time() - 2 * 24 * 60 * 60
+    os.utime(stale, (two_days_ago, two_days_ago))
+
+    cache = AttachmentCache(tmp_path)
+
+    assert fresh.exists()
+    assert not stale.exists()
+    assert len(cache) == 0
+
+
+def test_write_failure_is_not_raised(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path / "cache")
+    shutil.rmtree(tmp_path / "cache")
+
+    assert not cache.put("files/a", b"aaaa")
+    assert cache.read("files/a") is None
+
+
+@pytest.mark.anyio
+async def test_download_is_served_from_cache(tmp_path: Path) -> None:
+    downloads = Downloads()
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(downloads),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, attachment_cache=AttachmentCache(tmp_path))
+        first = await client.download("/files/1")
+        second = await client.download("files/1")
+
+        reloaded = HelpdeskClient(
+            http_client,
+            attachment_cache=AttachmentCache(tmp_path),
+        )
+        after_reload = await reloaded.download("files/1", size=len(b"/files/1"))
+        mismatch = await reloaded.download("files/1", size=1)
+
+    assert first == second == after_reload == mismatch == b"/files/1"
+    assert downloads.calls == 2
+
+
+@pytest.mark.anyio
+async def test_download_succeeds_when_cache_write_fails(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path / "cache")
+    shutil.rmtree(tmp_path / "cache")
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(Downloads()),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, attachment_cache=cache)
+        assert await client.download("files/1") == b"/files/1"
+
+
+def test_sync_download_is_served_from_cache(tmp_path: Path) -> None:
+    downloads = Downloads()
+    with httpx.Client(
+        transport=httpx.MockTransport(downloads),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(
+            http_client,
+            attachment_cache=AttachmentCache(tmp_path),
+        )
+        first = client.download("files/1")
+        second = client.download("files/1")
+
+    assert first == second == b"/files/1"
+    assert downloads.calls == 1
+
+
+def test_sync_download_succeeds_when_cache_write_fails(tmp_path: Path) -> None:
+    cache = AttachmentCache(tmp_path / "cache")
+    shutil.rmtree(tmp_path / "cache")
+    with httpx.Client(
+        transport=httpx.MockTransport(Downloads()),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, attachment_cache=cache)
+        assert client.download("files/1") == b"/files/1"
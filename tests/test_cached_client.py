@@ -0,0 +1,163 @@
+from collections import Counter
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+from helpdesk_client.v3.cached_client import (
+    CachedHelpdeskClient,
+    SyncCachedHelpdeskClient,
+)
+from helpdesk_client.v3.schemas.query_params import (
+    CategoryFilterParams,
+    CategorySearchFields,
+)
+
+_CATEGORIES = [
+    {"id": ident, "name": f"category {ident}", "deleted": False}
+    for ident in range(1, 6)
+]
+_TEMPLATES = [
+    {
+        "id": ident,
+        "name": f"template {ident}",
+        "is_service_template": False,
+        "is_enabled": True,
+        "inactive": False,
+        "is_default_template": False,
+    }
+    for ident in range(1, 4)
+]
+_LISTS: dict[str, tuple[str, list[dict[str, Any]]]] = {
+    "/api/v3/categories": ("categories", _CATEGORIES),
+    "/api/v3/service_categories": ("service_categories", []),
+    "/api/v3/subcategories": ("subcategories", []),
+    "/api/v3/urgencies": ("urgencies", []),
+    "/api/v3/request_templates": ("request_templates", _TEMPLATES),
+}
+
+
+class ServiceDesk:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] += 1
+        if path in _LISTS:
+            field, items = _LISTS[path]
+            list_info = orjson.loads(request.url.params["input_data"])["list_info"]
+            start = list_info["start_index"] - 1
+            row_count = list_info["row_count"]
+            return httpx.Response(
+                200,
+                json={
+                    field: items[start : start + row_count],
+                    "list_info": {
+                        "row_count": row_count,
+                        "start_index": list_info["start_index"],
+                        "has_more_rows": start + row_count < len(items),
+                    },
+                },
+            )
+
+        ident = int(path.rsplit("/", 1)[1])
+        return httpx.Response(200, json={"id": ident})
+
+
+@pytest.fixture
+def service_desk() -> ServiceDesk:
+    return ServiceDesk()
+
+
+@pytest.mark.anyio
+async def test_warm_up_serves_reference_lookups(service_desk: ServiceDesk) -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = CachedHelpdeskClient(http_client, page_size=2)
+        await client.warm_up()
+        warmed_up = service_desk.calls.copy()
+
+        page = await client.get_categories(
+            CategoryFilterParams(limit=2, offset=3, can_include_count=True),
+        )
+        last_page = await client.get_categories(CategoryFilterParams(limit=2, offset=5))
+        template = await client.get_template(2)
+
+    assert service_desk.calls == warmed_up
+    assert warmed_up["/api/v3/categories"] == 3
+    assert [category.id for category in page.categories] == [3, 4]
+    assert page.list_info.has_next
+    assert page.list_info.total_count == len(_CATEGORIES)
+    assert [category.id for category in last_page.categories] == [5]
+    assert not last_page.list_info.has_next
+    assert template is not None
+    assert template.id == 2
+
+
+@pytest.mark.anyio
+async def test_search_is_not_served_from_preloaded(service_desk: ServiceDesk) -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = CachedHelpdeskClient(http_client)
+        await client.get_all_categories()
+        await client.get_categories(
+            CategoryFilterParams(
+                limit=10,
+                offset=1,
+                search_fields=CategorySearchFields(name="category 1"),
+            ),
+        )
+
+    assert service_desk.calls["/api/v3/categories"] == 2
+
+
+def test_sync_warm_up_serves_reference_lookups(service_desk: ServiceDesk) -> None:
+    with httpx.Client(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncCachedHelpdeskClient(http_client, page_size=2)
+        client.warm_up()
+        warmed_up = service_desk.calls.copy()
+
+        page = client.get_categories(CategoryFilterParams(limit=10, offset=1))
+        template = client.get_template(3)
+
+    assert service_desk.calls == warmed_up
+    assert len(page.categories) == len(_CATEGORIES)
+    assert template is not None
+    assert template.id == 3
+
+
+@pytest.mark.anyio
+async def test_invalidate_drops_preloaded_pages(service_desk: ServiceDesk) -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = CachedHelpdeskClient(http_client, page_size=10)
+        await client.warm_up()
+        client.invalidate("get_categories")
+        await client.get_categories(CategoryFilterParams(limit=10, offset=1))
+        await client.get_all_categories()
+
+    assert service_desk.calls["/api/v3/categories"] == 3
+
+
+def test_sync_invalidate_drops_preloaded_pages(service_desk: ServiceDesk) -> None:
+    with httpx.Client(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncCachedHelpdeskClient(http_client, page_size=10)
+        client.warm_up()
+        client.invalidate("get_categories")
+        client.get_categories(CategoryFilterParams(limit=10, offset=1))
+        client.get_all_categories()
+
+    assert service_desk.calls["/api/v3/categories"] == 3
@@ -0,0 +1,159 @@
+import asyncio
+
+import httpx
+import pytest
+from helpdesk_client.circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+from helpdesk_client.deadline import deadline
+from helpdesk_client.enums import CircuitStateEnum, EndpointFamilyEnum
+from helpdesk_client.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    HelpdeskClientError,
+)
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+_FAMILY = EndpointFamilyEnum.downloads
+_POLICY = CircuitBreakerPolicy(failure_threshold=2, reset_timeout=10)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status_code: int) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request("GET", "http://sd"))
+
+
+def test_closed_open_half_open_closed() -> None:
+    clock = Clock()
+    transitions: list[tuple[CircuitStateEnum, CircuitStateEnum]] = []
+    breaker = CircuitBreaker(
+        _POLICY,
+        on_transition=lambda _, previous, state: transitions.append((previous, state)),
+        clock=clock,
+    )
+
+    breaker.acquire(_FAMILY).record_response(_response(500))
+    breaker.acquire(_FAMILY).record_error(httpx.ConnectError("refused"))
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.open
+    assert breaker.states()[EndpointFamilyEnum.requests] is CircuitStateEnum.closed
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.acquire(_FAMILY)
+    assert exc_info.value.retry_after == 10
+
+    clock.now = 10
+    probe = breaker.acquire(_FAMILY)
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.half_open
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.acquire(_FAMILY)
+    assert exc_info.value.retry_after is None
+
+    probe.record_response(_response(200))
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.closed
+    assert transitions == [
+        (CircuitStateEnum.closed, CircuitStateEnum.open),
+        (CircuitStateEnum.open, CircuitStateEnum.half_open),
+        (CircuitStateEnum.half_open, CircuitStateEnum.closed),
+    ]
+
+
+def test_failed_probe_reopens() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker(_POLICY, clock=clock)
+    for _ in range(2):
+        breaker.acquire(_FAMILY).record_response(_response(503))
+
+    clock.now = 10
+    breaker.acquire(_FAMILY).record_response(_response(502))
+
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.open
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire(_FAMILY)
+
+
+def test_success_resets_failures() -> None:
+    breaker = CircuitBreaker(_POLICY)
+    breaker.acquire(_FAMILY).record_response(_response(500))
+    breaker.acquire(_FAMILY).record_response(_response(200))
+    breaker.acquire(_FAMILY).record_response(_response(500))
+
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.closed
+
+
+@pytest.mark.parametrize(
+    ("error", "is_failure"),
+    [
+        (httpx.ReadTimeout("timeout"), True),
+        (DeadlineExceededError(sent=True), True),
+        (DeadlineExceededError(sent=False), False),
+        (asyncio.CancelledError(), False),
+        (ValueError(), False),
+    ],
+)
+def test_errors(error: BaseException, *, is_failure: bool) -> None:
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1))
+    breaker.acquire(_FAMILY).record_error(error)
+
+    expected = CircuitStateEnum.open if is_failure else CircuitStateEnum.closed
+    assert breaker.states()[_FAMILY] is expected
+
+
+def test_connect_timeout_deadline_is_a_failure() -> None:
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1))
+    error = DeadlineExceededError(sent=False)
+    error.__cause__ = httpx.ConnectTimeout("timeout")
+    breaker.acquire(_FAMILY).record_error(error)
+
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.open
+
+
+@pytest.mark.parametrize(
+    ("status_code", "state"),
+    [(500, CircuitStateEnum.open), (400, CircuitStateEnum.closed)],
+)
+def test_sync_client_counts_only_server_errors(
+    status_code: int,
+    state: CircuitStateEnum,
+) -> None:
+    calls = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(status_code)
+
+    breaker = CircuitBreaker(_POLICY)
+    with httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, circuit_breaker=breaker)
+        for _ in range(3):
+            with pytest.raises(HelpdeskClientError):
+                client.download("files/1")
+
+    assert breaker.states()[_FAMILY] is state
+    assert calls == (2 if state is CircuitStateEnum.open else 3)
+
+
+@pytest.mark.anyio
+async def test_expired_deadline_opens_circuit() -> None:
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, request=request)
+
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1))
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(slow),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, circuit_breaker=breaker)
+        with pytest.raises(DeadlineExceededError), deadline(0.05):
+            await client.download("files/1")
+
+    assert breaker.states()[_FAMILY] is CircuitStateEnum.open
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from helpdesk_client.exceptions import HelpdeskClientError
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+
+def _response(request: httpx.Request) -> httpx.Response:
+    ident = int(request.url.path.rsplit("/", 1)[-1])
+    if ident == 0:
+        return httpx.Response(500, request=request)
+    return httpx.Response(
+        200,
+        json={
+            "request": {
+                "id": ident,
+                "subject": "subject",
+                "created_time": {"display_value": "", "value": "1704067200000"},
+                "group": {"name": "group"},
+                "status": {"name": "Open"},
+                "requester": {"id": 1},
+            },
+        },
+        request=request,
+    )
+
+
+class AsyncServer:
+    """Отвечает на запросы заявок после `release`, считает запросы по пути"""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls[request.url.path] += 1
+        self.started.set()
+        await self.release.wait()
+        return _response(request)
+
+
+class SyncServer:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls[request.url.path] += 1
+        self.started.set()
+        self.release.wait()
+        return _response(request)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("coalesce_reads", [True, False])
+async def test_concurrent_reads_share_call(*, coalesce_reads: bool) -> None:
+    server = AsyncServer()
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, coalesce_reads=coalesce_reads)
+        calls = asyncio.gather(
+            client.get_request(1),
+            client.get_request(1),
+            client.get_request(1),
+            client.get_request(2),
+        )
+        await server.started.wait()
+        server.release.set()
+        first, second, third, other = await calls
+
+    assert first is not None
+    assert other is not None
+    assert (first.id, other.id) == (1, 2)
+    assert first == second == third
+    if coalesce_reads:
+        assert first is second is third
+    assert sorted(server.calls.values()) == ([1, 1] if coalesce_reads else [1, 3])
+
+
+@pytest.mark.anyio
+async def test_error_is_shared_and_not_cached() -> None:
+    server = AsyncServer()
+    server.release.set()
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, coalesce_reads=True)
+        results = await asyncio.gather(
+            client.get_request(0),
+            client.get_request(0),
+            return_exceptions=True,
+        )
+        assert sum(server.calls.values()) == 1
+        assert all(isinstance(result, HelpdeskClientError) for result in results)
+        assert results[0] is results[1]
+
+        with pytest.raises(HelpdeskClientError):
+            await client.get_request(0)
+
+    assert sum(server.calls.values()) == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_cancel_call() -> None:
+    server = AsyncServer()
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, coalesce_reads=True)
+        cancelled = asyncio.create_task(client.get_request(1))
+        waiter = asyncio.create_task(client.get_request(1))
+        await server.started.wait()
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        server.release.set()
+        request = await waiter
+
+    assert request is not None
+    assert request.id == 1
+    assert sum(server.calls.values()) == 1
+
+
+def test_sync_concurrent_reads_share_call() -> None:
+    server = SyncServer()
+    with (
+        httpx.Client(
+            transport=httpx.MockTransport(server),
+            base_url="http://servicedesk",
+        ) as http_client,
+        ThreadPoolExecutor(max_workers=3) as executor,
+    ):
+        client = SyncHelpdeskClient(http_client, coalesce_reads=True)
+        futures = [executor.submit(client.get_request, 1) for _ in range(3)]
+        server.started.wait()
+        # Остальные потоки успевают дождаться общего вызова
+        time.sleep(0.05)
+        server.release.set()
+        results = [future.result() for future in futures]
+
+    assert results[0] is not None
+    assert results[0].id == 1
+    assert all(result is results[0] for result in results)
+    assert sum(server.calls.values()) == 1
+
+
+def test_sync_error_is_shared() -> None:
+    server = SyncServer()
+    with (
+        httpx.Client(
+            transport=httpx.MockTransport(server),
+            base_url="http://servicedesk",
+        ) as http_client,
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        client = SyncHelpdeskClient(http_client, coalesce_reads=True)
+        futures = [executor.submit(client.get_request, 0) for _ in range(2)]
+        server.started.wait()
+        time.sleep(0.05)
+        server.release.set()
+        errors = [future.exception() for future in futures]
+
+    assert all(isinstance(error, HelpdeskClientError) for error in errors)
+    assert errors[0] is errors[1]
+    assert sum(server.calls.values()) == 1
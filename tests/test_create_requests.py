@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+from helpdesk_client.enums import CreateFailureEnum, EndpointFamilyEnum
+from helpdesk_client.exceptions import DeadlineExceededError, HelpdeskClientError
+from helpdesk_client.rate_limit import RateLimit, RateLimiter
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+from helpdesk_client.v3.dto import CreateRequestsDTO
+from helpdesk_client.v3.schemas.body import (
+    IdentSchema,
+    RequestCreateSchema,
+    ShortRequesterSchema,
+)
+
+_STATUSES = {"bad": 400, "error": 500}
+
+
+def _schema(subject: str) -> RequestCreateSchema:
+    return RequestCreateSchema(
+        subject=subject,
+        description="",
+        requester=ShortRequesterSchema(id=1),
+        urgency=IdentSchema(id=1),
+    )
+
+
+def _subject(request: httpx.Request) -> str:
+    input_data = orjson.loads(httpx.QueryParams(request.content.decode())["input_data"])
+    subject: str = input_data["request"]["subject"]
+    return subject
+
+
+def _created(subject: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "request": {
+                "id": int(subject.removeprefix("ok-")),
+                "subject": subject,
+                "created_time": {"display_value": "", "value": "1704067200000"},
+                "group": {"name": "group"},
+                "status": {"name": "Open"},
+                "requester": {"id": 1},
+            },
+        },
+    )
+
+
+async def _handler(request: httpx.Request) -> httpx.Response:
+    subject = _subject(request)
+    if subject == "slow":
+        await asyncio.sleep(1)
+    elif subject.startswith("ok-"):
+        # Заявки с меньшим номером отвечают позже
+        await asyncio.sleep(0.01 * (5 - int(subject.removeprefix("ok-"))))
+    if subject in _STATUSES:
+        return httpx.Response(_STATUSES[subject])
+    return _created(subject)
+
+
+def _sync_handler(request: httpx.Request) -> httpx.Response:
+    subject = _subject(request)
+    if subject == "slow":
+        time.sleep(1)
+    if subject in _STATUSES:
+        return httpx.Response(_STATUSES[subject])
+    return _created(subject)
+
+
+def _assert_partial_failure(result: CreateRequestsDTO) -> None:
+    assert [request.id if request else None for request in result.requests] == [
+        1,
+        None,
+        2,
+        None,
+        3,
+    ]
+    assert list(result.failures) == [1, 3]
+    assert result.failures[1].status is CreateFailureEnum.rejected
+    assert result.failures[3].status is CreateFailureEnum.unknown
+    assert isinstance(result.failures[1].error, HelpdeskClientError)
+
+
+_PARTIAL = ["ok-1", "bad", "ok-2", "error", "ok-3"]
+
+
+@pytest.mark.anyio
+async def test_partial_failure_keeps_order() -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        result = await HelpdeskClient(http_client).create_requests(
+            [_schema(subject) for subject in _PARTIAL],
+        )
+
+    _assert_partial_failure(result)
+
+
+@pytest.mark.anyio
+async def test_batch_timeout_classification() -> None:
+    limiter = RateLimiter({EndpointFamilyEnum.requests: RateLimit(rate=0.5, burst=2)})
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, rate_limiter=limiter)
+        result = await client.create_requests(
+            [_schema("ok-1"), _schema("slow"), _schema("ok-2")],
+            concurrency=3,
+            batch_timeout=0.2,
+        )
+
+    assert result.requests[0] is not None
+    assert result.requests[1] is None
+    assert result.failures[1].status is CreateFailureEnum.unknown
+    assert result.failures[2].status is CreateFailureEnum.not_submitted
+    assert isinstance(result.failures[2].error, DeadlineExceededError)
+
+
+def test_sync_partial_failure_keeps_order() -> None:
+    with httpx.Client(
+        transport=httpx.MockTransport(_sync_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        result = SyncHelpdeskClient(http_client).create_requests(
+            [_schema(subject) for subject in _PARTIAL],
+        )
+
+    _assert_partial_failure(result)
+
+
+def test_sync_batch_timeout_classification() -> None:
+    limiter = RateLimiter({EndpointFamilyEnum.requests: RateLimit(rate=0.5, burst=2)})
+    with httpx.Client(
+        transport=httpx.MockTransport(_sync_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, rate_limiter=limiter)
+        result = client.create_requests(
+            [_schema("ok-1"), _schema("slow"), _schema("ok-2"), _schema("ok-3")],
+            concurrency=2,
+            batch_timeout=0.2,
+        )
+
+    assert result.requests[0] is not None
+    assert result.failures[1].status is CreateFailureEnum.unknown
+    assert result.failures[2].status is CreateFailureEnum.not_submitted
+    assert result.failures[3].status is CreateFailureEnum.not_submitted
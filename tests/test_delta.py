@@ -0,0 +1,144 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+from helpdesk_client.v3.delta import (
+    DeltaWatermark,
+    RequestDeltaSync,
+    SyncRequestDeltaSync,
+)
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+_START_MS = round(_START.timestamp() * 1000)
+_OVERLAP = timedelta(minutes=5)
+
+
+def _at(seconds: int) -> int:
+    return _START_MS + seconds * 1000
+
+
+class ServiceDesk:
+    """Заявки с `last_updated_time` в миллисекундах, фильтр `gte` и сортировка как у ServiceDesk"""
+
+    def __init__(self, updated: dict[int, int]) -> None:
+        self.updated = updated
+        self.pages: list[tuple[int, int]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        list_info = orjson.loads(request.url.params["input_data"])["list_info"]
+        (criteria,) = list_info["search_criteria"]
+        cursor = int(criteria["value"])
+        page, row_count = list_info["page"], list_info["row_count"]
+        self.pages.append((cursor, page))
+
+        matched = sorted(
+            (updated, ident)
+            for ident, updated in self.updated.items()
+            if updated >= cursor
+        )
+        start = (page - 1) * row_count
+        return httpx.Response(
+            200,
+            json={
+                "requests": [
+                    _request(ident, updated)
+                    for updated, ident in matched[start : start + row_count]
+                ],
+                "list_info": {
+                    "page": page,
+                    "row_count": row_count,
+                    "has_more_rows": start + row_count < len(matched),
+                },
+            },
+        )
+
+
+def _request(ident: int, updated: int) -> dict[str, Any]:
+    created = {"display_value": "", "value": str(_START_MS)}
+    return {
+        "id": ident,
+        "created_time": created,
+        "last_updated_time": {"display_value": "", "value": str(updated)},
+        "group": {"name": "group"},
+        "status": {"name": "Open"},
+        "requester": {"id": 1},
+    }
+
+
+@pytest.mark.anyio
+async def test_cursor_advances_by_last_updated_time() -> None:
+    service_desk = ServiceDesk({ident: _at(ident) for ident in range(1, 6)})
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        delta_sync = RequestDeltaSync(
+            HelpdeskClient(http_client),
+            DeltaWatermark(_START),
+            page_size=2,
+        )
+        changed = [request.id async for request in delta_sync.changes()]
+
+    assert changed == [1, 2, 3, 4, 5]
+    assert service_desk.pages == [
+        (_START_MS - 300_000, 1),
+        (_at(2), 1),
+        (_at(3), 1),
+        (_at(4), 1),
+    ]
+    assert delta_sync.watermark.updated_at == _START + timedelta(seconds=5)
+
+
+@pytest.mark.anyio
+async def test_overlap_skips_already_processed() -> None:
+    service_desk = ServiceDesk({1: _at(1), 2: _at(2), 3: _at(3)})
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client)
+        first = RequestDeltaSync(client, DeltaWatermark(_START), overlap=_OVERLAP)
+        assert [request.id async for request in first.changes()] == [1, 2, 3]
+
+        service_desk.updated[2] = _at(10)
+        service_desk.updated[4] = _at(3)
+        second = RequestDeltaSync(client, first.watermark, overlap=_OVERLAP)
+        changed = [request.id async for request in second.changes()]
+
+    assert changed == [4, 2]
+    assert second.watermark.updated_at == _START + timedelta(seconds=10)
+    assert second.watermark.recent == {
+        (1, _at(1)),
+        (2, _at(2)),
+        (3, _at(3)),
+        (4, _at(3)),
+        (2, _at(10)),
+    }
+
+
+def test_same_timestamp_pages_by_number() -> None:
+    service_desk = ServiceDesk(
+        {ident: _at(1) for ident in range(1, 6)} | {6: _at(2)},
+    )
+    with httpx.Client(
+        transport=httpx.MockTransport(service_desk),
+        base_url="http://servicedesk",
+    ) as http_client:
+        delta_sync = SyncRequestDeltaSync(
+            SyncHelpdeskClient(http_client),
+            DeltaWatermark(_START),
+            page_size=2,
+        )
+        changed = [request.id for request in delta_sync.changes()]
+
+    assert changed == [1, 2, 3, 4, 5, 6]
+    assert service_desk.pages == [
+        (_START_MS - 300_000, 1),
+        (_at(1), 1),
+        (_at(1), 2),
+        (_at(1), 3),
+    ]
+    assert delta_sync.watermark.updated_at == _START + timedelta(seconds=2)
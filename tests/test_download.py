@@ -0,0 +1,189 @@
+import re
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+from helpdesk_client.exceptions import DownloadIntegrityError, HelpdeskClientError
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+_CONTENT = b"0123456789"
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d+)")
+
+
+class RangeServer:
+    """Отдает `content` частями по заголовку `Range`, запрос части с `fail_offset` один раз завершается 500"""
+
+    def __init__(self, content: bytes = _CONTENT, etag: str = '"v1"') -> None:
+        self.content = content
+        self.etag = etag
+        self.ranges: list[str] = []
+        self.fail_offset: int | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        range_header = request.headers["Range"]
+        self.ranges.append(range_header)
+        if not self.content:
+            return httpx.Response(416, headers={"Content-Range": "bytes */0"})
+
+        match = _RANGE_PATTERN.fullmatch(range_header)
+        assert match is not None
+        start, end = int(match[1]), min(int(match[2]), len(self.content) - 1)
+        if start == self.fail_offset:
+            self.fail_offset = None
+            return httpx.Response(500)
+
+        return httpx.Response(
+            206,
+            content=self.content[start : end + 1],
+            headers={
+                "Content-Range": f"bytes {start}-{end}/{len(self.content)}",
+                "ETag": self.etag,
+            },
+        )
+
+
+def _client(server: RangeServer) -> SyncHelpdeskClient:
+    return SyncHelpdeskClient(
+        httpx.Client(
+            transport=httpx.MockTransport(server),
+            base_url="http://servicedesk",
+        ),
+    )
+
+
+def _part_files(path: Path) -> list[Path]:
+    return sorted(path.parent.glob(f"{path.name}.part*"))
+
+
+def test_downloads_in_chunks(tmp_path: Path) -> None:
+    server = RangeServer()
+    path = tmp_path / "file"
+
+    assert _client(server).download_to("files/1", path, chunk_size=4) == path
+
+    assert path.read_bytes() == _CONTENT
+    assert sorted(server.ranges) == ["bytes=0-3", "bytes=4-7", "bytes=8-9"]
+    assert not _part_files(path)
+
+
+def test_resumes_missing_chunks(tmp_path: Path) -> None:
+    server = RangeServer()
+    server.fail_offset = 8
+    path = tmp_path / "file"
+    client = _client(server)
+
+    with pytest.raises(HelpdeskClientError):
+        client.download_to("files/1", path, chunk_size=4, concurrency=1)
+
+    assert _part_files(path) == [
+        tmp_path / "file.part",
+        tmp_path / "file.part.json",
+    ]
+    state = orjson.loads((tmp_path / "file.part.json").read_bytes())
+    assert (state["size"], state["etag"], state["done"]) == (10, '"v1"', [0, 1])
+
+    server.ranges.clear()
+    assert client.download_to("files/1", path, chunk_size=4, concurrency=1) == path
+    assert server.ranges == ["bytes=8-9"]
+    assert path.read_bytes() == _CONTENT
+    assert not _part_files(path)
+
+
+def test_changed_etag_restarts(tmp_path: Path) -> None:
+    server = RangeServer()
+    server.fail_offset = 8
+    path = tmp_path / "file"
+    client = _client(server)
+    with pytest.raises(HelpdeskClientError):
+        client.download_to("files/1", path, chunk_size=4, concurrency=1)
+
+    server.content, server.etag = b"abcdefghij", '"v2"'
+    with pytest.raises(DownloadIntegrityError, match="Resource changed"):
+        client.download_to("files/1", path, chunk_size=4, concurrency=1)
+    assert not _part_files(path)
+
+    assert client.download_to("files/1", path, chunk_size=4) == path
+    assert path.read_bytes() == b"abcdefghij"
+
+
+def test_size_mismatch(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    with pytest.raises(DownloadIntegrityError, match="Expected 11 bytes, got 10"):
+        _client(RangeServer()).download_to(
+            "files/1",
+            path,
+            chunk_size=4,
+            expected_size=11,
+        )
+
+    assert not path.exists()
+    assert not _part_files(path)
+
+
+def test_size_mismatch_without_range_support(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    client = SyncHelpdeskClient(
+        httpx.Client(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(200, content=_CONTENT),
+            ),
+            base_url="http://servicedesk",
+        ),
+    )
+    with pytest.raises(DownloadIntegrityError):
+        client.download_to("files/1", path, expected_size=11)
+
+    assert not path.exists()
+    assert not _part_files(path)
+
+
+@pytest.mark.parametrize("expected_size", [None, 0])
+def test_empty_file(tmp_path: Path, expected_size: int | None) -> None:
+    path = tmp_path / "file"
+    client = _client(RangeServer(content=b""))
+
+    assert client.download_to("files/1", path, expected_size=expected_size) == path
+    assert path.read_bytes() == b""
+    assert not _part_files(path)
+
+
+def test_not_found(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    client = SyncHelpdeskClient(
+        httpx.Client(
+            transport=httpx.MockTransport(lambda _: httpx.Response(404)),
+            base_url="http://servicedesk",
+        ),
+    )
+
+    assert client.download_to("files/1", path) is None
+    assert not path.exists()
+    assert not _part_files(path)
+
+
+@pytest.mark.anyio
+async def test_async_resume_and_empty_file(tmp_path: Path) -> None:
+    server = RangeServer()
+    server.fail_offset = 8
+    path = tmp_path / "file"
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client)
+        with pytest.raises(HelpdeskClientError):
+            await client.download_to("files/1", path, chunk_size=4, concurrency=1)
+
+        server.ranges.clear()
+        assert await client.download_to("files/1", path, chunk_size=4) == path
+        assert server.ranges == ["bytes=8-9"]
+        assert path.read_bytes() == _CONTENT
+
+        server.content = b""
+        empty = tmp_path / "empty"
+        assert await client.download_to("files/2", empty) == empty
+        assert empty.read_bytes() == b""
+
+    assert not _part_files(path)
+    assert not _part_files(empty)
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+import httpx
+import pytest
+from helpdesk_client.enums import EndpointFamilyEnum
+from helpdesk_client.hedging import Hedger, HedgingPolicy
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+_POLICY = HedgingPolicy(
+    min_samples=1,
+    min_delay=0.02,
+    budget_ratio=1.0,
+    families=frozenset({EndpointFamilyEnum.downloads}),
+)
+
+
+def _hedge_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("helpdesk-client-hedge")
+    ]
+
+
+def _http_client(transport: httpx.MockTransport) -> httpx.Client:
+    return httpx.Client(transport=transport, base_url="http://servicedesk")
+
+
+def test_no_pool_without_hedger() -> None:
+    transport = httpx.MockTransport(lambda _: httpx.Response(200))
+    with _http_client(transport) as http_client:
+        client = SyncHelpdeskClient(http_client)
+        client.download("files/1")
+        client.close()
+
+    assert not _hedge_threads()
+
+
+def test_hedge_wins_and_close_stops_pool() -> None:
+    calls = count(1)
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        # Первый запрос задает задержку, исходный запрос второго вызова отвечает медленно
+        if next(calls) == 2:
+            time.sleep(0.5)
+        return httpx.Response(200, content=b"content")
+
+    hedger = Hedger(_POLICY)
+    with _http_client(httpx.MockTransport(handler)) as http_client:
+        client = SyncHelpdeskClient(http_client, hedger=hedger)
+        client.download("files/1")
+        started_at = time.monotonic()
+        client.download("files/1")
+        elapsed = time.monotonic() - started_at
+
+        assert _hedge_threads()
+        client.close()
+
+    assert elapsed < 0.4
+    stats = hedger.stats()[EndpointFamilyEnum.downloads]
+    assert (stats.hedges, stats.hedges_won) == (1, 1)
+    for thread in _hedge_threads():
+        thread.join(timeout=1)
+    assert not _hedge_threads()
+
+
+def test_saturated_pool_runs_on_calling_thread() -> None:
+    threads: set[str] = set()
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return httpx.Response(200, content=b"content")
+
+    with _http_client(httpx.MockTransport(handler)) as http_client:
+        client = SyncHelpdeskClient(http_client, hedger=Hedger(_POLICY))
+        client.download("files/0")
+        with ThreadPoolExecutor(max_workers=48, thread_name_prefix="caller") as callers:
+            results = list(callers.map(client.download, ["files/1"] * 96))
+        client.close()
+
+    assert results == [b"content"] * 96
+    assert any(name.startswith("caller") for name in threads)
+    hedge_threads = {
+        name for name in threads if name.startswith("helpdesk-client-hedge")
+    }
+    assert len(hedge_threads) <= 32
+
+
+@pytest.mark.anyio
+async def test_cancelled_primary_latency_is_recorded() -> None:
+    calls = count(1)
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        # Первый запрос задает задержку, исходный запрос второго вызова отвечает медленно
+        if next(calls) == 2:
+            await asyncio.sleep(1)
+        return httpx.Response(200, content=b"content")
+
+    hedger = Hedger(_POLICY)
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, hedger=hedger)
+        await client.download("files/1")
+        await client.download("files/1")
+
+    window = hedger.window(EndpointFamilyEnum.downloads)
+    assert window is not None
+    assert hedger.stats()[EndpointFamilyEnum.downloads].hedges_won == 1
+    latencies = sorted(window._latencies)  # noqa: SLF001
+    assert len(latencies) == 3
+    assert latencies[-1] >= _POLICY.min_delay
+
+
+def test_sync_losing_primary_latency_is_recorded() -> None:
+    calls = count(1)
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        if next(calls) == 2:
+            time.sleep(0.2)
+        return httpx.Response(200, content=b"content")
+
+    hedger = Hedger(_POLICY)
+    with _http_client(httpx.MockTransport(handler)) as http_client:
+        client = SyncHelpdeskClient(http_client, hedger=hedger)
+        client.download("files/1")
+        client.download("files/1")
+        client.close()
+        for thread in _hedge_threads():
+            thread.join(timeout=1)
+
+    window = hedger.window(EndpointFamilyEnum.downloads)
+    assert window is not None
+    latencies = sorted(window._latencies)  # noqa: SLF001
+    assert len(latencies) == 3
+    assert latencies[-1] >= 0.2
@@ -0,0 +1,110 @@
+import logging
+from pathlib import Path
+
+import httpx
+import pytest
+from helpdesk_client.instrumentation import CallEvent
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+from helpdesk_client.v3.schemas.query_params import CategoryFilterParams
+
+_CONTENT = b"attachment content"
+
+
+def _handler(_: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=_CONTENT)
+
+
+def _failing_hook(event: CallEvent) -> None:
+    msg = f"hook failed for {event.method}"
+    raise RuntimeError(msg)
+
+
+@pytest.mark.anyio
+async def test_failing_hook_does_not_change_result(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    events: list[CallEvent] = []
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, hooks=[_failing_hook, events.append])
+        with caplog.at_level(logging.ERROR, "helpdesk_client.instrumentation"):
+            content = await client.download("files/1")
+
+    assert content == _CONTENT
+    assert [event.method for event in events] == ["download"]
+    assert "hook failed for download" in caplog.text
+
+
+def test_sync_failing_hook_does_not_change_result() -> None:
+    events: list[CallEvent] = []
+    with httpx.Client(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, hooks=[_failing_hook, events.append])
+        assert client.download("files/1") == _CONTENT
+
+    assert [event.method for event in events] == ["download"]
+
+
+@pytest.mark.anyio
+async def test_download_to_is_instrumented(tmp_path: Path) -> None:
+    events: list[CallEvent] = []
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, hooks=[events.append])
+        path = await client.download_to("files/1", tmp_path / "file")
+
+    assert path is not None
+    assert path.read_bytes() == _CONTENT
+    (event,) = events
+    assert event.method == "download_to"
+    assert event.status_code == 200
+    assert event.error is None
+
+
+def test_sync_download_to_is_instrumented(tmp_path: Path) -> None:
+    events: list[CallEvent] = []
+    with httpx.Client(
+        transport=httpx.MockTransport(_handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, hooks=[events.append])
+        assert client.download_to("files/1", tmp_path / "file") is not None
+
+    (event,) = events
+    assert event.method == "download_to"
+    assert event.status_code == 200
+
+
+def _categories(_: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "categories": [{"id": 1, "name": "category", "deleted": False}],
+            "list_info": {"row_count": 10, "start_index": 1, "has_more_rows": False},
+        },
+    )
+
+
+@pytest.mark.anyio
+async def test_decode_and_validation_time() -> None:
+    events: list[CallEvent] = []
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_categories),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, hooks=[events.append])
+        filter_ = CategoryFilterParams(limit=10, offset=1)
+        await client.get_categories(filter_)
+        await client.get_categories_raw(filter_)
+
+    validated, raw = events
+    assert validated.decode_time == 0
+    assert validated.validation_time > 0
+    assert raw.decode_time > 0
+    assert raw.validation_time == 0
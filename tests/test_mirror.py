@@ -0,0 +1,111 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from helpdesk_client.enums import SortEnum
+from helpdesk_client.mirror import RequestMirror
+from helpdesk_client.v3.delta import DeltaWatermark
+from helpdesk_client.v3.schemas.response import RequestSchema
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _request(
+    ident: int,
+    *,
+    status: str = "Open",
+    requester_id: int = 1,
+    subject: str = "subject",
+) -> RequestSchema:
+    created = _START + timedelta(hours=ident)
+    return RequestSchema.model_validate(
+        {
+            "id": ident,
+            "subject": subject,
+            "created_time": {
+                "display_value": "",
+                "value": str(round(created.timestamp() * 1000)),
+            },
+            "group": {"name": "group"},
+            "status": {"name": status},
+            "requester": {"id": requester_id},
+            "technician": {"id": 7, "name": "technician"},
+        },
+    )
+
+
+@pytest.fixture
+def mirror() -> RequestMirror:
+    return RequestMirror()
+
+
+def test_upsert_and_get_round_trip(mirror: RequestMirror) -> None:
+    request = _request(1)
+    assert mirror.upsert([request]) == 1
+
+    assert mirror.get(1) == request
+    assert mirror.get(2) is None
+
+
+def test_upsert_is_idempotent(mirror: RequestMirror) -> None:
+    mirror.upsert([_request(1), _request(2)])
+    mirror.upsert([_request(1), _request(2)])
+    mirror.upsert([_request(1, status="Closed", subject="updated")])
+
+    assert mirror.count() == 2
+    updated = mirror.get(1)
+    assert updated is not None
+    assert (updated.status.name, updated.subject) == ("Closed", "updated")
+    assert mirror.count(status="Open") == 1
+
+
+def test_query_by_status_requester_and_created_time(mirror: RequestMirror) -> None:
+    mirror.upsert(
+        [
+            _request(1),
+            _request(2, status="Closed"),
+            _request(3, requester_id=2),
+            _request(4),
+        ],
+    )
+
+    def ids(requests: list[RequestSchema]) -> list[int]:
+        return [request.id for request in requests]
+
+    assert ids(mirror.query(status="Open")) == [4, 3, 1]
+    assert ids(mirror.query(status="Open", sort_order=SortEnum.asc)) == [1, 3, 4]
+    assert ids(mirror.query(status="Open", requester_id=1)) == [4, 1]
+    assert ids(mirror.query(status="Closed", requester_id=1)) == [2]
+    assert ids(
+        mirror.query(
+            created_from=_START + timedelta(hours=2),
+            created_to=_START + timedelta(hours=4),
+        ),
+    ) == [3, 2]
+    assert ids(mirror.query(limit=2, offset=1)) == [3, 2]
+    assert mirror.count(status="Closed") == 1
+
+
+def test_delete(mirror: RequestMirror) -> None:
+    mirror.upsert([_request(1)])
+    mirror.delete(1)
+
+    assert mirror.get(1) is None
+    assert mirror.count() == 0
+
+
+def test_watermark_survives_reopen(tmp_path: Path) -> None:
+    watermark = DeltaWatermark(
+        updated_at=_START + timedelta(minutes=5),
+        recent=frozenset({(1, 1704067500000), (2, 1704067500000)}),
+    )
+    path = tmp_path / "mirror.sqlite"
+    with RequestMirror(path) as mirror:
+        assert mirror.load_watermark() is None
+        mirror.save_watermark(DeltaWatermark(updated_at=_START))
+        mirror.save_watermark(watermark)
+        mirror.upsert([_request(1)])
+
+    with RequestMirror(path) as mirror:
+        assert mirror.load_watermark() == watermark
+        assert mirror.count() == 1
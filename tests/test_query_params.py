@@ -0,0 +1,134 @@
+import pytest
+from helpdesk_client.enums import (
+    RequestFieldEnum,
+    SearchCriteriaConditionEnum,
+    SearchCriteriaFieldEnum,
+    SearchCriteriaLogicalOperatorEnum,
+    SortEnum,
+)
+from helpdesk_client.v3.schemas import query_params
+from helpdesk_client.v3.schemas.query_params import (
+    CategoryFilterParams,
+    CategorySearchFields,
+    HelpdeskFilter,
+    RequestCriteriaFilterPagePaginationParams,
+    RequestFilterPagePaginationParams,
+    RequestFilterParams,
+    RequestSearchFields,
+    SearchCriteria,
+    SubcategoryFilterParams,
+    SubcategorySearchFields,
+    TemplateFilterParams,
+    TemplateSearchFields,
+    UrgencyFilterParams,
+    UrgencySearchFields,
+    dump_input_data,
+)
+from pydantic import BaseModel
+
+_FILTERS: list[BaseModel] = [
+    RequestFilterParams(limit=100, offset=1),
+    RequestFilterParams(limit=10, offset=21, can_include_count=True),
+    RequestFilterParams(
+        limit=5,
+        offset=1,
+        sort_field="created_time",
+        sort_order=SortEnum.desc,
+        fields_required=[RequestFieldEnum.subject, "udf_fields"],
+        search_fields=RequestSearchFields(requester_name="Иванов", requester_id=7),
+    ),
+    RequestFilterPagePaginationParams(
+        page=3,
+        page_size=50,
+        search_fields=RequestSearchFields(requester_id=7),
+    ),
+    RequestCriteriaFilterPagePaginationParams(page=1, page_size=10),
+    RequestCriteriaFilterPagePaginationParams(
+        page=2,
+        page_size=100,
+        sort_field=SearchCriteriaFieldEnum.last_updated_time.value,
+        sort_order=SortEnum.asc,
+        search_criteria=[
+            SearchCriteria(
+                field=SearchCriteriaFieldEnum.last_updated_time,
+                value="1704067200000",
+                condition=SearchCriteriaConditionEnum.gte,
+            ),
+            SearchCriteria(
+                field="status.name",
+                value='"Closed" \\ </p>',
+                condition="neq",
+                logical_operator=SearchCriteriaLogicalOperatorEnum.and_,
+            ),
+        ],
+    ),
+    CategoryFilterParams(
+        limit=100,
+        offset=1,
+        search_fields=CategorySearchFields(is_deleted=False),
+    ),
+    SubcategoryFilterParams(
+        limit=100,
+        offset=1,
+        search_fields=SubcategorySearchFields(category_name="Сеть"),
+    ),
+    UrgencyFilterParams(
+        limit=1,
+        offset=1,
+        search_fields=UrgencySearchFields(name="High"),
+    ),
+    TemplateFilterParams(
+        limit=10,
+        offset=11,
+        search_fields=TemplateSearchFields(service_category_id=3),
+    ),
+]
+
+
+def _expected(filter_: BaseModel) -> str:
+    return HelpdeskFilter(list_info=filter_).model_dump_json(  # type: ignore[arg-type]
+        by_alias=True,
+        exclude_unset=True,
+    )
+
+
+@pytest.mark.parametrize("filter_", _FILTERS)
+def test_matches_helpdesk_filter(filter_: BaseModel) -> None:
+    assert dump_input_data(filter_) == _expected(filter_)
+    # Повторный вызов берет поля фильтра из кэша
+    assert dump_input_data(filter_) == _expected(filter_)
+
+
+def test_pagination_changes_with_cached_filter() -> None:
+    search_fields = CategorySearchFields(name="category")
+    # `get_total_count` задан только у первой страницы
+    filters = [
+        CategoryFilterParams(
+            limit=10,
+            offset=1,
+            can_include_count=True,
+            search_fields=search_fields,
+        ),
+        *(
+            CategoryFilterParams(limit=10, offset=offset, search_fields=search_fields)
+            for offset in range(2, 5)
+        ),
+    ]
+    for filter_ in filters:
+        assert dump_input_data(filter_) == _expected(filter_)
+
+
+def test_cache_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(query_params, "_COMPILED_FILTERS_MAXSIZE", 4)
+    monkeypatch.setattr(query_params, "_compiled_filters", {})
+    filters = [
+        CategoryFilterParams(
+            limit=10,
+            offset=1,
+            search_fields=CategorySearchFields(name=f"name {index}"),
+        )
+        for index in range(10)
+    ]
+    for filter_ in [*filters, *reversed(filters)]:
+        assert dump_input_data(filter_) == _expected(filter_)
+        assert len(query_params._compiled_filters) <= 4  # noqa: SLF001
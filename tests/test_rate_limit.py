@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from helpdesk_client.deadline import deadline
+from helpdesk_client.enums import EndpointFamilyEnum
+from helpdesk_client.exceptions import DeadlineExceededError
+from helpdesk_client.rate_limit import RateLimit, RateLimiter, TokenBucket
+from helpdesk_client.v3.client import SyncHelpdeskClient
+
+_FAMILY = EndpointFamilyEnum.requests
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize("rate", [0, -1])
+def test_rate_must_be_positive(rate: float) -> None:
+    with pytest.raises(ValueError, match="Rate must be positive"):
+        RateLimit(rate=rate, burst=1)
+
+
+def test_burst_then_wait() -> None:
+    bucket = TokenBucket(RateLimit(rate=10, burst=3), clock=Clock())
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    assert bucket.level == pytest.approx(-2)
+
+
+def test_refill_is_capped_by_burst() -> None:
+    clock = Clock()
+    bucket = TokenBucket(RateLimit(rate=10, burst=3), clock=clock)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now = 0.1
+    assert bucket.level == pytest.approx(1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+
+    clock.now = 100
+    assert bucket.level == 3
+
+
+def test_refund() -> None:
+    bucket = TokenBucket(RateLimit(rate=10, burst=1), clock=Clock())
+    bucket.reserve()
+    bucket.reserve()
+    bucket.refund()
+
+    assert bucket.level == 0
+    bucket.refund()
+    bucket.refund()
+    assert bucket.level == 1
+
+
+def test_unlimited_family_does_not_wait() -> None:
+    limiter = RateLimiter({_FAMILY: RateLimit(rate=1, burst=1)})
+    limiter.acquire_sync(EndpointFamilyEnum.downloads)
+
+    assert limiter.levels() == {_FAMILY: 1}
+
+
+@pytest.mark.anyio
+async def test_cancelled_wait_returns_token() -> None:
+    limiter = RateLimiter({_FAMILY: RateLimit(rate=1, burst=1)})
+    await limiter.acquire(_FAMILY)
+
+    waiter = asyncio.create_task(limiter.acquire(_FAMILY))
+    await asyncio.sleep(0.01)
+    assert limiter.levels()[_FAMILY] < -0.5
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.levels()[_FAMILY] == pytest.approx(0, abs=0.1)
+
+
+def test_sync_wait_longer_than_timeout_is_refused() -> None:
+    limiter = RateLimiter({_FAMILY: RateLimit(rate=1, burst=1)})
+    assert limiter.acquire_sync(_FAMILY, timeout=0)
+    assert not limiter.acquire_sync(_FAMILY, timeout=0.5)
+
+    assert limiter.levels()[_FAMILY] == pytest.approx(0, abs=0.1)
+
+
+def test_sync_client_rate_limit_wait_is_bounded_by_deadline() -> None:
+    calls = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, content=b"content")
+
+    limiter = RateLimiter({EndpointFamilyEnum.downloads: RateLimit(rate=0.5, burst=1)})
+    with httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, rate_limiter=limiter)
+        client.download("files/1")
+        started_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as exc_info, deadline(0.1):
+            client.download("files/1")
+
+    assert time.monotonic() - started_at < 0.5
+    assert not exc_info.value.sent
+    assert calls == 1
@@ -0,0 +1,250 @@
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+from helpdesk_client.enums import RequestFieldEnum
+from helpdesk_client.exceptions import HelpdeskClientError
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+from helpdesk_client.v3.schemas.query_params import (
+    RequestFilterPagePaginationParams,
+    RequestFilterParams,
+)
+from helpdesk_client.v3.schemas.response import (
+    PartialRequestSchema,
+    RequestListSchema,
+    RequestPaginationResponseSchema,
+    RequestSchema,
+)
+
+_REQUESTS = [
+    {
+        "id": ident,
+        "subject": f"subject {ident}",
+        "created_time": {"display_value": "", "value": "1704067200000"},
+        "group": {"name": "group"},
+        "status": {"name": "Open"},
+        "requester": {"id": 1},
+    }
+    for ident in range(1, 6)
+]
+
+
+class ServiceDesk:
+    """Отдает заявки `_REQUESTS` списком и по id, id 0 завершается 500"""
+
+    def __init__(self) -> None:
+        self.list_infos: list[dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        ident = request.url.path.removeprefix("/api/v3/requests").strip("/")
+        if ident:
+            return self._request(int(ident))
+
+        list_info: dict[str, Any] = orjson.loads(request.url.params["input_data"])[
+            "list_info"
+        ]
+        self.list_infos.append(list_info)
+        row_count = list_info["row_count"]
+        if "page" in list_info:
+            start = (list_info["page"] - 1) * row_count
+            pagination = {"page": list_info["page"]}
+        else:
+            start = list_info["start_index"] - 1
+            pagination = {"start_index": list_info["start_index"]}
+
+        requests = _REQUESTS[start : start + row_count]
+        if "fields_required" in list_info:
+            fields = {"id", *list_info["fields_required"]}
+            requests = [
+                {key: value for key, value in request.items() if key in fields}
+                for request in requests
+            ]
+        return httpx.Response(
+            200,
+            json={
+                "requests": requests,
+                "list_info": {
+                    "row_count": row_count,
+                    "has_more_rows": start + row_count < len(_REQUESTS),
+                    **pagination,
+                },
+            },
+        )
+
+    def _request(self, ident: int) -> httpx.Response:
+        if ident == 0:
+            return httpx.Response(500)
+        for request in _REQUESTS:
+            if request["id"] == ident:
+                return httpx.Response(200, json={"request": request})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def server() -> ServiceDesk:
+    return ServiceDesk()
+
+
+@pytest.fixture
+async def client(server: ServiceDesk) -> AsyncIterator[HelpdeskClient]:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        yield HelpdeskClient(http_client)
+
+
+@pytest.fixture
+def sync_client(server: ServiceDesk) -> Iterator[SyncHelpdeskClient]:
+    with httpx.Client(
+        transport=httpx.MockTransport(server),
+        base_url="http://servicedesk",
+    ) as http_client:
+        yield SyncHelpdeskClient(http_client)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("page", "expected"), [(1, [1, 2, 3, 4, 5]), (2, [3, 4, 5])])
+async def test_iter_requests(
+    client: HelpdeskClient,
+    server: ServiceDesk,
+    page: int,
+    expected: list[int],
+) -> None:
+    filter_ = RequestFilterPagePaginationParams(page=page, page_size=2)
+    requests = [request async for request in client.iter_requests(filter_)]
+
+    assert [request.id for request in requests] == expected
+    assert sorted(info["page"] for info in server.list_infos) == list(range(page, 4))
+
+    pages = [
+        await client.get_requests_page_paginated(filter_.model_copy(update={"page": n}))
+        for n in range(page, 4)
+    ]
+    assert requests == [request for page_ in pages for request in page_.requests]
+
+
+@pytest.mark.parametrize(("page", "expected"), [(1, [1, 2, 3, 4, 5]), (2, [3, 4, 5])])
+def test_sync_iter_requests(
+    sync_client: SyncHelpdeskClient,
+    server: ServiceDesk,
+    page: int,
+    expected: list[int],
+) -> None:
+    filter_ = RequestFilterPagePaginationParams(page=page, page_size=2)
+    requests = list(sync_client.iter_requests(filter_))
+
+    assert [request.id for request in requests] == expected
+    assert sorted(info["page"] for info in server.list_infos) == list(range(page, 4))
+
+    pages = [
+        sync_client.get_requests_page_paginated(filter_.model_copy(update={"page": n}))
+        for n in range(page, 4)
+    ]
+    assert requests == [request for page_ in pages for request in page_.requests]
+
+
+@pytest.mark.anyio
+async def test_get_requests_by_ids(client: HelpdeskClient) -> None:
+    result = await client.get_requests_by_ids([3, 1, 99, 0, 3], concurrency=2)
+
+    assert list(result.requests) == [3, 1, 99]
+    assert result.requests[3] == await client.get_request(3)
+    assert result.requests[1] == await client.get_request(1)
+    assert result.requests[99] is None
+    assert list(result.errors) == [0]
+    assert isinstance(result.errors[0], HelpdeskClientError)
+
+
+def test_sync_get_requests_by_ids(sync_client: SyncHelpdeskClient) -> None:
+    result = sync_client.get_requests_by_ids([3, 1, 99, 0, 3], concurrency=2)
+
+    assert list(result.requests) == [3, 1, 99]
+    assert result.requests[3] == sync_client.get_request(3)
+    assert result.requests[1] == sync_client.get_request(1)
+    assert result.requests[99] is None
+    assert list(result.errors) == [0]
+    assert isinstance(result.errors[0], HelpdeskClientError)
+
+
+@pytest.mark.anyio
+async def test_raw_matches_parsed(client: HelpdeskClient) -> None:
+    filter_ = RequestFilterParams(limit=2, offset=2)
+    raw = await client.get_requests_raw(filter_)
+    assert raw["requests"] == _REQUESTS[1:3]
+    assert RequestListSchema.model_validate(raw) == await client.get_requests(filter_)
+
+    page_filter = RequestFilterPagePaginationParams(page=2, page_size=2)
+    raw = await client.get_requests_page_paginated_raw(page_filter)
+    assert RequestPaginationResponseSchema.model_validate(
+        raw,
+    ) == await client.get_requests_page_paginated(page_filter)
+
+
+def test_sync_raw_matches_parsed(sync_client: SyncHelpdeskClient) -> None:
+    filter_ = RequestFilterParams(limit=2, offset=2)
+    raw = sync_client.get_requests_raw(filter_)
+    assert raw["requests"] == _REQUESTS[1:3]
+    assert RequestListSchema.model_validate(raw) == sync_client.get_requests(filter_)
+
+    page_filter = RequestFilterPagePaginationParams(page=2, page_size=2)
+    raw = sync_client.get_requests_page_paginated_raw(page_filter)
+    assert RequestPaginationResponseSchema.model_validate(
+        raw,
+    ) == sync_client.get_requests_page_paginated(page_filter)
+
+
+_FIELDS_REQUIRED = [RequestFieldEnum.subject, RequestFieldEnum.status]
+
+
+def _assert_partial(
+    server: ServiceDesk,
+    requests: Sequence[PartialRequestSchema],
+    expected: Sequence[RequestSchema],
+) -> None:
+    assert server.list_infos[-1]["fields_required"] == ["subject", "status"]
+    assert [request.id for request in requests] == [request.id for request in expected]
+    for partial, full in zip(requests, expected, strict=True):
+        assert (partial.subject, partial.status) == (full.subject, full.status)
+        assert partial.requester is None
+        assert partial.created_time is None
+
+
+@pytest.mark.anyio
+async def test_partial_requests(client: HelpdeskClient, server: ServiceDesk) -> None:
+    filter_ = RequestFilterParams(limit=2, offset=1)
+    expected = await client.get_requests(filter_)
+    partial = await client.get_partial_requests(
+        filter_.model_copy(update={"fields_required": _FIELDS_REQUIRED}),
+    )
+    _assert_partial(server, partial.requests, expected.requests)
+
+    page_filter = RequestFilterPagePaginationParams(page=2, page_size=2)
+    expected_page = await client.get_requests_page_paginated(page_filter)
+    partial_page = await client.get_partial_requests_page_paginated(
+        page_filter.model_copy(update={"fields_required": _FIELDS_REQUIRED}),
+    )
+    _assert_partial(server, partial_page.requests, expected_page.requests)
+    assert partial_page.list_info == expected_page.list_info
+
+
+def test_sync_partial_requests(
+    sync_client: SyncHelpdeskClient,
+    server: ServiceDesk,
+) -> None:
+    filter_ = RequestFilterParams(limit=2, offset=1)
+    expected = sync_client.get_requests(filter_)
+    partial = sync_client.get_partial_requests(
+        filter_.model_copy(update={"fields_required": _FIELDS_REQUIRED}),
+    )
+    _assert_partial(server, partial.requests, expected.requests)
+
+    page_filter = RequestFilterPagePaginationParams(page=2, page_size=2)
+    expected_page = sync_client.get_requests_page_paginated(page_filter)
+    partial_page = sync_client.get_partial_requests_page_paginated(
+        page_filter.model_copy(update={"fields_required": _FIELDS_REQUIRED}),
+    )
+    _assert_partial(server, partial_page.requests, expected_page.requests)
+    assert partial_page.list_info == expected_page.list_info
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+from helpdesk_client.v3.client import HelpdeskClient
+from helpdesk_client.v3.resolution import extract_inline_urls
+from helpdesk_client.v3.schemas.response import ResolutionSchema
+
+_HTML = """
+<p>Решение</p>
+<img src="/api/v3/requests/1/inline_image?id=1">
+<img src="http://sd.local/api/v3/requests/1/inline_image?id=2">
+<img src="//sd.local/api/v3/requests/1/inline_image?id=3">
+<img src="https://sd.local/api/v3/requests/1/inline_image?id=4">
+<img src="http://other.local/image.png">
+<img src="data:image/png;base64,AAAA">
+<img src="http://[broken/image.png">
+<img src="/api/v3/requests/1/inline_image?id=1">
+<img alt="без src">
+"""
+
+
+def test_without_base_url_skips_absolute() -> None:
+    assert extract_inline_urls(_HTML) == ["/api/v3/requests/1/inline_image?id=1"]
+
+
+def test_same_origin_urls_are_relative() -> None:
+    assert extract_inline_urls(_HTML, "http://sd.local") == [
+        "/api/v3/requests/1/inline_image?id=1",
+        "/api/v3/requests/1/inline_image?id=2",
+        "/api/v3/requests/1/inline_image?id=3",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("src", "expected"),
+    [
+        ("http://sd.local/sd/image.png", ["/image.png"]),
+        ("http://sd.local:80/sd/image.png", ["/image.png"]),
+        ("http://sd.local/sd", ["/"]),
+        ("http://sd.local/sdx/image.png", []),
+        ("http://sd.local/image.png", []),
+    ],
+)
+def test_base_url_path_is_stripped(src: str, expected: list[str]) -> None:
+    assert extract_inline_urls(f'<img src="{src}">', "http://sd.local/sd/") == expected
+
+
+@pytest.mark.anyio
+async def test_resolution_resources_use_client_base_url() -> None:
+    resolution = ResolutionSchema.model_validate(
+        {
+            "content": '<img src="http://sd.local/sd/image.png"><img src="/inline.png">',
+            "resolution_attachments": [],
+            "submitted_by": {"id": 1},
+            "submitted_on": {"display_value": "", "value": "1704067200000"},
+        },
+    )
+    paths: list[str] = []
+
+    def image(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, content=b"image")
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(image),
+        base_url="http://sd.local/sd/",
+    ) as http_client:
+        resources = await HelpdeskClient(http_client).get_resolution_resources(
+            resolution,
+        )
+
+    assert resources.resources == {"/image.png": b"image", "/inline.png": b"image"}
+    assert sorted(paths) == ["/sd/image.png", "/sd/inline.png"]
@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from helpdesk_client.exceptions import DeadlineExceededError
+from helpdesk_client.retry import RetryPolicy
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+
+_TOTAL_TIMEOUT = 0.2
+
+
+@pytest.mark.anyio
+async def test_total_timeout_limits_attempt_in_flight() -> None:
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, request=request)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(slow),
+        base_url="http://servicedesk",
+        timeout=30,
+    ) as http_client:
+        client = HelpdeskClient(
+            http_client,
+            retry_policy=RetryPolicy(total_timeout=_TOTAL_TIMEOUT),
+        )
+        started_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as error:
+            await client.get_request(1)
+
+    assert error.value.sent
+    assert time.monotonic() - started_at < 1
+
+
+def test_total_timeout_limits_attempt_timeouts() -> None:
+    timeouts: list[dict[str, float]] = []
+
+    def not_found(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(404)
+
+    with httpx.Client(
+        transport=httpx.MockTransport(not_found),
+        base_url="http://servicedesk",
+        timeout=30,
+    ) as http_client:
+        client = SyncHelpdeskClient(
+            http_client,
+            retry_policy=RetryPolicy(total_timeout=_TOTAL_TIMEOUT),
+        )
+        assert client.get_request(1) is None
+
+    assert all(0 < value <= _TOTAL_TIMEOUT for value in timeouts[0].values())
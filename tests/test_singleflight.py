@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import httpx
+import pytest
+from helpdesk_client.deadline import deadline
+from helpdesk_client.exceptions import DeadlineExceededError
+from helpdesk_client.singleflight import AsyncSingleFlight, SingleFlight
+from helpdesk_client.v3.client import HelpdeskClient
+
+
+@pytest.mark.anyio
+async def test_deadline_failure_is_not_shared() -> None:
+    calls = 0
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, content=b"content", request=request)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(slow),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, coalesce_reads=True)
+
+        async def with_deadline() -> None:
+            with deadline(0.05):
+                await client.download("files/1")
+
+        limited: BaseException | None
+        unlimited: bytes | BaseException | None
+        limited, unlimited = await asyncio.gather(
+            with_deadline(),
+            client.download("files/1"),
+            return_exceptions=True,
+        )
+
+    assert isinstance(limited, DeadlineExceededError)
+    assert unlimited == b"content"
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_waiter_is_bounded_by_its_deadline() -> None:
+    single_flight = AsyncSingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    started_at = time.monotonic()
+    with deadline(0.05):
+        results = await asyncio.gather(
+            single_flight.do("key", fetch),
+            single_flight.do("key", fetch),
+            return_exceptions=True,
+        )
+
+    assert time.monotonic() - started_at < 0.5
+    assert all(isinstance(result, DeadlineExceededError) for result in results)
+    assert calls == 1
+    release.set()
+    await asyncio.sleep(0)
+
+
+def test_sync_waiter_is_bounded_by_its_deadline() -> None:
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch() -> int:
+        started.set()
+        release.wait()
+        return 1
+
+    with deadline(0.05), ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(copy_context().run, single_flight.do, "key", fetch)
+        started.wait()
+        started_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            single_flight.do("key", fetch)
+
+        assert time.monotonic() - started_at < 0.5
+        release.set()
+        assert leader.result() == 1
+
+
+def test_sync_calls_with_different_deadlines_are_not_shared() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    with deadline(10):
+        first = single_flight.do("key", fetch)
+    second = single_flight.do("key", fetch)
+
+    assert (first, second) == (1, 2)
@@ -0,0 +1,74 @@
+import random
+from collections.abc import Iterable
+
+import orjson
+import pytest
+from helpdesk_client.streaming import JsonArrayItemsParser
+
+_REQUESTS = [
+    {"id": 1, "subject": "plain"},
+    {"id": 2, "subject": 'quote \\" and backslash \\\\', "tags": ["[", "]"]},
+    {"id": 3, "description": '<p>{"requests": [1]}</p> \\\\"', "nested": {"a": [{}]}},
+    {"id": 4, "subject": "юникод \\u0436 \\n", "empty": []},
+]
+_DOCUMENT = (
+    b'{"meta": {"requests": [{"id": 0}]}, "note": "requests", '
+    b'"requests" : [' + b", ".join(orjson.dumps(item) for item in _REQUESTS) + b"], "
+    b'"list_info": {"has_more_rows": false}}'
+)
+
+
+def _parse(chunks: Iterable[bytes]) -> list[bytes]:
+    parser = JsonArrayItemsParser("requests")
+    items = [item for chunk in chunks for item in parser.feed(chunk)]
+    assert parser.is_done
+    return items
+
+
+def _expected() -> list[object]:
+    items: list[object] = orjson.loads(_DOCUMENT)["requests"]
+    return items
+
+
+def test_whole_document() -> None:
+    assert [orjson.loads(item) for item in _parse([_DOCUMENT])] == _expected()
+
+
+@pytest.mark.parametrize("split_at", range(1, len(_DOCUMENT)))
+def test_split_at_every_offset(split_at: int) -> None:
+    chunks = [_DOCUMENT[:split_at], _DOCUMENT[split_at:]]
+    assert [orjson.loads(item) for item in _parse(chunks)] == _expected()
+
+
+def test_single_byte_chunks() -> None:
+    chunks = [_DOCUMENT[index : index + 1] for index in range(len(_DOCUMENT))]
+    assert [orjson.loads(item) for item in _parse(chunks)] == _expected()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_chunk_boundaries(seed: int) -> None:
+    rng = random.Random(seed)
+    offsets = sorted(rng.sample(range(1, len(_DOCUMENT)), 15))
+    chunks = [
+        _DOCUMENT[start:end]
+        for start, end in zip([0, *offsets], [*offsets, len(_DOCUMENT)], strict=True)
+    ]
+    assert [orjson.loads(item) for item in _parse(chunks)] == _expected()
+
+
+def test_escape_at_chunk_edge() -> None:
+    escape = _DOCUMENT.index(b'\\"')
+    chunks = [_DOCUMENT[: escape + 1], _DOCUMENT[escape + 1 :]]
+    assert [orjson.loads(item) for item in _parse(chunks)] == _expected()
+
+
+def test_items_are_bytes_of_document() -> None:
+    items = _parse([_DOCUMENT])
+    assert all(item in _DOCUMENT for item in items)
+
+
+def test_ignores_data_after_array() -> None:
+    parser = JsonArrayItemsParser("requests")
+    assert parser.feed(b'{"requests": []') == []
+    assert parser.is_done
+    assert parser.feed(b', "requests": [{"id": 1}]}') == []
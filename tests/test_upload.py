@@ -0,0 +1,185 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from io import BufferedReader
+from pathlib import Path
+
+import httpx
+import pytest
+from helpdesk_client.exceptions import HelpdeskClientError
+from helpdesk_client.retry import RetryPolicy
+from helpdesk_client.v3.client import HelpdeskClient, SyncHelpdeskClient
+from helpdesk_client.v3.dto import UploadFileDTO
+from helpdesk_client.v3.upload import MultipartUpload
+
+_CONTENT = b"0123456789"
+_ATTACHMENT = {
+    "attachment": {
+        "id": 1,
+        "name": "file.txt",
+        "content_url": "/api/v3/requests/1/attachments/1/download",
+        "attached_by": {"id": 1},
+        "attached_on": {"display_value": "", "value": "1704067200000"},
+        "size": {"display_value": "10 bytes", "value": 10},
+    },
+}
+_RETRY_POLICY = RetryPolicy(base_delay=0, max_delay=0)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "file.txt"
+    path.write_bytes(_CONTENT)
+    return path
+
+
+async def _chunks() -> AsyncIterator[bytes]:
+    yield _CONTENT[:4]
+    yield _CONTENT[4:]
+
+
+def _dto(
+    file: BufferedReader | Path | AsyncIterable[bytes],
+    *,
+    use_mmap: bool = False,
+) -> UploadFileDTO:
+    return UploadFileDTO(
+        file=file,
+        filename="file.txt",
+        content_type="text/plain",
+        use_mmap=use_mmap,
+    )
+
+
+def _expected_body(upload: MultipartUpload) -> bytes:
+    boundary = upload.headers["Content-Type"].removeprefix(
+        "multipart/form-data; boundary=",
+    )
+    return (
+        (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="input_file"; filename="file.txt"\r\n'
+            "Content-Type: text/plain\r\n\r\n"
+        ).encode()
+        + _CONTENT
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_path_source(path: Path, *, use_mmap: bool) -> None:
+    progress: list[tuple[int, int | None]] = []
+    upload = MultipartUpload(
+        _dto(path, use_mmap=use_mmap),
+        field="input_file",
+        chunk_size=4,
+        on_progress=lambda sent, size: progress.append((sent, size)),
+    )
+
+    body = b"".join(upload.sync_content())
+    assert body == _expected_body(upload)
+    assert int(upload.headers["Content-Length"]) == len(body)
+    assert b"".join(upload.sync_content()) == body
+    assert progress == [(4, 10), (8, 10), (10, 10)] * 2
+    assert upload.is_replayable
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_open_file_is_read_from_start(path: Path, *, use_mmap: bool) -> None:
+    with path.open("rb") as file:
+        file.read(3)
+        upload = MultipartUpload(_dto(file, use_mmap=use_mmap), field="input_file")
+
+        assert b"".join(upload.sync_content()) == _expected_body(upload)
+        assert b"".join(upload.sync_content()) == _expected_body(upload)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("use_mmap", [False, True])
+async def test_async_content_from_path(path: Path, *, use_mmap: bool) -> None:
+    upload = MultipartUpload(
+        _dto(path, use_mmap=use_mmap),
+        field="input_file",
+        chunk_size=4,
+    )
+
+    for _ in range(2):
+        body = b"".join([bytes(chunk) async for chunk in upload.async_content()])
+        assert body == _expected_body(upload)
+
+
+@pytest.mark.anyio
+async def test_async_source_is_one_shot() -> None:
+    upload = MultipartUpload(_dto(_chunks()), field="input_file")
+
+    assert "Content-Length" not in upload.headers
+    assert not upload.is_replayable
+    body = b"".join([chunk async for chunk in upload.async_content()])
+    assert body == _expected_body(upload)
+    with pytest.raises(httpx.StreamConsumed):
+        async for _ in upload.async_content():
+            pass
+    with pytest.raises(ValueError, match="Async file source"):
+        upload.sync_content()
+
+
+@pytest.mark.anyio
+async def test_async_source_is_not_retried() -> None:
+    bodies: list[bytes] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(await request.aread())
+        return httpx.Response(429)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, retry_policy=_RETRY_POLICY)
+        with pytest.raises(HelpdeskClientError) as exc_info:
+            await client.attach_file_to_request(1, _dto(_chunks()))
+
+    assert exc_info.value.status_code == 429
+    assert len(bodies) == 1
+    assert _CONTENT in bodies[0]
+
+
+@pytest.mark.anyio
+async def test_path_source_is_retried(path: Path) -> None:
+    bodies: list[bytes] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(await request.aread())
+        if len(bodies) == 1:
+            return httpx.Response(429)
+        return httpx.Response(200, json=_ATTACHMENT)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = HelpdeskClient(http_client, retry_policy=_RETRY_POLICY)
+        attachment = await client.attach_file_to_request(1, _dto(path))
+
+    assert attachment.id == 1
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
+
+
+def test_sync_path_source_is_retried(path: Path) -> None:
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        if len(bodies) == 1:
+            return httpx.Response(429)
+        return httpx.Response(200, json=_ATTACHMENT)
+
+    with httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="http://servicedesk",
+    ) as http_client:
+        client = SyncHelpdeskClient(http_client, retry_policy=_RETRY_POLICY)
+        attachment = client.attach_file_to_request(1, _dto(path))
+
+    assert attachment.id == 1
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
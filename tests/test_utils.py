@@ -0,0 +1,39 @@
+import pytest
+from helpdesk_client.utils import remove_html_tags
+from helpdesk_client.v3.schemas.response import ResolutionSchema
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", ""),
+        ("<p>a</p><p>b</p>", "ab"),
+        ("a < b <b>c</b>", "a < b c"),
+        ("a <>> b", "a  b"),
+        ("<p>&lt;b&gt;</p>", "&lt;b&gt;"),
+    ],
+)
+def test_remove_html_tags(value: str, expected: str) -> None:
+    assert remove_html_tags(value) == expected
+
+
+def test_resolution_content_is_lazy_and_not_serialized() -> None:
+    resolution = ResolutionSchema.model_validate(
+        {
+            "content": "<p>a &amp; b < c</p>",
+            "resolution_attachments": [],
+            "submitted_by": {"id": 1},
+            "submitted_on": {"display_value": "", "value": "1704067200000"},
+        },
+    )
+    assert "content" not in resolution.__dict__
+    assert resolution.content == "a &amp; b < c"
+    assert resolution.__dict__["content"] == "a &amp; b < c"
+
+    dumped = resolution.model_dump()
+    assert "content" not in dumped
+    assert dumped["raw_content"] == "<p>a &amp; b < c</p>"
+
+    by_alias = resolution.model_dump(by_alias=True)
+    assert by_alias["content"] == "<p>a &amp; b < c</p>"
+    assert ResolutionSchema.model_validate(by_alias) == resolution